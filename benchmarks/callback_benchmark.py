@@ -0,0 +1,59 @@
+"""
+File: callback_benchmark.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Per-generation dispatch overhead of CallbackList
+"""
+
+from __future__ import absolute_import
+
+from geneticpython.callbacks import Callback, CallbackList
+from geneticpython.callbacks.callback_list import HOOKS
+
+import timeit
+
+GENERATION_HOOKS = [hook for hook in HOOKS if hook not in
+                    ['on_running_begin', 'on_running_end', 'on_init_population_begin', 'on_init_population_end']]
+
+
+class GenerationEnd(Callback):
+    def on_generation_end(self, gen, logs=None):
+        pass
+
+
+def generation(callback_list):
+    logs = {}
+    for hook in GENERATION_HOOKS:
+        getattr(callback_list, hook)(0, logs=logs)
+
+
+class CallAll(CallbackList):
+    """former dispatch: every hook of every callback"""
+
+
+def _call_all(hook):
+    def dispatch(self, gen, logs=None):
+        logs = logs or {}
+        for callback in self.callbacks:
+            getattr(callback, hook)(gen, logs)
+    return dispatch
+
+
+for _hook in GENERATION_HOOKS:
+    setattr(CallAll, _hook, _call_all(_hook))
+
+
+def bench(n_callbacks, number=20000):
+    callbacks = [GenerationEnd() for _ in range(n_callbacks)]
+    callback_list = CallbackList(callbacks)
+    call_all = CallAll(callbacks)
+    before = min(timeit.repeat(lambda: generation(call_all), number=number, repeat=5)) / number
+    after = min(timeit.repeat(lambda: generation(callback_list), number=number, repeat=5)) / number
+    print(f"{n_callbacks:>3} callbacks   all hooks {before * 1e6:9.2f} us   overridden hooks {after * 1e6:9.2f} us"
+          f"   per generation")
+
+
+if __name__ == '__main__':
+    for n_callbacks in [0, 5, 50]:
+        bench(n_callbacks)
@@ -0,0 +1,29 @@
+"""
+File: clone_benchmark.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Compare Individual.clone with the former deepcopy based clone
+"""
+
+from __future__ import absolute_import
+
+from copy import deepcopy
+from geneticpython.models import FloatIndividual
+from geneticpython.models.tree import PruferCode
+
+import timeit
+
+
+def bench(name, indv, number):
+    indv.random_init(random_state=1)
+    indv._objective, indv._coefficient = 1.0, 1
+    before = min(timeit.repeat(lambda: deepcopy(indv), number=number, repeat=5)) / number
+    after = min(timeit.repeat(indv.clone, number=number, repeat=5)) / number
+    print(f"{name:<20} deepcopy {before * 1e6:12.1f} us   clone {after * 1e6:10.1f} us"
+          f"   x{before / after:.1f}")
+
+
+if __name__ == '__main__':
+    bench('FloatIndividual(30)', FloatIndividual(30, [0, 1]), 20000)
+    bench('PruferCode(1000)', PruferCode(1000), 5)
@@ -2,8 +2,7 @@ from geneticpython.tools.visualization import visualize_fronts, save_history_as_
 from geneticpython.models import FloatIndividual
 from geneticpython import Population, NSGAIIEngine
 from geneticpython import Callback
-from geneticpython.core.operators import TournamentSelection,\
-    SBXCrossover, \
+from geneticpython.core.operators import SBXCrossover, \
     PolynomialMutation
 import numpy as np
 import matplotlib.pyplot as plt
@@ -38,12 +37,11 @@ seed = 13
 pop_size = 100
 indv_temp = ZDT1Individual(30)
 population = Population(indv_temp, pop_size)
-selection = TournamentSelection(tournament_size=2)
 crossover = SBXCrossover(pc=0.9, distribution_index=5)
 mutation = PolynomialMutation(pm=1.0 / 30, distribution_index=0.20)
 
 
-engine = NSGAIIEngine(population, selection=selection,
+engine = NSGAIIEngine(population, tournament_size=2,
                       crossover=crossover,
                       mutation=mutation,
                       selection_size=100,
@@ -51,27 +49,17 @@ engine = NSGAIIEngine(population, selection=selection,
                       random_state=1)
 
 
-@engine.minimize_objective
-def objective1(indv):
-    solution = indv.chromosome
-    return solution[0]
+@engine.minimize_objective(batch=True)
+def objective1(genes):
+    # genes is a (pop_size, number_of_variables) matrix
+    return genes[:, 0]
 
 
-@engine.minimize_objective
-def objective2(indv):
-    solution = indv.chromosome
-    n = indv.number_of_variables
-
-    def eval_g(solution, n):
-        g = np.sum(solution) - solution[0]
-        constant = 9.0 / (n - 1)
-        return constant * g + 1.0
-
-    def eval_h(f: float, g: float) -> float:
-        return 1.0 - np.sqrt(f / g)
-
-    g = eval_g(solution, n)
-    h = eval_h(solution[0], g)
+@engine.minimize_objective(batch=True)
+def objective2(genes):
+    n = genes.shape[1]
+    g = 9.0 / (n - 1) * np.sum(genes[:, 1:], axis=1) + 1.0
+    h = 1.0 - np.sqrt(genes[:, 0] / g)
     return h * g
 
 
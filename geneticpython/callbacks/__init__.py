@@ -9,5 +9,10 @@ Description:
 from __future__ import absolute_import
 
 from .callback import *
+from .lazy_logs import *
+from .retention import *
 from .history import *
 from .callback_list import *
+from .checkpoint import *
+from .profiler import *
+from .operator_profiler import *
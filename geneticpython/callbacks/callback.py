@@ -53,6 +53,12 @@ class Callback(object):
     def on_reproduction_end(self, gen, logs=None):
         pass
 
+    def on_compute_objectives_begin(self, gen, logs=None):
+        pass
+
+    def on_compute_objectives_end(self, gen, logs=None):
+        pass
+
     def on_evaluation_begin(self, gen, logs=None):
         pass
 
@@ -11,15 +11,54 @@ from __future__ import absolute_import
 from typing import List
 
 from .callback import Callback
+from .checkpoint import CheckpointCallback
 from .history import History
 from .progbar_logger import ProgbarLogger
 
 
+HOOKS = ['on_running_begin', 'on_running_end',
+         'on_init_population_begin', 'on_init_population_end',
+         'on_generation_begin', 'on_generation_end',
+         'on_selection_begin', 'on_selection_end',
+         'on_reproduction_begin', 'on_reproduction_end',
+         'on_compute_objectives_begin', 'on_compute_objectives_end',
+         'on_evaluation_begin', 'on_evaluation_end',
+         'on_replacement_begin', 'on_replacement_end']
+
+
+def _overrides(callback, hook) -> bool:
+    if hook in getattr(callback, '__dict__', {}):
+        return True
+    method = getattr(type(callback), hook, None)
+    return method is not None and method is not getattr(Callback, hook)
+
+
 class CallbackList():
+    """
+        Dispatches the hooks of the engine to its callbacks.
+
+        For each hook, the bound methods of the callbacks that override it are
+        precomputed, hooks that no callback overrides return immediately.
+        Add and remove callbacks with append and remove, or call update_hooks
+        after modifying `callbacks` (or the hooks of a callback) directly.
+
+        Hooks are dispatched in the order of `callbacks`, except that
+        checkpoint callbacks come last, so a checkpoint is saved after
+        the history has recorded the generation.
+    """
+
     def __init__(self, callbacks: List[Callback] = None, add_history=False, add_progbar=False):
         self.callbacks = callbacks if callbacks else []
         self._add_default_callbacks(
             add_history, add_progbar)
+        self.update_hooks()
+
+    def update_hooks(self):
+        callbacks = [callback for callback in self.callbacks if not isinstance(callback, CheckpointCallback)] \
+            + [callback for callback in self.callbacks if isinstance(callback, CheckpointCallback)]
+        self._hooks = {hook: [getattr(callback, hook) for callback in callbacks
+                              if _overrides(callback, hook)]
+                       for hook in HOOKS}
 
     def _add_default_callbacks(self, add_history, add_progbar):
         self._history = None
@@ -40,6 +79,15 @@ class CallbackList():
 
     def append(self, callback):
         self.callbacks.append(callback)
+        self.update_hooks()
+
+    def remove(self, callback):
+        self.callbacks.remove(callback)
+        if callback is self._history:
+            self._history = None
+        if callback is self._progbar:
+            self._progbar = None
+        self.update_hooks()
 
     def set_params(self, params):
         self.params = params
@@ -53,85 +101,113 @@ class CallbackList():
             callback.set_engine(engine)
 
     def on_running_begin(self, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_running_begin(logs)
+        hooks = self._hooks['on_running_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(logs)
 
     def on_running_end(self, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_running_end(logs)
+        hooks = self._hooks['on_running_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(logs)
 
     def on_init_population_begin(self, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_init_population_begin(logs)
+        hooks = self._hooks['on_init_population_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(logs)
 
     def on_init_population_end(self, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_init_population_end(logs)
+        hooks = self._hooks['on_init_population_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(logs)
 
     def on_generation_begin(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_generation_begin(gen, logs)
+        hooks = self._hooks['on_generation_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_generation_end(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_generation_end(gen, logs)
+        hooks = self._hooks['on_generation_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_reproduction_begin(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_reproduction_begin(gen, logs)
+        hooks = self._hooks['on_reproduction_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_reproduction_end(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_reproduction_end(gen, logs)
+        hooks = self._hooks['on_reproduction_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
+
+    def on_compute_objectives_begin(self, gen, logs=None):
+        hooks = self._hooks['on_compute_objectives_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
+
+    def on_compute_objectives_end(self, gen, logs=None):
+        hooks = self._hooks['on_compute_objectives_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_evaluation_begin(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_evaluation_begin(gen, logs)
+        hooks = self._hooks['on_evaluation_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_evaluation_end(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_evaluation_end(gen, logs)
+        hooks = self._hooks['on_evaluation_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_selection_begin(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_selection_begin(gen, logs)
+        hooks = self._hooks['on_selection_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_selection_end(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_selection_end(gen, logs)
+        hooks = self._hooks['on_selection_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_replacement_begin(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_replacement_begin(gen, logs)
+        hooks = self._hooks['on_replacement_begin']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
 
     def on_replacement_end(self, gen, logs=None):
-        logs = logs or {}
-
-        for callback in self.callbacks:
-            callback.on_replacement_end(gen, logs)
+        hooks = self._hooks['on_replacement_end']
+        if hooks:
+            logs = logs or {}
+            for hook in hooks:
+                hook(gen, logs)
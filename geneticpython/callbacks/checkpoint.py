@@ -0,0 +1,42 @@
+"""
+File: checkpoint.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Save engine checkpoints periodically during a run
+"""
+
+from __future__ import absolute_import
+
+from .callback import Callback
+
+import time
+
+
+class CheckpointCallback(Callback):
+    """Callback that saves engine checkpoints with `engine.save_checkpoint`,
+    every `every_n_generations` generations and/or every `every_seconds` seconds.
+    A run is continued from the last checkpoint with `engine.resume(filepath)`.
+    Checkpoints are written to a temporary file and renamed,
+    so a crash while writing keeps the previous checkpoint.
+    """
+
+    def __init__(self, filepath, every_n_generations=None, every_seconds=None):
+        super(CheckpointCallback, self).__init__()
+        if every_n_generations is None and every_seconds is None:
+            every_n_generations = 1
+        self.filepath = filepath
+        self.every_n_generations = every_n_generations
+        self.every_seconds = every_seconds
+        self._last_time = None
+
+    def on_running_begin(self, logs=None):
+        self._last_time = time.monotonic()
+
+    def on_generation_end(self, gen, logs=None):
+        due = self.every_n_generations is not None and (gen + 1) % self.every_n_generations == 0
+        if self.every_seconds is not None:
+            due = due or time.monotonic() - self._last_time >= self.every_seconds
+        if due:
+            self.engine.save_checkpoint(self.filepath)
+            self._last_time = time.monotonic()
@@ -8,26 +8,62 @@ Description:
 
 from __future__ import absolute_import
 
+from array import array
+from collections.abc import Sequence
+
 import os
 
 from .callback import Callback
+from .retention import Retention
 import copy
 import json
+import mmap
+
+import numpy as np
+
+
+def _to_builtin(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class History(Callback):
     """Callback that records events into a `History` object.
     This callback is automatically applied to
     every Genetic engine. The `History` object
     gets returned by the `run` method of engine.
+
+    By default the logs of every generation are kept, a retention policy
+    (KeepLast, KeepEvery or ParetoDelta) bounds the memory they use,
+    `history` is then the list of the logs kept by the policy.
     """
 
-    def __init__(self):
+    def __init__(self, retention: Retention = None):
         super(History, self).__init__()
-        self.history = []
+        self.retention = retention
+        self.history = retention if retention is not None else []
+
+    def _record(self, generation, logs):
+        if self.retention is not None:
+            self.retention.append(generation, logs)
+        else:
+            self.history.append(copy.deepcopy(logs))
+
+    @property
+    def generations(self) -> list:
+        """
+            generation numbers of the logs in history, 0 is the initial population
+        """
+        if self.retention is not None:
+            return self.retention.generations
+        return list(range(len(self.history)))
 
     def on_init_population_end(self, logs=None):
         logs = logs or {}
-        self.history.append(copy.deepcopy(logs))
+        self._record(0, logs)
         # Set the history attribute on the model after the epoch ends. This will
         # make sure that the state which is set is the latest one.
         self.engine.history = self
@@ -37,13 +73,182 @@ class History(Callback):
 
     def on_generation_end(self, gen, logs=None):
         logs = logs or {}
-        self.history.append(copy.deepcopy(logs))
+        self._record(gen + 1, logs)
         # Set the history attribute on the model after the epoch ends. This will
         # make sure that the state which is set is the latest one.
         self.engine.history = self
 
+    def get_state(self):
+        """
+            the recorded logs, saved in engine checkpoints
+        """
+        if self.retention is not None:
+            return {'generations': self.retention.generations, 'logs': list(self.retention)}
+        return self.history
+
+    def set_state(self, state):
+        """
+            restore the logs saved by get_state of a History or of a StreamingHistory
+        """
+        generations = None
+        if isinstance(state, dict) and 'filepath' in state:
+            state = list(HistoryReader(state['filepath'], size=state['size']))
+        elif isinstance(state, dict):
+            generations, state = state['generations'], state['logs']
+        if self.retention is None:
+            self.history = list(state)
+            return
+        self.retention.clear()
+        for generation, logs in zip(generations or range(len(state)), state):
+            self.retention.append(generation, logs)
+
     def dump(self, filepath):
         with open(filepath, mode='w') as f:
-            history_json = json.dumps(self.history, indent=2)
+            history_json = json.dumps(list(self.history), indent=2, default=_to_builtin)
             f.write(history_json)
 
+
+class HistoryReader(Sequence):
+    """Read-only list of the logs written by a StreamingHistory.
+
+    The JSON Lines file is memory-mapped and only the byte offsets of the lines
+    are kept in memory, logs are decoded when accessed.
+    The file can be read while it is written, new lines are indexed on access.
+
+    params:
+    :filepath: JSON Lines file, one generation per line
+    :size: read only the first size bytes of the file
+    """
+
+    def __init__(self, filepath: str, size: int = None):
+        self.filepath = filepath
+        self.size = size
+        self._offsets = array('q', [0])
+        self._mmap = None
+
+    def _map(self):
+        size = os.path.getsize(self.filepath) if os.path.exists(self.filepath) else 0
+        if self.size is not None:
+            size = min(size, self.size)
+        if self._mmap is not None and len(self._mmap) == size:
+            return self._mmap
+        self.close()
+        if size == 0:
+            return None
+        with open(self.filepath, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        if self._offsets[-1] > size:
+            self._offsets = array('q', [0])
+        return self._mmap
+
+    def _index(self):
+        mm = self._map()
+        if mm is None:
+            self._offsets = array('q', [0])
+            return mm
+        end = mm.find(b'\n', self._offsets[-1])
+        while end != -1:
+            self._offsets.append(end + 1)
+            end = mm.find(b'\n', end + 1)
+        return mm
+
+    def __len__(self):
+        self._index()
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        mm = self._index()
+        n = len(self._offsets) - 1
+        if isinstance(index, slice):
+            return [self._load(mm, i) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('history index out of range')
+        return self._load(mm, index)
+
+    def _load(self, mm, index):
+        return json.loads(mm[self._offsets[index]:self._offsets[index + 1]])
+
+    def __iter__(self):
+        mm = self._index()
+        for index in range(len(self._offsets) - 1):
+            yield self._load(mm, index)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        return state
+
+
+class StreamingHistory(History):
+    """History that appends the logs of each generation to a JSON Lines file
+    as they are recorded instead of keeping them in memory,
+    memory use does not grow with the number of generations.
+
+    `history` is a HistoryReader of the file: a lazy, memory-mapped,
+    read-only list of the recorded logs.
+
+    params:
+    :filepath: JSON Lines file, truncated when the history is created,
+        unless resume is True, and when a checkpoint is loaded
+        to the generations saved in the checkpoint
+    :resume: append to an existing file
+    """
+
+    def __init__(self, filepath: str, resume: bool = False):
+        super(StreamingHistory, self).__init__()
+        self.filepath = filepath
+        self._file = None
+        if not resume:
+            open(filepath, mode='w').close()
+        self.history = HistoryReader(filepath)
+
+    def _record(self, generation, logs):
+        if self._file is None:
+            self._file = open(self.filepath, mode='a')
+        self._file.write(json.dumps(dict(logs), default=_to_builtin) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.history.close()
+
+    def on_running_end(self, logs=None):
+        self.close()
+
+    def get_state(self):
+        """
+            path and size of the file, saved in engine checkpoints
+        """
+        if self._file is not None:
+            self._file.flush()
+        size = os.path.getsize(self.filepath) if os.path.exists(self.filepath) else 0
+        return {'filepath': self.filepath, 'size': size}
+
+    def set_state(self, state):
+        """
+            truncate the file to the logs saved by get_state,
+            logs saved by a History (kept by its retention policy) are written to the file
+        """
+        self.close()
+        if isinstance(state, dict) and 'filepath' in state \
+                and os.path.abspath(state['filepath']) == os.path.abspath(self.filepath):
+            with open(self.filepath, mode='a') as f:
+                f.truncate(state['size'])
+        else:
+            if isinstance(state, dict) and 'filepath' in state:
+                state = HistoryReader(state['filepath'], size=state['size'])
+            elif isinstance(state, dict):
+                state = state['logs']
+            with open(self.filepath, mode='w') as f:
+                for logs in state:
+                    f.write(json.dumps(logs, default=_to_builtin) + '\n')
+        self.history = HistoryReader(self.filepath)
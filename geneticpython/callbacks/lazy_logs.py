@@ -0,0 +1,81 @@
+"""
+File: lazy_logs.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Logs mapping whose entries are computed on first access
+"""
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+import copy
+
+
+class _Lazy():
+    __slots__ = ('factory',)
+
+    def __init__(self, factory):
+        self.factory = factory
+
+
+class LazyLogs(MutableMapping):
+    """Logs passed to the callbacks, a mapping whose lazy entries
+    (see set_lazy) are computed when they are first read, so logs
+    that no callback reads cost nothing.
+
+    A lazy entry is computed from the state of the engine when it is read,
+    callbacks should read it in the hook that receives the logs.
+    Copies (copy.copy, copy.deepcopy) and to_dict compute all entries
+    and return a plain dict.
+    """
+
+    def __init__(self, data=None):
+        self._data = OrderedDict(data or {})
+
+    def set_lazy(self, key, factory):
+        """
+            set key to the value returned by factory(), computed on first access
+        """
+        self._data[key] = _Lazy(factory)
+
+    def is_computed(self, key) -> bool:
+        return key in self._data and not isinstance(self._data[key], _Lazy)
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if isinstance(value, _Lazy):
+            value = value.factory()
+            self._data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def to_dict(self) -> dict:
+        return dict((key, self[key]) for key in self._data)
+
+    def __copy__(self):
+        return self.to_dict()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def __reduce__(self):
+        return (dict, (list(self.to_dict().items()),))
+
+    def __repr__(self):
+        items = ', '.join(f"{key!r}: {'<lazy>' if isinstance(value, _Lazy) else repr(value)}"
+                          for key, value in self._data.items())
+        return f"LazyLogs({{{items}}})"
@@ -0,0 +1,176 @@
+"""
+File: operator_profiler.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Call counts and time of operators and individual methods
+"""
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from functools import wraps
+
+from .callback import Callback
+from .profiler import PHASES
+
+import json
+import time
+import tracemalloc
+
+
+class OperatorProfiler(Callback):
+    """Callback that counts and times the calls of the hot methods of a run:
+    clone, decode and encode of the individual class of the population,
+    Selection.select, Crossover.cross, Mutation.mutate and Replacement.replace
+    of the engine's operators.
+
+    Methods are wrapped on their classes while the engine runs and restored at the
+    end of the run, times are inclusive: the time of Crossover.cross contains the
+    clones and decodes it calls. Only calls made in the main process are counted.
+
+    With track_allocations, tracemalloc is started for the run and the bytes
+    allocated in each phase of a generation are recorded: `allocated` is the
+    peak of traced memory above its level at the beginning of the phase,
+    `retained` the memory still allocated at its end. Before Python 3.9 the
+    peak cannot be reset, `allocated` is then the same as `retained`.
+
+    After the run, the profiler is available as engine.operator_profiler,
+    see stats() and dump().
+    """
+
+    INDIVIDUAL_METHODS = ['clone', 'decode', 'encode']
+    OPERATOR_METHODS = [('selection', 'select'), ('crossover', 'cross'),
+                        ('mutation', 'mutate'), ('replacement', 'replace')]
+
+    def __init__(self, track_allocations: bool = False):
+        super(OperatorProfiler, self).__init__()
+        self.track_allocations = track_allocations
+        self.calls = OrderedDict()
+        self.allocations = OrderedDict()
+        self._patched = []
+        self._started = {}
+        self._stop_tracemalloc = False
+
+    def _wrap(self, key, fn):
+        stats = self.calls.setdefault(key, {'calls': 0, 'time': 0.0})
+
+        @wraps(fn)
+        def _timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats['time'] += time.perf_counter() - start
+                stats['calls'] += 1
+
+        return _timed
+
+    def _patch(self, cls, name):
+        fn = getattr(cls, name, None)
+        if fn is None or any(patched_cls is cls and patched_name == name
+                             for patched_cls, patched_name, _ in self._patched):
+            return
+        # keep the class attribute to restore, None if the method was inherited
+        original = cls.__dict__.get(name)
+        setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", fn))
+        self._patched.append((cls, name, original))
+
+    def _restore(self):
+        for cls, name, original in reversed(self._patched):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patched = []
+
+    def on_running_begin(self, logs=None):
+        # a run that raised did not reach on_running_end
+        self._restore()
+        individual_cls = self.engine.population.individual_temp.__class__
+        for name in self.INDIVIDUAL_METHODS:
+            self._patch(individual_cls, name)
+        for attribute, name in self.OPERATOR_METHODS:
+            operator = getattr(self.engine, attribute, None)
+            if operator is not None:
+                self._patch(operator.__class__, name)
+
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracemalloc = True
+        self.engine.operator_profiler = self
+
+    def on_running_end(self, logs=None):
+        self._restore()
+        if self._stop_tracemalloc:
+            tracemalloc.stop()
+            self._stop_tracemalloc = False
+
+    def _begin(self, phase):
+        if not self.track_allocations or not tracemalloc.is_tracing():
+            return
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        self._started[phase] = tracemalloc.get_traced_memory()[0]
+
+    def _end(self, phase):
+        start = self._started.pop(phase, None)
+        if start is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        if not hasattr(tracemalloc, 'reset_peak'):  # python < 3.9
+            peak = current
+        stats = self.allocations.setdefault(phase, {'calls': 0, 'allocated': 0, 'retained': 0})
+        stats['calls'] += 1
+        stats['allocated'] += peak - start
+        stats['retained'] += current - start
+
+    def on_selection_begin(self, gen, logs=None):
+        self._begin('selection')
+
+    def on_selection_end(self, gen, logs=None):
+        self._end('selection')
+
+    def on_reproduction_begin(self, gen, logs=None):
+        self._begin('reproduction')
+
+    def on_reproduction_end(self, gen, logs=None):
+        self._end('reproduction')
+
+    def on_compute_objectives_begin(self, gen, logs=None):
+        self._begin('objectives')
+
+    def on_compute_objectives_end(self, gen, logs=None):
+        self._end('objectives')
+
+    def on_evaluation_begin(self, gen, logs=None):
+        self._begin('evaluation')
+
+    def on_evaluation_end(self, gen, logs=None):
+        self._end('evaluation')
+
+    def on_replacement_begin(self, gen, logs=None):
+        self._begin('replacement')
+
+    def on_replacement_end(self, gen, logs=None):
+        self._end('replacement')
+
+    def stats(self) -> OrderedDict:
+        """
+            calls: {'Class.method': {'calls', 'time', 'time_per_call'}}, sorted by time,
+            allocations: {phase: {'calls', 'allocated', 'retained'}} in bytes
+        """
+        calls = OrderedDict()
+        for key, stats in sorted(self.calls.items(), key=lambda item: -item[1]['time']):
+            if stats['calls'] == 0:
+                continue
+            calls[key] = {'calls': stats['calls'],
+                          'time': stats['time'],
+                          'time_per_call': stats['time'] / stats['calls'] if stats['calls'] else 0.0}
+        allocations = OrderedDict((phase, dict(self.allocations[phase]))
+                                  for phase in PHASES if phase in self.allocations)
+        return OrderedDict([('calls', calls), ('allocations', allocations)])
+
+    def dump(self, filepath):
+        with open(filepath, mode='w') as f:
+            f.write(json.dumps(self.stats(), indent=2))
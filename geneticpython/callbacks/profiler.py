@@ -0,0 +1,168 @@
+"""
+File: profiler.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Wall and CPU time spent in each phase of a generation
+"""
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+from .callback import Callback
+
+import sys
+import time
+
+
+PHASES = ['selection', 'reproduction', 'objectives', 'evaluation', 'replacement']
+
+
+class ProfilerCallback(Callback):
+    """Callback that records the wall (time.perf_counter) and CPU (time.process_time)
+    time of each phase of every generation: selection, reproduction,
+    objectives (compute_objectives), evaluation (do_evaluation) and replacement.
+    A generation is timed from its beginning to the end of its last replacement,
+    the time not spent in these phases (callbacks between them) is reported as 'other'.
+    Phases that run several times in a generation, as in steady-state engines, are summed.
+
+    At the end of the last replacement of each generation it sets in engine.metrics
+    and in the logs, so the logs of the generation passed to on_generation_end
+    (and recorded by History) have them:
+        generation_time: wall time of the generation
+        evaluations_per_second: objective evaluations of the generation per second of generation
+        phase_share: fraction of the generation wall time spent in each phase
+
+    Per generation records are kept in `records`, and a summary table is written
+    to `file` (sys.stdout by default) at the end of the run if verbose.
+    """
+
+    def __init__(self, verbose: bool = True, file=None):
+        super(ProfilerCallback, self).__init__()
+        self.verbose = verbose
+        self.file = file
+        self.records = []
+        self._current = None
+        self._started = {}
+        self._generation_start = None
+        self._n_evaluations = 0
+        self._measured = None
+
+    def _begin(self, phase):
+        self._started[phase] = (time.perf_counter(), time.process_time())
+
+    def _end(self, phase):
+        started = self._started.pop(phase, None)
+        if started is None or self._current is None:
+            return
+        wall, cpu = started
+        record = self._current[phase]
+        record['wall'] += time.perf_counter() - wall
+        record['cpu'] += time.process_time() - cpu
+
+    def on_running_begin(self, logs=None):
+        self.records = []
+
+    def on_generation_begin(self, gen, logs=None):
+        self._current = OrderedDict((phase, {'wall': 0.0, 'cpu': 0.0}) for phase in PHASES + ['other'])
+        self._n_evaluations = self.engine.n_evaluations
+        self._generation_start = (time.perf_counter(), time.process_time())
+        self._measured = None
+
+    def _measure(self, logs):
+        """
+            time the generation so far, set the metrics in engine.metrics and in logs
+        """
+        wall = time.perf_counter() - self._generation_start[0]
+        cpu = time.process_time() - self._generation_start[1]
+        record = self._current
+        record['other']['wall'] = max(wall - sum(record[phase]['wall'] for phase in PHASES), 0.0)
+        record['other']['cpu'] = max(cpu - sum(record[phase]['cpu'] for phase in PHASES), 0.0)
+        n_evaluations = self.engine.n_evaluations - self._n_evaluations
+        self._measured = (wall, cpu, n_evaluations)
+
+        metrics = OrderedDict()
+        metrics['generation_time'] = wall
+        metrics['evaluations_per_second'] = n_evaluations / wall if wall > 0 else 0.0
+        metrics['phase_share'] = OrderedDict((phase, times['wall'] / wall if wall > 0 else 0.0)
+                                             for phase, times in record.items())
+        self.engine.metrics = self.engine.metrics or OrderedDict()
+        self.engine.metrics.update(metrics)
+        if logs is not None:
+            logs.update(metrics)
+
+    def on_generation_end(self, gen, logs=None):
+        if self._current is None:
+            return
+        if self._measured is None:
+            # a generation without replacement
+            self._measure(logs)
+        wall, cpu, n_evaluations = self._measured
+        self.records.append(OrderedDict([('generation', gen),
+                                         ('wall', wall),
+                                         ('cpu', cpu),
+                                         ('n_evaluations', n_evaluations),
+                                         ('phases', self._current)]))
+        self._current = None
+
+    def on_selection_begin(self, gen, logs=None):
+        self._begin('selection')
+
+    def on_selection_end(self, gen, logs=None):
+        self._end('selection')
+
+    def on_reproduction_begin(self, gen, logs=None):
+        self._begin('reproduction')
+
+    def on_reproduction_end(self, gen, logs=None):
+        self._end('reproduction')
+
+    def on_compute_objectives_begin(self, gen, logs=None):
+        self._begin('objectives')
+
+    def on_compute_objectives_end(self, gen, logs=None):
+        self._end('objectives')
+
+    def on_evaluation_begin(self, gen, logs=None):
+        self._begin('evaluation')
+
+    def on_evaluation_end(self, gen, logs=None):
+        self._end('evaluation')
+
+    def on_replacement_begin(self, gen, logs=None):
+        self._begin('replacement')
+
+    def on_replacement_end(self, gen, logs=None):
+        self._end('replacement')
+        # the logs passed to the hooks of a generation become the logs of its end
+        if self._current is not None:
+            self._measure(logs)
+
+    def totals(self) -> OrderedDict:
+        """
+            wall and CPU time of each phase summed over the recorded generations
+        """
+        totals = OrderedDict((phase, {'wall': 0.0, 'cpu': 0.0}) for phase in PHASES + ['other'])
+        for record in self.records:
+            for phase, times in record['phases'].items():
+                totals[phase]['wall'] += times['wall']
+                totals[phase]['cpu'] += times['cpu']
+        return totals
+
+    def summary(self) -> str:
+        totals = self.totals()
+        wall = sum(record['wall'] for record in self.records)
+        n_evaluations = sum(record['n_evaluations'] for record in self.records)
+        lines = [f"{'phase':<14}{'wall (s)':>12}{'cpu (s)':>12}{'share':>9}"]
+        for phase, times in totals.items():
+            share = times['wall'] / wall if wall > 0 else 0.0
+            lines.append(f"{phase:<14}{times['wall']:>12.4f}{times['cpu']:>12.4f}{share:>9.1%}")
+        lines.append(f"{'total':<14}{wall:>12.4f}{sum(t['cpu'] for t in totals.values()):>12.4f}{'':>9}")
+        rate = n_evaluations / wall if wall > 0 else 0.0
+        lines.append(f"{len(self.records)} generations, {n_evaluations} evaluations, {rate:.1f} evaluations/s")
+        return '\n'.join(lines)
+
+    def on_running_end(self, logs=None):
+        if self.verbose and self.records:
+            print(self.summary(), file=self.file or sys.stdout)
@@ -18,6 +18,7 @@ class ProgbarLogger(Callback):
     def __init__(self, metrics=None, default_metrics=True):
         self.metrics = metrics or {}
         self.default_metrics = default_metrics
+        self.progbar = None
 
     def on_init_population_begin(self, logs=None):
         print('Initializing...', flush=True)
@@ -25,15 +26,20 @@ class ProgbarLogger(Callback):
     def on_init_population_end(self, logs=None):
         print('Finished Initialization!')
         print('Beginning genetic process...', flush=True)
-        self.progbar = tqdm(range(self.engine.generations))
+        self.progbar = tqdm(total=self.engine.generations)
 
     def on_generation_end(self, gen, logs=None):
+        if self.progbar is None:
+            # resumed run, the population was not initialized
+            self.progbar = tqdm(total=self.engine.generations, initial=gen)
         self._update_metrics()
         self.progbar.set_postfix(self.metrics, refresh=True)
         self.progbar.update()
 
     def on_running_end(self, logs=None):
-        self.progbar.close()
+        if self.progbar is not None:
+            self.progbar.close()
+            self.progbar = None
         print('Done!')
 
     def _update_metrics(self):
@@ -0,0 +1,228 @@
+"""
+File: retention.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Retention policies bounding the logs kept by History
+"""
+
+from __future__ import absolute_import
+
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Sequence
+
+import copy
+
+
+class Retention(Sequence):
+    """Read-only list of the logs kept by a History, see History(retention=...).
+
+    A retention policy decides which generations are kept and how:
+    append(generation, logs) is called with the logs of each generation,
+    and the kept logs are read back as a list, in generation order.
+    `generations` are the generation numbers of the kept logs.
+    """
+
+    @abstractmethod
+    def append(self, generation: int, logs: dict):
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def generations(self) -> list:
+        raise NotImplementedError
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('history index out of range')
+        return self._get(index)
+
+    def _get(self, index):
+        for i, logs in enumerate(self):
+            if i == index:
+                return logs
+
+    def __eq__(self, other):
+        if isinstance(other, (list, Retention)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+class KeepLast(Retention):
+    """
+        keep the logs of the last k generations, in a ring buffer
+    """
+
+    def __init__(self, k: int):
+        if k <= 0:
+            raise ValueError('Invalid number of generations, requires k > 0')
+        self.k = k
+        self.clear()
+
+    def append(self, generation, logs):
+        self._entries.append((generation, copy.deepcopy(logs)))
+
+    def clear(self):
+        self._entries = deque(maxlen=self.k)
+
+    @property
+    def generations(self):
+        return [generation for generation, _ in self._entries]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, index):
+        return self._entries[index][1]
+
+    def __iter__(self):
+        return (logs for _, logs in self._entries)
+
+
+class KeepEvery(Retention):
+    """
+        keep the logs of every k-th generation, and of the last one.
+
+        With max_size, the number of kept generations stays under max_size:
+        when it is reached, k is doubled and the generations that are
+        not multiple of the new k are dropped, so the kept generations
+        thin out logarithmically with the length of the run.
+    """
+
+    def __init__(self, k: int = 1, max_size: int = None):
+        if k <= 0:
+            raise ValueError('Invalid step, requires k > 0')
+        if max_size is not None and max_size < 2:
+            raise ValueError('Invalid max_size, requires max_size >= 2')
+        self.k = k
+        self.max_size = max_size
+        self.clear()
+
+    def append(self, generation, logs):
+        if generation % self.step == 0:
+            latest = (generation, copy.deepcopy(logs))
+            self._entries.append(latest)
+            self._last = None
+            # the last generation is kept apart, max_size also counts it
+            while self.max_size is not None and len(self._entries) >= self.max_size:
+                self.step *= 2
+                self._entries = [entry for entry in self._entries if entry[0] % self.step == 0]
+            if not self._entries or self._entries[-1] is not latest:
+                self._last = latest
+        else:
+            self._last = (generation, copy.deepcopy(logs))
+
+    def clear(self):
+        self.step = self.k
+        self._entries = []
+        self._last = None
+
+    def _all(self):
+        return self._entries if self._last is None else self._entries + [self._last]
+
+    @property
+    def generations(self):
+        return [generation for generation, _ in self._all()]
+
+    def __len__(self):
+        return len(self._entries) + (self._last is not None)
+
+    def _get(self, index):
+        return self._all()[index][1]
+
+    def __iter__(self):
+        return (logs for _, logs in self._all())
+
+
+class ParetoDelta(Retention):
+    """
+        keep every generation, but store the pareto front of a generation
+        as the changes from the previous generation: the indices of the points kept
+        from the previous front and the new points, or nothing if the front did not change.
+        The full front is stored every keyframe_every generations,
+        reading a generation replays at most keyframe_every deltas.
+
+        The solutions of each generation are dropped unless keep_solutions.
+    """
+
+    def __init__(self, keyframe_every: int = 100, keep_solutions: bool = False):
+        if keyframe_every <= 0:
+            raise ValueError('Invalid keyframe_every, requires keyframe_every > 0')
+        self.keyframe_every = keyframe_every
+        self.keep_solutions = keep_solutions
+        self.clear()
+
+    def append(self, generation, logs):
+        front = logs.get('pareto_front')
+        # solutions are not read when dropped, lazy logs do not compute them
+        logs = copy.deepcopy({key: logs[key] for key in logs
+                              if key != 'pareto_front' and (self.keep_solutions or key != 'solutions')})
+
+        if front is None:
+            delta = None
+        else:
+            front = [tuple(point) for point in front]
+            if self._front is None or len(self._entries) % self.keyframe_every == 0:
+                delta = ('front', front)
+            elif front == self._front:
+                delta = ('same', None)
+            else:
+                index = {point: i for i, point in enumerate(self._front)}
+                delta = ('delta', [index.get(point, point) for point in front])
+        self._front = front
+        self._entries.append((generation, logs, delta))
+
+    def clear(self):
+        self._entries = []
+        self._front = None
+
+    @property
+    def generations(self):
+        return [entry[0] for entry in self._entries]
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _apply(front, delta):
+        kind, value = delta
+        if kind == 'front':
+            return value
+        if kind == 'same':
+            return front
+        return [front[item] if isinstance(item, int) else item for item in value]
+
+    @staticmethod
+    def _decode(logs, front):
+        logs = copy.deepcopy(logs)
+        if front is not None:
+            logs['pareto_front'] = [list(point) for point in front]
+        return logs
+
+    def _get(self, index):
+        start = index
+        while start > 0 and (self._entries[start][2] is None or self._entries[start][2][0] != 'front'):
+            start -= 1
+        front = None
+        for _, _, delta in self._entries[start:index + 1]:
+            front = self._apply(front, delta) if delta is not None else None
+        return self._decode(self._entries[index][1], front)
+
+    def __iter__(self):
+        front = None
+        for _, logs, delta in self._entries:
+            front = self._apply(front, delta) if delta is not None else None
+            yield self._decode(logs, front)
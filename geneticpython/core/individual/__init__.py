@@ -7,4 +7,5 @@ from __future__ import absolute_import
 
 from .solution import Solution
 from .individual import Individual
-from .chromosome import IntChromosome, FloatChromosome
+from .chromosome import IntChromosome, FloatChromosome, GeneSpace
+from .pool import IndividualPool
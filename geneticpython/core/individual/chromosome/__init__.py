@@ -5,6 +5,7 @@
 """
 from __future__ import absolute_import
 
+from .gene_space import GeneSpace
 from .chromosome import *
 from .int_chromosome import *
 from .float_chromosome import *
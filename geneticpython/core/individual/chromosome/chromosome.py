@@ -11,11 +11,33 @@ import numpy as np
 import random
 import copy
 
+from .gene_space import GeneSpace
+from ..pool import active_pool
+
 class Chromosome():
-    def __init__(self, length: int, domains: Union[List, Tuple], dtype: str = 'float32'):
-        self.lower_bound, self.upper_bound = Chromosome._formated_domains(length, domains)
+    """
+        Clones are copy-on-write: a clone shares the genes array of its origin,
+        which is then marked read-only, until one of them writes its genes through
+        __setitem__, writable_genes or init_genes and gets a private copy.
+        Code modifying genes in place must go through these methods,
+        chromosome.genes itself may be read-only.
+
+        The bounds of the genes are kept in a GeneSpace shared by all clones,
+        domains can be given as a GeneSpace to share it between templates.
+    """
+    __slots__ = ('gene_space', 'length', 'genes', 'modified')
+
+    def __init__(self, length: int, domains: Union[List, Tuple, GeneSpace], dtype: str = 'float32'):
+        if isinstance(domains, GeneSpace):
+            if domains.length != length:
+                raise ValueError('gene space and chromosome have different length')
+            self.gene_space = domains
+        else:
+            self.gene_space = GeneSpace(length, domains)
         self.length = length
         self.genes = np.empty(length, dtype=dtype)
+        # True when genes have changed since the objectives were last computed
+        self.modified = True
     
     def __str__(self):
         return str(self.genes)
@@ -37,7 +59,10 @@ class Chromosome():
         '''
         if key < 0 or key >= self.length:
             raise IndexError('Individual index({}) out of range'.format(key))
+        if not self.genes.flags.writeable:
+            self.genes = Chromosome._copy_genes(self.genes)
         self.genes[key] = value
+        self.modified = True
 
     def __len__(self):
         '''
@@ -45,28 +70,73 @@ class Chromosome():
         '''
         return len(self.genes)
 
+    @staticmethod
+    def _copy_genes(genes: np.ndarray) -> np.ndarray:
+        """
+            writable copy of genes, in a recycled array if an IndividualPool is active
+        """
+        pool = active_pool()
+        buffer = pool.take_buffer(genes.shape, genes.dtype) if pool is not None else None
+        if buffer is None:
+            return genes.copy()
+        np.copyto(buffer, genes)
+        return buffer
+
+    def clone(self, target: 'Chromosome' = None) -> 'Chromosome':
+        """
+            Copy-on-write copy of this chromosome,
+            the gene space is shared with the copy.
+
+            :target: a chromosome of the same class to overwrite instead of allocating one
+        """
+        if target is not None and target.__class__ is self.__class__:
+            chromosome = target
+        else:
+            chromosome = self.__class__.__new__(self.__class__)
+        chromosome.gene_space = self.gene_space
+        chromosome.length = self.length
+        genes = self.genes
+        if genes.flags.writeable and genes.base is not None:
+            # a view of a buffer owned by someone else (e.g. an array-backed population)
+            # can be overwritten behind our back, it is copied right away
+            chromosome.genes = Chromosome._copy_genes(genes)
+        else:
+            genes.flags.writeable = False
+            chromosome.genes = genes
+        chromosome.modified = self.modified
+        if hasattr(self, '__dict__'):
+            # attributes of subclasses without __slots__
+            chromosome.__dict__.update(copy.deepcopy(self.__dict__))
+        return chromosome
+
+    def writable_genes(self) -> np.ndarray:
+        """
+            genes array that can be modified in place,
+            copied first if it is shared with clones, the chromosome is marked as modified
+        """
+        if not self.genes.flags.writeable:
+            self.genes = Chromosome._copy_genes(self.genes)
+        self.modified = True
+        return self.genes
+
     def suffix(self, i):
         return self.genes[i:]
     
     def prefix(self, i):
         return self.genes[:i]
 
+    @property
+    def lower_bound(self) -> np.ndarray:
+        return self.gene_space.lower_bound
+
+    @property
+    def upper_bound(self) -> np.ndarray:
+        return self.gene_space.upper_bound
+
     @staticmethod
     def _formated_domains(length, domains):
-        if isinstance(domains,(list,tuple)) and len(domains) == 2 and \
-                all(isinstance(value, (float, int)) for value in domains):
-            return np.array([domains[0] for _ in range(length)]), np.array([domains[1] for _ in range(length)])
-        elif isinstance(domains, (list, tuple)) and len(domains) == length and\
-                all(isinstance(domain, (list, tuple)) for domain in domains) and\
-                all((len(domain) == 2) for domain in domains) and \
-                all(isinstance(value, (float, int)) for domain in domains for value in domain) and\
-                all((domain[0] < domain[1]) for domain in domains):
-            return np.array([domain[0] for domain in domains]), np.array([domain[1] for domain in domains])
-        else:
-            raise ValueError('There are two types of accepted domains\n\
-                (min_value, max_value): this domain will be applied for all variable\n\
-                [(min_value_1, max_value_1),... (min_value_length, max_value_length)]: \n\
-                each will be applied for a variable respectively')
+        gene_space = GeneSpace(length, domains)
+        return gene_space.lower_bound, gene_space.upper_bound
 
     @property
     def is_valid(self):
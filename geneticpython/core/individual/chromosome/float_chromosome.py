@@ -13,6 +13,8 @@ import numpy as np
 import random
 
 class FloatChromosome(Chromosome):
+    __slots__ = ()
+
     def __init__(self, length: int, domains: [list, tuple]):
         super(FloatChromosome, self).__init__(length, domains, 'float32')
  
@@ -21,6 +23,7 @@ class FloatChromosome(Chromosome):
         pass
 
     def init_genes(self, genes=None, random_state=None):
+        self.modified = True
         if genes is not None:
             if (isinstance(genes,(tuple,list)) and len(genes) == self.length):
                 self.genes = np.array(genes)
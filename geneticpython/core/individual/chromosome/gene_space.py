@@ -0,0 +1,96 @@
+"""
+File: gene_space.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Read-only gene domains shared by all chromosomes of a template
+"""
+
+from __future__ import absolute_import
+
+from typing import List, Union, Tuple
+
+import numpy as np
+
+
+class GeneSpace():
+    """
+        Lower and upper bounds of the genes of a chromosome.
+
+        A GeneSpace is immutable: its bounds are read-only arrays and copies
+        (copy, deepcopy, Chromosome.clone) return the same object, so all
+        chromosomes cloned from one template share a single GeneSpace.
+
+        params:
+        :length: number of genes
+        :domains: (min_value, max_value) applied to all genes,
+            or [(min_value_1, max_value_1), ..., (min_value_length, max_value_length)]
+    """
+    __slots__ = ('length', 'lower_bound', 'upper_bound')
+
+    def __init__(self, length: int, domains: Union[List, Tuple]):
+        self._set_bounds(*GeneSpace._bounds(length, domains))
+
+    def _set_bounds(self, lower_bound: np.ndarray, upper_bound: np.ndarray):
+        lower_bound.flags.writeable = False
+        upper_bound.flags.writeable = False
+        self.length = len(lower_bound)
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+
+    @classmethod
+    def _from_bounds(cls, lower_bound: np.ndarray, upper_bound: np.ndarray) -> 'GeneSpace':
+        gene_space = cls.__new__(cls)
+        gene_space._set_bounds(np.array(lower_bound), np.array(upper_bound))
+        return gene_space
+
+    @staticmethod
+    def _bounds(length, domains):
+        if isinstance(domains, (list, tuple)):
+            try:
+                array = np.asarray(domains)
+            except ValueError:
+                array = None
+            if array is not None and array.dtype.kind in 'iuf':
+                if array.shape == (2,):
+                    return np.full(length, array[0]), np.full(length, array[1])
+                if array.shape == (length, 2) and \
+                        all(isinstance(domain, (list, tuple)) for domain in domains) and \
+                        np.all(array[:, 0] < array[:, 1]):
+                    return array[:, 0].copy(), array[:, 1].copy()
+        raise ValueError('There are two types of accepted domains\n\
+            (min_value, max_value): this domain will be applied for all variable\n\
+            [(min_value_1, max_value_1),... (min_value_length, max_value_length)]: \n\
+            each will be applied for a variable respectively')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (GeneSpace._from_bounds, (self.lower_bound, self.upper_bound))
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return f"GeneSpace(length={self.length}, lower_bound={self.lower_bound}, upper_bound={self.upper_bound})"
+
+    @property
+    def width(self) -> np.ndarray:
+        return self.upper_bound - self.lower_bound
+
+    def clip(self, genes: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+            clip genes, or rows of a genes matrix, to the bounds
+        """
+        return np.clip(genes, self.lower_bound, self.upper_bound, out=out)
+
+    def contains(self, genes: np.ndarray) -> bool:
+        """
+            True if all genes, or rows of a genes matrix, are within the bounds
+        """
+        genes = np.asarray(genes)
+        return bool(np.all((genes >= self.lower_bound) & (genes <= self.upper_bound)))
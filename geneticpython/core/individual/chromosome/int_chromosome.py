@@ -7,12 +7,15 @@ from __future__ import absolute_import
 
 from .chromosome import Chromosome
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 
 import numpy as np
 
 import random
 
 class IntChromosome(Chromosome):
+    __slots__ = ()
+
     def __init__(self, length: int, domains: [list, tuple]):
         super(IntChromosome, self).__init__(length, domains, 'int32')
 
@@ -21,6 +24,7 @@ class IntChromosome(Chromosome):
         pass
 
     def init_genes(self, genes=None, random_state=None):
+        self.modified = True
         if genes is not None:
             if (isinstance(genes,(tuple,list)) and len(genes) == self.length):
                 self.genes = np.array(genes)
@@ -31,7 +35,7 @@ class IntChromosome(Chromosome):
         else:   
             random_state = check_random_state(random_state)
             self.genes = np.array([
-                    random_state.randint(int(self.lower_bound[i]), int(self.upper_bound[i]) + 1) for i in range(self.length)
+                    rng_integers(random_state, int(self.lower_bound[i]), int(self.upper_bound[i]) + 1) for i in range(self.length)
                 ])
         
 
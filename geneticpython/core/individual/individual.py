@@ -7,6 +7,7 @@ from __future__ import absolute_import
 
 from .solution import Solution
 from .chromosome import Chromosome, IntChromosome
+from .pool import active_pool
 from geneticpython.utils.validation import check_random_state
 
 from typing import List, Union, Callable, Tuple, NewType
@@ -16,6 +17,9 @@ import numpy as np
 import inspect
 
 
+_IMMUTABLE_TYPES = (int, float, complex, bool, str, bytes, type(None), np.number)
+
+
 class Individual:
     """
         Representation of an Individual.
@@ -24,7 +28,12 @@ class Individual:
         :gene_domains is range of each gene in chromosome,
         and gene_domains has the same length as chromosome,
         if not, gene_domains will extend the last gene domain to the rest. 
+
+        The fields common to all individuals are slots, attributes added by
+        subclasses or engines (nondominated_rank, ...) live in __dict__.
     """
+    __slots__ = ('chromosome', 'solution', '_objective', '_coefficient',
+                 '_objectives', '_coefficients', 'random_state', '__dict__')
 
     def __init__(self, chromosome: Chromosome, solution: Solution = None):
         """
@@ -57,13 +66,67 @@ class Individual:
     def clone(self):
         """
             Clone a new individual from current one.
+            The clone keeps the objectives and the modified flag of the current one,
+            so a clone of an evaluated individual does not need to be evaluated again
+            until its genes are changed.
+            The genes array, the solution, the objective fields and the random_state
+            (if any) are copied.
+            While an IndividualPool is active, a released individual is reused.
         """
-        indiv = deepcopy(self)
+        pool = active_pool()
+        indiv = pool.acquire(self.__class__) if pool is not None else None
+        if indiv is None:
+            indiv = self.__class__.__new__(self.__class__)
+            indiv.chromosome = self.chromosome.clone()
+        else:
+            indiv.chromosome = self.chromosome.clone(target=indiv.chromosome)
+            indiv.__dict__.clear()
+        indiv.solution = self._clone_solution()
+        indiv._copy_objectives(self)
+        indiv.random_state = deepcopy(self.random_state) if self.random_state is not None else None
+        if self.__dict__:
+            indiv.__dict__.update(self._clone_attributes())
         return indiv
 
+    def _clone_solution(self):
+        if self.solution is None:
+            return None
+        if hasattr(self.solution, 'clone'):
+            return self.solution.clone()
+        return deepcopy(self.solution)
+
+    def _clone_attributes(self) -> dict:
+        """
+            attributes in __dict__ given to a clone,
+            override it to share read-only data instead of copying it
+        """
+        return {name: value if isinstance(value, _IMMUTABLE_TYPES) else deepcopy(value)
+                for name, value in self.__dict__.items()}
+
+    def _copy_objectives(self, other: 'Individual'):
+        """
+            copy objective values of other to this individual
+        """
+        self._objective = other._objective
+        self._coefficient = other._coefficient
+        self._objectives = list(other._objectives) if other._objectives is not None else None
+        self._coefficients = other._coefficients
+
+    @property
+    def modified(self) -> bool:
+        """
+            True if genes have changed since the objectives were last computed
+        """
+        return self.chromosome.modified
+
+    @modified.setter
+    def modified(self, value: bool):
+        self.chromosome.modified = value
+
     def init(self, chromosome: Chromosome = None, solution: Solution = None, random_state=None):
         if chromosome != None:
             self.chromosome = chromosome
+            self.chromosome.modified = True
         elif solution != None:
             self.solution = solution
             self.chromosome = self.encode(solution)
@@ -0,0 +1,121 @@
+"""
+File: pool.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Free-list of discarded individuals and genes buffers
+"""
+
+from __future__ import absolute_import
+
+from contextlib import contextmanager
+
+import numpy as np
+import threading
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # python < 3.7
+    class ContextVar():
+        """
+            thread-local stand-in for contextvars.ContextVar
+        """
+
+        def __init__(self, name, default=None):
+            self.name = name
+            self._default = default
+            self._local = threading.local()
+
+        def get(self):
+            return getattr(self._local, 'value', self._default)
+
+        def set(self, value):
+            token = self.get()
+            self._local.value = value
+            return token
+
+        def reset(self, token):
+            self._local.value = token
+
+_active_pool = ContextVar('active_pool', default=None)
+
+
+def active_pool() -> 'IndividualPool':
+    """
+        the pool activated in the current context, or None
+    """
+    return _active_pool.get()
+
+
+class IndividualPool():
+    """
+        Free-list of individuals dropped from a population.
+
+        While a pool is active (see activate), Individual.clone reuses a released
+        individual of the same class, and its chromosome, instead of allocating
+        new ones, and copy-on-write copies of genes reuse the genes arrays of
+        released individuals. Released individuals must not be referenced anymore,
+        keep clones of the individuals you want to keep.
+
+        params:
+        :max_size: maximum number of individuals (and of genes arrays) kept
+    """
+
+    def __init__(self, max_size: int = None):
+        if max_size is not None and max_size <= 0:
+            raise ValueError('Invalid pool size, requires max_size > 0')
+        self.max_size = max_size
+        self.n_reused = 0
+        self._individuals = {}
+        self._buffers = {}
+
+    def __len__(self):
+        return sum(len(individuals) for individuals in self._individuals.values())
+
+    def _full(self, items) -> bool:
+        return self.max_size is not None and len(items) >= self.max_size
+
+    def release(self, individuals):
+        for indv in individuals:
+            free = self._individuals.setdefault(indv.__class__, [])
+            if self._full(free):
+                continue
+            free.append(indv)
+
+    def acquire(self, cls):
+        """
+            a released individual of class cls, or None,
+            its genes array is moved to the free genes arrays
+        """
+        free = self._individuals.get(cls)
+        if not free:
+            return None
+        indv = free.pop()
+        genes = indv.chromosome.genes
+        # only arrays owned by this chromosome alone, shared (read-only) arrays and views are left alone
+        if isinstance(genes, np.ndarray) and genes.flags.writeable and genes.base is None:
+            buffers = self._buffers.setdefault((genes.shape, genes.dtype), [])
+            if not self._full(buffers):
+                buffers.append(genes)
+        indv.chromosome.genes = None
+        self.n_reused += 1
+        return indv
+
+    def take_buffer(self, shape, dtype) -> np.ndarray:
+        """
+            a free genes array of the given shape and dtype, or None
+        """
+        buffers = self._buffers.get((shape, np.dtype(dtype)))
+        return buffers.pop() if buffers else None
+
+    def clear(self):
+        self._individuals.clear()
+        self._buffers.clear()
+
+    @contextmanager
+    def activate(self):
+        token = _active_pool.set(self)
+        try:
+            yield self
+        finally:
+            _active_pool.reset(token)
@@ -5,7 +5,6 @@ from geneticpython.core.individual import Individual
 from geneticpython.models import PermutationIndividual
 from geneticpython.utils.validation import check_random_state
 
-from copy import deepcopy
 from random import Random
 from typing import Callable
 
@@ -29,8 +28,8 @@ class OrderCrossover(Crossover):
             return father.clone(), mother.clone()
 
         # Chromsomes for two children.
-        chrom1 = deepcopy(father.chromosome)
-        chrom2 = deepcopy(mother.chromosome)
+        chrom1 = father.chromosome.clone()
+        chrom2 = mother.chromosome.clone()
         # print(chrom1)
         # print(chrom2)
         if father.chromosome.length != mother.chromosome.length:
@@ -11,7 +11,6 @@ from geneticpython.core.operators.crossover import Crossover
 from geneticpython.core.individual import Individual
 from geneticpython.utils.validation import check_random_state
 
-from copy import deepcopy
 from random import Random
 from typing import Callable
 
@@ -43,8 +42,8 @@ class PointCrossover(Crossover):
             return father.clone(), mother.clone()
 
         # Chromsomes for two children.
-        chrom1 = deepcopy(father.chromosome)
-        chrom2 = deepcopy(mother.chromosome)
+        chrom1 = father.chromosome.clone()
+        chrom2 = mother.chromosome.clone()
         if father.chromosome.length != mother.chromosome.length:
             raise ValueError("Father and mother have different length")
 
@@ -11,6 +11,7 @@ from __future__ import absolute_import
 from geneticpython.core.operators.crossover import Crossover
 from geneticpython.core.individual import Individual
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 from geneticpython.utils import rset
 from geneticpython.models.tree import Tree, RootedTree
 
@@ -61,7 +62,7 @@ class PrimCrossover(Crossover):
             if trees[i].root is not None:
                 root = trees[i].root
             else:
-                random_state.randint(0, trees[i].number_of_vertices)
+                rng_integers(random_state, 0, trees[i].number_of_vertices)
 
             trees[i].parent[root] = root
             # Set of connected nodes
@@ -9,7 +9,6 @@ from .crossover import Crossover
 from geneticpython.models.float_individual import FloatIndividual
 from geneticpython.utils.validation import check_random_state
 
-from copy import deepcopy
 from random import Random
 import random
 import numpy as np
@@ -48,11 +47,12 @@ class SBXCrossover(Crossover):
             return father.clone(), mother.clone()
 
         length = father.chromosome.length
-        xl, xu = father.chromosome.lower_bound, father.chromosome.upper_bound
+        gene_space = father.chromosome.gene_space
+        xl, xu = gene_space.lower_bound, gene_space.upper_bound
 
         # Chromsomes for two children.
-        y1 = deepcopy(father.chromosome.genes)
-        y2 = deepcopy(mother.chromosome.genes)
+        y1 = np.copy(father.chromosome.genes)
+        y2 = np.copy(mother.chromosome.genes)
         
         cross_element = np.full(length, True)
         cross_element[random_state.random(length) > self.pc] = False
@@ -100,11 +100,12 @@ class SBXCrossover(Crossover):
         genes2[cross_element] = c2[cross_element]
 
         # repair boundary
-        genes1[genes1 < xl] = xl[genes1 < xl]
-        genes1[genes1 > xu] = xu[genes1 > xu]
+        gene_space.clip(genes1, out=genes1)
+        gene_space.clip(genes2, out=genes2)
 
-        genes2[genes2 < xl] = xl[genes2 < xl]
-        genes2[genes2 > xu] = xu[genes2 > xu]
+        if not cross_element.any():
+            # no gene crossed, the children are unmodified clones of the parents
+            return father.clone(), mother.clone()
 
         offspring1, offspring2 = father.clone(), mother.clone()
 
@@ -9,7 +9,6 @@ from .crossover import Crossover
 from geneticpython.models.int_individual import IntIndividual
 from geneticpython.utils.validation import check_random_state
 
-from copy import deepcopy
 from random import Random
 import random
 
@@ -33,15 +32,17 @@ class UniformCrossover(Crossover):
         if not do_cross:
             return father.clone(), mother.clone()
 
+        # one draw per gene, in a single call
+        exchange = random_state.random(father.chromosome.length) <= self.pe
+        if not exchange.any():
+            # no gene exchanged, the children are unmodified clones of the parents
+            return father.clone(), mother.clone()
+
         # Chromsomes for two children.
-        chrom1 = deepcopy(father.chromosome)
-        chrom2 = deepcopy(mother.chromosome)
-
-        for i in range(father.chromosome.length):
-            g1, g2 = chrom1[i], chrom2[i]
-            do_exchange = True if random_state.random() <= self.pe else False
-            if do_exchange:
-                chrom1[i], chrom2[i] = g2, g1
+        chrom1 = father.chromosome.clone()
+        chrom2 = mother.chromosome.clone()
+        genes1, genes2 = chrom1.writable_genes(), chrom2.writable_genes()
+        genes1[exchange], genes2[exchange] = genes2[exchange], genes1[exchange]
 
         child1, child2 = father.clone(), father.clone()
         child1.init(chromosome=chrom1)
@@ -30,9 +30,11 @@ class FlipBitMutation(Mutation):
         ret_individual = individual.clone()
 
         if do_mutation:
-            for i, genome in enumerate(ret_individual.chromosome.genes):
-                flip = True if random_state.random() <= self.pe else False
-                if flip:
-                    ret_individual.chromosome.genes[i] = genome^1
+            # one draw per bit, in a single call
+            chromosome = ret_individual.chromosome
+            flips = random_state.random(chromosome.length) <= self.pe
+            if flips.any():
+                chromosome.genes = chromosome.genes ^ flips.astype(chromosome.genes.dtype)
+                chromosome.modified = True
 
         return ret_individual
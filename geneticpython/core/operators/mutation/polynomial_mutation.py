@@ -26,13 +26,16 @@ class PolynomialMutation(Mutation):
         random_state = check_random_state(random_state)
         ret_indv = indv.clone()
 
-        genes = np.copy(ret_indv.chromosome.genes)
         length = ret_indv.chromosome.length
 
-        xl, xu = ret_indv.chromosome.lower_bound, ret_indv.chromosome.upper_bound
+        gene_space = ret_indv.chromosome.gene_space
+        xl, xu = gene_space.lower_bound, gene_space.upper_bound
         
         do_mutation = random_state.random(length) < self.pm
-        genes = genes[do_mutation]
+        if not do_mutation.any():
+            # the clone keeps its genes and objectives, it is not evaluated again
+            return ret_indv
+        genes = ret_indv.chromosome.genes[do_mutation]
         xl = xl[do_mutation]
         xu = xu[do_mutation]
 
@@ -61,14 +64,11 @@ class PolynomialMutation(Mutation):
         mutated_genes = genes + deltaq * (xu - xl)
 
         # fix out of boudary error
-        mutated_genes[mutated_genes < xl] = xl[mutated_genes < xl]
-        mutated_genes[mutated_genes > xu] = xu[mutated_genes > xu]
+        np.clip(mutated_genes, xl, xu, out=mutated_genes)
 
-        ret_genes = ret_indv.chromosome.genes
+        ret_genes = ret_indv.chromosome.writable_genes()
         ret_genes[do_mutation] = mutated_genes
 
-        ret_indv.update_genes(ret_genes)
-
         return ret_indv
 
 if __name__ == '__main__':
@@ -10,6 +10,7 @@ from __future__ import absolute_import
 from geneticpython.core import Individual
 from geneticpython.models.tree import Tree, RootedTree
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 from .mutation import Mutation
 
 from typing import List, Tuple
@@ -70,14 +71,14 @@ class TreeMutation(Mutation):
                 unused_edges.append((u, v))
 
         # choose new edge
-        idx = random_state.randint(0, len(unused_edges))
+        idx = rng_integers(random_state, 0, len(unused_edges))
         new_edge = unused_edges[idx]
 
         # find cycle path after create new edge
         path = tree.find_path(source=new_edge[0], destination=new_edge[1])
 
         # choose random edge on cycle to remove (break cycle)
-        idx = random_state.randint(0, len(path)-1)
+        idx = rng_integers(random_state, 0, len(path)-1)
         removed_edge = (path[idx], path[idx+1])
 
         if removed_edge in edges:
@@ -8,6 +8,7 @@ from __future__ import absolute_import
 from .selection import Selection
 from ...individual import Individual
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 
 from typing import List, Union
 from bisect import bisect_right
@@ -39,7 +40,7 @@ class RouletteWheelSelection(Selection):
                 idx -= 1
 
             if idx == -len(selected):
-                idx = random_state.randint(0, len(selected))
+                idx = rng_integers(random_state, 0, len(selected))
 
             selected_indvs.append(population[idx])
             selected[idx] = False
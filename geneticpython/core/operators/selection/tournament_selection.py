@@ -8,6 +8,7 @@ from __future__ import absolute_import
 from .selection import Selection
 from ...individual import Individual
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 
 from typing import List, Union, Callable
 from bisect import bisect_right
@@ -62,12 +63,12 @@ class TournamentSelection(Selection):
             competitors.sort(key=cmp_to_key(comparator))
 
             for i in range(len(competitors)):
-                if random_state.uniform(0, 1) <= self.p:
+                if random_state.random() <= self.p:
                     chosen = competitors[i]
                     break
 
             if not chosen:
-                chosen = competitors[random_state.randint(0, len(competitors)-1)]
+                chosen = competitors[rng_integers(random_state, 0, len(competitors)-1)]
 
             selected_indvs.append(chosen)
 
@@ -4,9 +4,18 @@ from random import Random
 
 from .individual import Individual
 
+import numpy as np
+
+
 class Pareto():
-    def __init__(self, population: List[Individual] = None):
+    def __init__(self, population: List[Individual] = None, objectives: np.ndarray = None):
+        """
+            :objectives: optional (N, M) matrix of the objective values of population,
+                usually sliced from an array-backed population,
+                returned by all_objectives without building a list
+        """
         self.individuals = population or []
+        self.objectives = objectives
 
     def __str__(self):
         ret = '[\n'
@@ -37,16 +46,23 @@ class Pareto():
         return len(self.individuals)
 
     def clear(self):
+        self.objectives = None
         self.individuals.clear()
 
     def all_objective(self):
+        if self.objectives is not None:
+            return self.objectives[:, 0]
         return [indv._objective for indv in self.individuals]
 
     def all_objectives(self):
+        if self.objectives is not None:
+            return self.objectives
         return [indv._objectives for indv in self.individuals]
 
     def extend(self, others: List[Individual]):
+        self.objectives = None
         self.individuals.extend(others)
 
     def append(self, another: Individual):
+        self.objectives = None
         self.individuals.append(another)
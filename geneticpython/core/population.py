@@ -10,20 +10,116 @@ from typing import List, Union, Callable, Tuple, NewType
 from tqdm.auto import tqdm
 from random import Random
 
-from .individual import Individual
+from .individual import Individual, IndividualPool
 from geneticpython.utils.validation import check_random_state
 
+import numpy as np
 import random
 
 
 class Population():
-
-    def __init__(self, individual_temp: Individual, size: int, init_population: Callable[[], List[Individual]] = None):
+    """
+        params:
+        :array_backed: if True, the genes of all individuals are kept in one contiguous
+            (N, L) matrix, each individual's chromosome.genes is a row view of it,
+            and their objective values in an (N, M) matrix.
+            The matrices are packed when individuals is assigned,
+            in-place changes of the genes of a member write into the matrix.
+        :recycle: if True, individuals dropped from the population are kept in an
+            IndividualPool (self.pool) and reused for new offspring by the engine,
+            do not keep references to dropped individuals, clone them instead.
+    """
+
+    def __init__(self, individual_temp: Individual, size: int,
+                 init_population: Callable[[], List[Individual]] = None,
+                 array_backed: bool = False,
+                 recycle: bool = False):
         self.individual_temp = individual_temp
         self.size = size
         self.init_population = init_population or self.init_population_randomly
+        self.array_backed = array_backed
+        # two genes buffers used in turn: the members of the previous generation
+        # still view one of them while the new generation is packed into the other
+        self._buffers = [None, None]
+        self._owners = [[], []]
+        self._current = 0
+        self._objectives = None
+        self.pool = IndividualPool(max_size=2 * size) if recycle else None
         self.individuals = []
 
+    @property
+    def individuals(self) -> List[Individual]:
+        return self._individuals
+
+    @individuals.setter
+    def individuals(self, individuals: List[Individual]):
+        self._individuals = individuals
+        if self.array_backed:
+            self._pack()
+
+    def _pack(self):
+        individuals = self._individuals
+        n = len(individuals)
+        if n == 0:
+            self._objectives = None
+            return
+
+        first = individuals[0].chromosome.genes
+        if any(indv.chromosome.genes.shape != first.shape for indv in individuals):
+            raise ValueError('array-backed population requires genes of the same length')
+
+        target = 1 - self._current
+        buffer = self._buffers[target]
+        if buffer is None or buffer.shape[0] < n or buffer.shape[1:] != first.shape \
+                or buffer.dtype != first.dtype:
+            buffer = np.empty((max(n, self.size),) + first.shape, dtype=first.dtype)
+            self._buffers[target] = buffer
+        else:
+            # individuals still viewing the buffer get their own copy before it is overwritten
+            for indv in self._owners[target]:
+                if indv.chromosome.genes.base is buffer:
+                    indv.chromosome.genes = indv.chromosome.genes.copy()
+
+        np.stack([indv.chromosome.genes for indv in individuals], out=buffer[:n])
+        for i, indv in enumerate(individuals):
+            indv.chromosome.genes = buffer[i]
+        self._owners[target] = list(individuals)
+        self._current = target
+
+        values = [indv._objectives if indv._objectives is not None else
+                  [indv._objective] if indv._objective is not None else None
+                  for indv in individuals]
+        n_objectives = next((len(value) for value in values if value is not None), 1)
+        if self._objectives is None or self._objectives.shape[0] < n \
+                or self._objectives.shape[1] != n_objectives:
+            self._objectives = np.empty((max(n, self.size), n_objectives))
+        for i, value in enumerate(values):
+            self._objectives[i] = value if value is not None else np.nan
+
+    @property
+    def genes(self) -> np.ndarray:
+        """
+            genes of the individuals, one row per individual,
+            a view of the genes matrix in array-backed mode
+        """
+        if self.array_backed:
+            if self._objectives is None:
+                return np.empty((0,) + self.individual_temp.chromosome.genes.shape)
+            return self._buffers[self._current][:len(self._individuals)]
+        return np.stack([indv.chromosome.genes for indv in self._individuals])
+
+    @property
+    def objectives(self) -> np.ndarray:
+        """
+            objective values (as minimized by the engine) of the individuals, one row per individual,
+            a view of the objectives matrix in array-backed mode
+        """
+        if self.array_backed:
+            if self._objectives is None:
+                return np.empty((0, 1))
+            return self._objectives[:len(self._individuals)]
+        return np.array(self.all_objectives(), dtype=float).reshape(len(self._individuals), -1)
+
     def __str__(self):
         ret = '[\n'
         for indiv in self.individuals:
@@ -56,34 +152,64 @@ class Population():
         self.init_population = callback
 
     def init_population_randomly(self, random_state=None) -> List[Individual]:
-        random_state = check_random_state(random_state)
+        """
+            :param random_state: a seed, a RandomState or Generator shared by all individuals,
+                or a list of streams with one stream per individual slot
+                (see RNGManager.slot_streams)
+        """
+        if isinstance(random_state, (list, tuple)):
+            if len(random_state) != self.size:
+                raise ValueError(f"Expected {self.size} random streams, got {len(random_state)}")
+            streams = [check_random_state(stream) for stream in random_state]
+        else:
+            streams = [check_random_state(random_state)] * self.size
         ret = []
-        for _ in range(self.size):
+        for stream in streams:
             new_indiv = self.individual_temp.clone()
-            new_indiv.random_init(random_state=random_state)
+            new_indiv.random_init(random_state=stream)
             ret.append(new_indiv)
         return ret
 
     def clear(self):
-        self.individuals.clear()
+        self.individuals = []
 
     def all_objective(self):
+        if self.array_backed:
+            return self.objectives[:, 0]
         return [indv._objective for indv in self.individuals]
 
     def all_objectives(self):
+        if self.array_backed:
+            return self.objectives
         return [indv._objectives for indv in self.individuals]
 
     def extend(self, others: List[Individual]):
         if len(self.individuals) + len(others) > self.size:
             raise ValueError(
                 f"Population size is {self.size}. Out of the limit")
-        self.individuals.extend(others)
+        self.individuals = self.individuals + list(others)
 
     def append(self, another: Individual):
         if len(self.individuals) + 1 > self.size:
             raise ValueError(
                 f"Population size is {self.size}. Out of the limit")
-        self.individuals.append(another)
+        self.individuals = self.individuals + [another]
+
+    def release(self, individuals: List[Individual]):
+        """
+            put the individuals that are not members of the population in the pool,
+            does nothing if the population does not recycle individuals
+        """
+        if self.pool is None:
+            return
+        members = set(id(indv) for indv in self.individuals)
+        released = set()
+        dropped = []
+        for indv in individuals:
+            if id(indv) not in members and id(indv) not in released:
+                released.add(id(indv))
+                dropped.append(indv)
+        self.pool.release(dropped)
 
     def register_initialization(self, fn):
         @wraps(fn)
@@ -5,7 +5,9 @@
 """
 from __future__ import absolute_import
 
+from .evaluators import *
 from .geneticengine import GeneticEngine
 from .multi_objective import *
 from .single_objective import *
+from .island_engine import IslandEngine
 
@@ -0,0 +1,17 @@
+"""
+File: __init__.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: 
+"""
+
+from __future__ import absolute_import
+
+from .evaluator import Evaluator, SerialEvaluator
+from .process_pool_evaluator import ProcessPoolEvaluator
+from .shared_memory_evaluator import SharedMemoryEvaluator
+from .thread_pool_evaluator import ThreadPoolEvaluator
+from .async_evaluator import AsyncEvaluator
+from .fitness_cache import FitnessCache
+from .validation import check_evaluator
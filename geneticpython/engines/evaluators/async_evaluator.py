@@ -0,0 +1,83 @@
+"""
+File: async_evaluator.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Evaluate async objectives concurrently under an asyncio event loop
+"""
+
+from __future__ import absolute_import
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .evaluator import Evaluator
+
+import asyncio
+import inspect
+
+
+class AsyncEvaluator(Evaluator):
+    """
+        Evaluate a whole batch of individuals concurrently under an asyncio
+        event loop. It is meant for I/O-bound objectives registered as
+        `async def` functions (simulator processes, socket services, ...),
+        synchronous objectives are called directly in the loop.
+
+        The event loop is created once and reused across generations.
+
+        params:
+        :max_concurrency: maximum number of objective calls awaiting at the same time,
+            None means no limit
+    """
+
+    def __init__(self, max_concurrency: int = None):
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError('Invalid max_concurrency, requires max_concurrency > 0')
+        self.max_concurrency = max_concurrency
+        self._loop = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_loop'] = None
+        return state
+
+    async def _evaluate_individual(self, objectives, indv, semaphore):
+        values = []
+        for objective in objectives:
+            if not inspect.iscoroutinefunction(objective):
+                values.append(objective(indv))
+            elif semaphore is None:
+                values.append(await objective(indv))
+            else:
+                async with semaphore:
+                    values.append(await objective(indv))
+        return values
+
+    async def _evaluate(self, objectives, population):
+        # the semaphore is created inside the running loop
+        semaphore = asyncio.Semaphore(self.max_concurrency) \
+            if self.max_concurrency is not None else None
+        return await asyncio.gather(*[self._evaluate_individual(objectives, indv, semaphore)
+                                      for indv in population])
+
+    def _run(self, coroutine):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    def evaluate(self, objectives, population):
+        if len(population) == 0:
+            return []
+        # asyncio.get_running_loop needs python 3.7
+        if asyncio._get_running_loop() is None:
+            return list(self._run(self._evaluate(objectives, population)))
+
+        # an event loop is already running in this thread (e.g. jupyter),
+        # run our own loop in a helper thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return list(executor.submit(self._run, self._evaluate(objectives, population)).result())
+
+    def close(self):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
@@ -0,0 +1,50 @@
+"""
+File: evaluator.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Base evaluator and the default serial evaluator
+"""
+
+from __future__ import absolute_import
+
+from abc import ABC, abstractmethod
+from typing import List, Callable, Union
+
+from geneticpython.core.individual import Individual
+
+
+class Evaluator(ABC):
+    """
+        An evaluator computes the registered objective functions on a list
+        of individuals. It does not modify the individuals, the engine writes
+        the returned values back to them.
+    """
+
+    @abstractmethod
+    def evaluate(self, objectives: List[Callable[[Individual], Union[float, int]]],
+                 population: List[Individual]) -> List[List[float]]:
+        """
+            :param objectives: objective functions
+            :param population: individuals to evaluate
+
+            :return: objective values of each individual,
+                in the same order as population and objectives
+            :rtype: List[List[float]]
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+            release resources held by the evaluator (worker pools, ...)
+        """
+        pass
+
+
+class SerialEvaluator(Evaluator):
+    """
+        Evaluate individuals one by one in the current process
+    """
+
+    def evaluate(self, objectives, population):
+        return [[objective(indv) for objective in objectives] for indv in population]
@@ -0,0 +1,72 @@
+"""
+File: fitness_cache.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: LRU cache of objective values keyed by genotype
+"""
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from typing import List
+
+from geneticpython.core.individual import Individual
+
+import hashlib
+
+
+class FitnessCache():
+    """
+        Least recently used cache of objective values.
+        Individuals are identified by a hash of their genes bytes (and dtype),
+        so clones produced by crossover/mutation that did not fire hit the cache.
+
+        params:
+        :max_size: maximum number of cached genotypes, None means unbounded
+    """
+
+    def __init__(self, max_size: int = None):
+        if max_size is not None and max_size <= 0:
+            raise ValueError('Invalid cache size, requires max_size > 0')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @staticmethod
+    def key(indv: Individual) -> bytes:
+        genes = indv.chromosome.genes
+        h = hashlib.blake2b(genes.dtype.str.encode(), digest_size=16)
+        h.update(genes.tobytes())
+        return h.digest()
+
+    def get(self, key: bytes) -> List[float]:
+        """
+            return cached objective values of key or None,
+            and update hit/miss counters
+        """
+        values = self._data.get(key)
+        if values is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return values
+
+    def put(self, key: bytes, values: List[float]):
+        self._data[key] = values
+        self._data.move_to_end(key)
+        if self.max_size is not None and len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
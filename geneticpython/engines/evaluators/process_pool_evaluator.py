@@ -0,0 +1,118 @@
+"""
+File: process_pool_evaluator.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Evaluate objectives on a persistent pool of worker processes
+"""
+
+from __future__ import absolute_import
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Callable
+
+from .evaluator import Evaluator
+
+import multiprocessing
+import math
+import os
+
+
+# objective functions of the current worker process, set by the pool initializer
+_worker_objectives = None
+
+
+def _init_worker(objectives):
+    global _worker_objectives
+    _worker_objectives = objectives
+
+
+def _evaluate_individual(indv):
+    return [objective(indv) for objective in _worker_objectives]
+
+
+def effective_n_jobs(n_jobs: int = None) -> int:
+    """
+        Turn n_jobs into a positive number of workers,
+        None means 1 and negative values count back from the number of cpus
+        (-1 uses all cpus)
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError('n_jobs == 0 has no meaning')
+    if n_jobs < 0:
+        return max(os.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+class ProcessPoolEvaluator(Evaluator):
+    """
+        Farm out objective evaluation to a pool of worker processes.
+        The pool is created on the first call of evaluate and is reused across
+        generations and runs, it is only restarted when the registered
+        objectives change.
+
+        The objective functions are handed to the workers once, when the pool
+        starts. With the 'fork' start method (the Linux default before 3.14) they
+        do not need to be picklable, so objectives registered with
+        engine.minimize_objective/maximize_objective work as they are.
+        With 'spawn' (macOS, Windows) or 'forkserver' (Linux from 3.14)
+        they must be picklable, e.g. module-level functions.
+        Individuals are pickled to the workers and only the objective values
+        come back.
+
+        params:
+        :n_jobs: number of worker processes, -1 uses all cpus
+        :chunksize: number of individuals sent to a worker at once,
+            by default the population is split in about 4 chunks per worker
+        :mp_context: multiprocessing context or start method name,
+            by default the default context of the platform
+    """
+
+    def __init__(self, n_jobs: int = -1, chunksize: int = None, mp_context=None):
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.chunksize = chunksize
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+        self._executor = None
+        self._objectives = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_objectives'] = None
+        return state
+
+    def _create_executor(self, objectives, population):
+        return ProcessPoolExecutor(max_workers=self.n_jobs,
+                                   mp_context=self.mp_context,
+                                   initializer=_init_worker,
+                                   initargs=(objectives,))
+
+    def _get_executor(self, objectives, population):
+        objectives = tuple(objectives)
+        if self._executor is None or self._objectives != objectives:
+            self.close()
+            self._executor = self._create_executor(objectives, population)
+            self._objectives = objectives
+        return self._executor
+
+    def _get_chunksize(self, size):
+        if self.chunksize is not None:
+            return self.chunksize
+        return max(int(math.ceil(size / (self.n_jobs * 4))), 1)
+
+    def evaluate(self, objectives, population):
+        if len(population) == 0:
+            return []
+        executor = self._get_executor(objectives, population)
+        return list(executor.map(_evaluate_individual, population,
+                                 chunksize=self._get_chunksize(len(population))))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._objectives = None
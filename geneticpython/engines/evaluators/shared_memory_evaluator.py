@@ -0,0 +1,166 @@
+"""
+File: shared_memory_evaluator.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Process-pool evaluation with the population genes in shared memory
+"""
+
+from __future__ import absolute_import
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from .process_pool_evaluator import ProcessPoolEvaluator
+
+import numpy as np
+import weakref
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+
+# state of the current worker process, set by the pool initializer
+_worker_objectives = None
+_worker_template = None
+_worker_blocks = {}
+
+
+def _init_worker(objectives, template):
+    global _worker_objectives, _worker_template
+    _worker_objectives = objectives
+    _worker_template = template
+
+
+def _attach(name):
+    block = _worker_blocks.get(name)
+    if block is None:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks[name] = block
+    return block
+
+
+def _release_blocks(names):
+    # blocks that the parent has replaced are closed in the worker
+    for name in list(_worker_blocks.keys()):
+        if name not in names:
+            _worker_blocks.pop(name).close()
+
+
+def _unlink_blocks(blocks):
+    for key, block in blocks.items():
+        if block is not None:
+            block.close()
+            block.unlink()
+        blocks[key] = None
+
+
+def _evaluate_rows(header, start, stop):
+    genes_name, values_name, shape, dtype, n_objectives = header
+    _release_blocks((genes_name, values_name))
+    genes = np.ndarray(shape, dtype=dtype, buffer=_attach(genes_name).buf)
+    values = np.ndarray((shape[0], n_objectives), dtype=np.float64,
+                        buffer=_attach(values_name).buf)
+    indv = _worker_template
+    own_genes = indv.chromosome.genes
+    try:
+        for i in range(start, stop):
+            # rows are read in place, no copy
+            indv.update_genes(genes[i])
+            for j, objective in enumerate(_worker_objectives):
+                values[i, j] = objective(indv)
+    finally:
+        # the template must not keep a view of a block that a later batch may release
+        indv.chromosome.genes = own_genes
+    return stop - start
+
+
+class SharedMemoryEvaluator(ProcessPoolEvaluator):
+    """
+        Process-pool evaluation where the genes of the population are written
+        into one contiguous shared memory matrix per generation.
+        Workers read their rows zero-copy into a template individual
+        and write objective values into a shared result matrix,
+        so only row ranges go through the pipes.
+
+        The shared blocks are reused across generations and only reallocated
+        when the population outgrows them.
+
+        Workers rebuild individuals from genes only (update_genes on a clone
+        of the first individual), so objectives must depend on the genes
+        alone, e.g. through decode() for tree models.
+
+        params:
+        :n_jobs: number of worker processes, -1 uses all cpus
+        :chunksize: number of rows evaluated by a worker at once,
+            by default the population is split in about 4 chunks per worker
+        :mp_context: multiprocessing context or start method name
+    """
+
+    def __init__(self, n_jobs: int = -1, chunksize: int = None, mp_context=None):
+        if shared_memory is None:
+            raise ImportError('SharedMemoryEvaluator requires multiprocessing.shared_memory (python >= 3.8)')
+        super(SharedMemoryEvaluator, self).__init__(n_jobs=n_jobs, chunksize=chunksize,
+                                                    mp_context=mp_context)
+        self._blocks = {'genes': None, 'values': None}
+        # blocks are unlinked when the evaluator is garbage collected or at exit
+        self._finalizer = weakref.finalize(self, _unlink_blocks, self._blocks)
+
+    def __getstate__(self):
+        state = super(SharedMemoryEvaluator, self).__getstate__()
+        state['_blocks'] = {'genes': None, 'values': None}
+        state['_finalizer'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._finalizer = weakref.finalize(self, _unlink_blocks, self._blocks)
+
+    def _create_executor(self, objectives, population):
+        return ProcessPoolExecutor(max_workers=self.n_jobs,
+                                   mp_context=self.mp_context,
+                                   initializer=_init_worker,
+                                   initargs=(objectives, population[0].clone()))
+
+    @staticmethod
+    def _reserve(block, nbytes):
+        if block is not None and block.size >= nbytes:
+            return block
+        if block is not None:
+            block.close()
+            block.unlink()
+        return shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+
+    def evaluate(self, objectives, population):
+        if len(population) == 0:
+            return []
+        executor = self._get_executor(objectives, population)
+
+        n, length = len(population), population[0].chromosome.length
+        dtype = np.result_type(*[indv.chromosome.genes.dtype for indv in population])
+        n_objectives = len(objectives)
+
+        blocks = self._blocks
+        blocks['genes'] = self._reserve(blocks['genes'], n * length * dtype.itemsize)
+        blocks['values'] = self._reserve(blocks['values'], n * n_objectives * 8)
+        genes = np.ndarray((n, length), dtype=dtype, buffer=blocks['genes'].buf)
+        for i, indv in enumerate(population):
+            genes[i] = indv.chromosome.genes
+
+        header = (blocks['genes'].name, blocks['values'].name, (n, length), dtype.str, n_objectives)
+        chunksize = self._get_chunksize(n)
+        starts = list(range(0, n, chunksize))
+        stops = [min(start + chunksize, n) for start in starts]
+        for _ in executor.map(_evaluate_rows, repeat(header), starts, stops):
+            pass
+
+        values = np.ndarray((n, n_objectives), dtype=np.float64, buffer=blocks['values'].buf)
+        ret = values.tolist()
+        del genes, values
+        return ret
+
+    def close(self):
+        super(SharedMemoryEvaluator, self).close()
+        _unlink_blocks(self._blocks)
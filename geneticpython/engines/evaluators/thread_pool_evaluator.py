@@ -0,0 +1,71 @@
+"""
+File: thread_pool_evaluator.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Evaluate objectives on a persistent pool of threads
+"""
+
+from __future__ import absolute_import
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .evaluator import Evaluator
+from .process_pool_evaluator import effective_n_jobs
+
+import math
+
+
+class ThreadPoolEvaluator(Evaluator):
+    """
+        Evaluate individuals concurrently on a pool of threads.
+        Nothing is pickled, threads work on the individuals directly,
+        so this is the backend of choice for objectives dominated by code
+        that releases the GIL (NumPy linear algebra, I/O, C extensions).
+        Objectives must be thread-safe, tree models that decode into a shared
+        solution are only safe when each individual owns its solution.
+
+        The pool is created on the first call of evaluate and is reused across
+        generations and runs.
+
+        params:
+        :n_jobs: number of threads, -1 uses all cpus
+        :chunksize: number of individuals evaluated by a thread at once,
+            by default the population is split in about 4 chunks per thread
+    """
+
+    def __init__(self, n_jobs: int = -1, chunksize: int = None):
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.chunksize = chunksize
+        self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+    def _get_chunksize(self, size):
+        if self.chunksize is not None:
+            return self.chunksize
+        return max(int(math.ceil(size / (self.n_jobs * 4))), 1)
+
+    def evaluate(self, objectives, population):
+        if len(population) == 0:
+            return []
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.n_jobs)
+
+        def evaluate_chunk(chunk):
+            return [[objective(indv) for objective in objectives] for indv in chunk]
+
+        chunksize = self._get_chunksize(len(population))
+        chunks = [population[i:i+chunksize] for i in range(0, len(population), chunksize)]
+        values = []
+        for chunk_values in self._executor.map(evaluate_chunk, chunks):
+            values.extend(chunk_values)
+        return values
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
@@ -0,0 +1,48 @@
+"""
+File: validation.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description:
+"""
+
+from __future__ import absolute_import
+
+from typing import Union
+
+from .evaluator import Evaluator, SerialEvaluator
+from .process_pool_evaluator import ProcessPoolEvaluator, effective_n_jobs
+from .thread_pool_evaluator import ThreadPoolEvaluator
+from .shared_memory_evaluator import SharedMemoryEvaluator
+from .async_evaluator import AsyncEvaluator
+
+
+def check_evaluator(evaluator: Union[str, Evaluator] = None, n_jobs: int = None) -> Evaluator:
+    """Turn evaluator into an Evaluator instance
+    Parameters
+    ----------
+    evaluator : None, str or instance of Evaluator
+        If evaluator is None, return a ProcessPoolEvaluator when n_jobs asks
+        for more than one worker, otherwise a SerialEvaluator.
+        If evaluator is 'serial', 'process', 'shared_memory', 'thread' or 'async',
+        return the corresponding evaluator, n_jobs is the number of workers of pools.
+        If evaluator is already an Evaluator instance, return it.
+        Otherwise raise ValueError.
+    """
+    if isinstance(evaluator, Evaluator):
+        return evaluator
+    if evaluator is None:
+        evaluator = 'process' if effective_n_jobs(n_jobs) > 1 else 'serial'
+    if evaluator == 'serial':
+        return SerialEvaluator()
+    if evaluator == 'process':
+        return ProcessPoolEvaluator(n_jobs=n_jobs if n_jobs is not None else -1)
+    if evaluator == 'shared_memory':
+        return SharedMemoryEvaluator(n_jobs=n_jobs if n_jobs is not None else -1)
+    if evaluator == 'thread':
+        return ThreadPoolEvaluator(n_jobs=n_jobs if n_jobs is not None else -1)
+    if evaluator == 'async':
+        return AsyncEvaluator()
+    raise ValueError('%r cannot be used as an evaluator, expected an instance of Evaluator'
+                     ' or one of \'serial\', \'process\', \'shared_memory\', \'thread\', \'async\''
+                     % evaluator)
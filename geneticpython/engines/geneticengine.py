@@ -8,6 +8,7 @@ from __future__ import absolute_import
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import List, Union, Callable
+from collections import OrderedDict
 from tqdm.auto import tqdm
 
 from geneticpython.core.individual import Individual
@@ -15,13 +16,41 @@ from geneticpython.core.population import Population
 from geneticpython.core.operators import Selection, Crossover, Mutation, Replacement
 from geneticpython.callbacks import Callback, History, CallbackList
 from geneticpython.utils.validation import check_random_state
-
+from geneticpython.utils.rng import RNGManager, BufferedRandomState
+from geneticpython.engines.evaluators import Evaluator, SerialEvaluator, AsyncEvaluator, FitnessCache, check_evaluator
+from geneticpython.engines.reproduction import ParallelReproducer
+
+import numpy as np
+import inspect
+import json
+import time
+import os
 import random
 import math
 import copy
 
+try:
+    from contextlib import nullcontext
+except ImportError:  # python < 3.7
+    from contextlib import contextmanager
+
+    @contextmanager
+    def nullcontext():
+        yield
+
+
+def _to_builtin(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class GeneticEngine(ABC):
+    # per-individual attributes saved in checkpoints when the engine sets them
+    _checkpoint_attributes = ['nondominated_rank', 'crowding_distance']
+
     def __init__(self, population: Population,
                  objective: Callable[[Individual], Union[float, int]] = None,
                  objectives: List[Callable[[Individual], Union[float, int]]] = None,
@@ -32,7 +61,12 @@ class GeneticEngine(ABC):
                  replacement: Replacement = None,
                  callbacks: CallbackList = None,
                  generations: int = None,
-                 random_state = None):
+                 random_state = None,
+                 evaluator: Union[str, Evaluator] = None,
+                 n_jobs: int = None,
+                 cache_size: int = None,
+                 reproduction_n_jobs: int = None,
+                 rng_buffer_size: int = None):
 
         self.population = population
         self.generations = generations
@@ -43,12 +77,34 @@ class GeneticEngine(ABC):
         self.objective = objective
         self.objectives = objectives
         self.selection_size = selection_size or self.population.size
-        self.random_state = check_random_state(random_state)
+        # an engine without seed gets its own stream, load_checkpoint sets its state
+        self.random_state = check_random_state(random_state) if random_state is not None \
+            else np.random.RandomState()
+        if rng_buffer_size:
+            # operators draw their numbers from pre-drawn blocks
+            self.random_state = BufferedRandomState(self.random_state, rng_buffer_size)
+        self._seed = random_state
+        self._rng = None
+        self.evaluator = check_evaluator(evaluator, n_jobs)
+        self._async_evaluator = None
+        self.cache = FitnessCache(cache_size) if cache_size else None
+        self._cached_objectives = None
+        self.reproducer = ParallelReproducer(reproduction_n_jobs) \
+            if reproduction_n_jobs is not None else None
+        self._n_reproductions = 0
         self.callbacks = callbacks
         self.callbacks.set_engine(self)
         self.metrics = None
         self.history = None
+        self.operator_profiler = None
         self.stop_running = False
+        self.generation = 0
+        self.n_evaluations = 0
+        self.stop_reason = None
+        self.max_time = None
+        self.max_evaluations = None
+        self.target_objective = None
+        self.stagnation = None
         self.coefficients = None
         self.coefficient = None
 
@@ -64,6 +120,31 @@ class GeneticEngine(ABC):
     def set_replacement(self, replacement: Replacement):
         self.replacement = replacement
 
+    def set_evaluator(self, evaluator: Union[str, Evaluator], n_jobs: int = None):
+        self.evaluator.close()
+        self.evaluator = check_evaluator(evaluator, n_jobs)
+
+    def close(self):
+        """
+            release the resources of the evaluator (worker pools, ...),
+            the engine can still be run afterwards
+        """
+        self.evaluator.close()
+        if self._async_evaluator is not None:
+            self._async_evaluator.close()
+        if self.reproducer is not None:
+            self.reproducer.close()
+
+    @property
+    def rng(self) -> RNGManager:
+        """
+            independent random streams derived from random_state,
+            for work that is split across workers, islands or individual slots
+        """
+        if self._rng is None:
+            self._rng = RNGManager(self._seed)
+        return self._rng
+
     def summary(self):
         pass
 
@@ -77,15 +158,25 @@ class GeneticEngine(ABC):
                                      random_state=self.random_state)
 
     def do_reproduction(self, mating_population: List[Individual]) -> List[Individual]:
-        childs = []
-        for i in range(0, len(mating_population), 2):
-            childs_temp = self.crossover.cross(father=mating_population[i],
-                                               mother=mating_population[i+1],
-                                               random_state=self.random_state)
-            childs.extend(childs_temp)
-
-        for i in range(len(childs)):
-            childs[i] = self.mutation.mutate(childs[i], random_state=self.random_state)
+        if self.reproducer is not None:
+            # one independent stream per mating pair, derived from the engine seed
+            seeds = self.rng.spawn_seeds((len(mating_population) + 1) // 2,
+                                         'reproduction', self._n_reproductions)
+            self._n_reproductions += 1
+            return self.reproducer.reproduce(self.crossover, self.mutation,
+                                             mating_population, seeds)
+
+        pool = self.population.pool
+        with pool.activate() if pool is not None else nullcontext():
+            childs = []
+            for i in range(0, len(mating_population), 2):
+                childs_temp = self.crossover.cross(father=mating_population[i],
+                                                   mother=mating_population[i+1],
+                                                   random_state=self.random_state)
+                childs.extend(childs_temp)
+
+            for i in range(len(childs)):
+                childs[i] = self.mutation.mutate(childs[i], random_state=self.random_state)
 
         return childs
 
@@ -97,23 +188,161 @@ class GeneticEngine(ABC):
                                         new_population,
                                         random_state=self.random_state)
 
+    @staticmethod
+    def _batch_objective(fn, coefficient: int, n_objectives: int = 1):
+        """
+            wrap a batched objective function,
+            fn receives the genes of a whole population as a 2-D ndarray
+            (one row per individual) and returns a 1-D array
+            or a 2-D array with n_objectives columns
+        """
+        @wraps(fn)
+        def _fn_batch_with_objective_check(genes):
+            '''
+            A wrapper function for batched objective function with objective value check.
+            '''
+            objectives = np.asarray(fn(genes), dtype=float)
+            if objectives.ndim == 1:
+                objectives = objectives.reshape(-1, 1)
+            if objectives.shape != (genes.shape[0], n_objectives):
+                msg = 'batched objective returned shape {}, expected ({}, {}) or ({},)'
+                msg = msg.format(objectives.shape, genes.shape[0], n_objectives, genes.shape[0])
+                raise ValueError(msg)
+            if np.isnan(objectives).any():
+                raise ValueError('batched objective returned nan values')
+            return coefficient * objectives
+
+        _fn_batch_with_objective_check.batch = True
+        _fn_batch_with_objective_check.n_objectives = n_objectives
+        return _fn_batch_with_objective_check
+
+    @staticmethod
+    def _async_objective(fn, coefficient: int):
+        """
+            wrap an `async def` objective function
+        """
+        @wraps(fn)
+        async def _fn_async_with_objective_check(indv):
+            '''
+            A wrapper function for async objective function with objective value check.
+            '''
+            # Check indv type.
+            if not isinstance(indv, Individual):
+                raise TypeError(
+                    'indv\'s class must be subclass of IndividualBase')
+
+            # Check objective.
+            objective = float(await fn(indv))
+            if math.isnan(objective):
+                msg = 'objective value(value: {}, type: {}) is invalid'
+                msg = msg.format(objective, type(objective))
+                raise ValueError(msg)
+            return coefficient * objective
+
+        return _fn_async_with_objective_check
+
+    def _get_evaluator(self, objectives: List[Callable]) -> Evaluator:
+        """
+            async objectives are evaluated under an event loop,
+            the default serial evaluator is replaced by an AsyncEvaluator for them
+        """
+        if not any(inspect.iscoroutinefunction(objective) for objective in objectives):
+            return self.evaluator
+        if isinstance(self.evaluator, AsyncEvaluator):
+            return self.evaluator
+        if isinstance(self.evaluator, SerialEvaluator):
+            if self._async_evaluator is None:
+                self._async_evaluator = AsyncEvaluator()
+            return self._async_evaluator
+        raise ValueError(f"async objectives cannot be evaluated by {type(self.evaluator).__name__}, "
+                         f"use AsyncEvaluator instead")
+
+    def evaluate_objectives(self, objectives: List[Callable], population: List[Individual]) -> List[List[float]]:
+        """
+            compute registered objectives on population,
+            individuals whose genes are in the fitness cache are not evaluated again
+
+            :return: objective values of each individual
+            :rtype: List[List[float]]
+        """
+        if self.cache is None:
+            return self._compute_values(objectives, population)
+
+        # cached values are only valid for the objectives they were computed with
+        if self._cached_objectives != tuple(objectives):
+            self.cache.clear()
+            self._cached_objectives = tuple(objectives)
+
+        values = [None] * len(population)
+        pending = OrderedDict()
+        for i, indv in enumerate(population):
+            key = self.cache.key(indv)
+            if key in pending:
+                # the same genotype is already being evaluated in this batch
+                pending[key].append(i)
+                self.cache.hits += 1
+                continue
+            cached = self.cache.get(key)
+            if cached is None:
+                pending[key] = [i]
+            else:
+                values[i] = list(cached)
+
+        computed = self._compute_values(objectives,
+                                        [population[ids[0]] for ids in pending.values()])
+        for (key, ids), value in zip(pending.items(), computed):
+            self.cache.put(key, value)
+            for i in ids:
+                values[i] = list(value)
+        return values
+
+    def _compute_values(self, objectives: List[Callable], population: List[Individual]) -> List[List[float]]:
+        """
+            per-individual objectives go through the evaluator,
+            batched objectives are called once on the stacked genes of population
+        """
+        if len(population) == 0:
+            return []
+        self.n_evaluations += len(population)
+        batched = [getattr(objective, 'batch', False) for objective in objectives]
+        evaluator = self._get_evaluator(objectives)
+        if not any(batched):
+            return evaluator.evaluate(objectives, population)
+
+        per_indv_objectives = [objective for objective, is_batch in zip(objectives, batched)
+                               if not is_batch]
+        per_indv_values = None
+        if per_indv_objectives:
+            per_indv_values = np.array(evaluator.evaluate(per_indv_objectives, population),
+                                       dtype=float).reshape(len(population), -1)
+
+        genes = np.stack([indv.chromosome.genes for indv in population])
+        columns = []
+        j = 0
+        for objective, is_batch in zip(objectives, batched):
+            if is_batch:
+                columns.append(objective(genes))
+            else:
+                columns.append(per_indv_values[:, j:j+1])
+                j += 1
+
+        return np.hstack(columns).tolist()
+
     @abstractmethod
     def compute_objectives(self, population: List[Individual]) -> List[Individual]:
         pass
 
     def _update_metrics(self) -> None:
-        pass
+        self.metrics = self.metrics or OrderedDict()
+        self.metrics['n_evaluations'] = self.n_evaluations
+        if self.cache is not None:
+            self.metrics['cache_hits'] = self.cache.hits
+            self.metrics['cache_misses'] = self.cache.misses
 
     def _update_logs(self, logs):
         return logs
 
-    def run(self, generations: int = None) -> History:
-        if generations is not None:
-            self.generations = generations
-
-        logs = None
-        self.callbacks.on_running_begin(logs=logs)
-
+    def _initialize(self, logs=None):
         self.callbacks.on_init_population_begin(logs=logs)
         self.population.individuals = self.do_initialization()
         self.population.individuals = self.compute_objectives(
@@ -123,42 +352,276 @@ class GeneticEngine(ABC):
         self._update_metrics()
         logs = self._update_logs(logs)
         self.callbacks.on_init_population_end(logs=logs)
+        return logs
 
-        for gen in range(self.generations):
-            self.callbacks.on_generation_begin(gen, logs=logs)
+    def _run_generation(self, gen: int, logs=None):
+        self.callbacks.on_generation_begin(gen, logs=logs)
 
-            self.callbacks.on_selection_begin(gen, logs=logs)
-            mating_population = self.do_selection()
-            self.callbacks.on_selection_end(gen, logs=logs)
+        self.callbacks.on_selection_begin(gen, logs=logs)
+        mating_population = self.do_selection()
+        self.callbacks.on_selection_end(gen, logs=logs)
 
-            self.callbacks.on_reproduction_begin(gen, logs=logs)
-            offspring_population = self.do_reproduction(mating_population)
-            self.callbacks.on_reproduction_end(gen, logs=logs)
+        self.callbacks.on_reproduction_begin(gen, logs=logs)
+        offspring_population = self.do_reproduction(mating_population)
+        self.callbacks.on_reproduction_end(gen, logs=logs)
 
-            offspring_population = self.compute_objectives(
-                offspring_population)
+        self.callbacks.on_compute_objectives_begin(gen, logs=logs)
+        offspring_population = self.compute_objectives(
+            offspring_population)
+        self.callbacks.on_compute_objectives_end(gen, logs=logs)
 
-            self.callbacks.on_evaluation_begin(gen, logs=logs)
-            new_population = self.population.individuals + offspring_population
-            new_population = self.do_evaluation(new_population)
-            self.callbacks.on_evaluation_end(gen, logs=logs)
+        self.callbacks.on_evaluation_begin(gen, logs=logs)
+        new_population = self.population.individuals + offspring_population
+        new_population = self.do_evaluation(new_population)
+        self.callbacks.on_evaluation_end(gen, logs=logs)
 
-            self.callbacks.on_replacement_begin(gen, logs=logs)
-            self.population.individuals = self.do_replacement(new_population)
-            self.callbacks.on_replacement_end(gen, logs=logs)
+        self.callbacks.on_replacement_begin(gen, logs=logs)
+        self.population.individuals = self.do_replacement(new_population)
+        self.population.release(new_population)
+        self.callbacks.on_replacement_end(gen, logs=logs)
 
-            self._update_metrics()
-            logs = self._update_logs(logs)
+        self.generation = gen + 1
+        self._update_metrics()
+        logs = self._update_logs(logs)
 
-            self.callbacks.on_generation_end(gen, logs=logs)
+        self.callbacks.on_generation_end(gen, logs=logs)
+        return logs
+
+    def set_stopping_criteria(self, max_time: float = None,
+                              max_evaluations: int = None,
+                              target_objective: Union[float, List[float]] = None,
+                              stagnation: int = None):
+        """
+            stopping criteria checked at the end of each generation,
+            the run stops as soon as one of them is met (or after self.generations generations)
+
+            :param max_time: maximum wall-clock seconds of the run
+            :param max_evaluations: maximum number of objective evaluations
+                (cached values and unmodified individuals are not counted)
+            :param target_objective: stop when the best objective reaches this value,
+                for multiple objectives a list with one value per objective,
+                reached when an individual is at least as good on all of them
+            :param stagnation: stop when the best objective has not improved for this number
+                of generations, for multiple objectives when the pareto front has no new point
+                that is not weakly dominated by the last improved front
+        """
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.target_objective = target_objective
+        self.stagnation = stagnation
+
+    def _update_stopping_criteria(self, **criteria):
+        """
+            set the stopping criteria that are not None, keep the others
+        """
+        for name, value in criteria.items():
+            if value is not None:
+                setattr(self, name, value)
+
+    def _reached_target(self, target) -> bool:
+        return False
+
+    def _progress_key(self):
+        """
+            a snapshot of the search progress (best objective, pareto front, ...), used for stagnation
+        """
+        return None
+
+    def _has_improved(self, previous, current) -> bool:
+        return current != previous
+
+    def _check_stopping_criteria(self):
+        if self.generations is not None and self.generation >= self.generations:
+            self.stop_reason = 'generations'
+        elif self.max_time is not None and time.monotonic() - self._start_time >= self.max_time:
+            self.stop_reason = 'max_time'
+        elif self.max_evaluations is not None and self.n_evaluations >= self.max_evaluations:
+            self.stop_reason = 'max_evaluations'
+        elif self.target_objective is not None and self._reached_target(self.target_objective):
+            self.stop_reason = 'target_objective'
+        elif self.stagnation is not None and self.generation > self._start_generation:
+            key = self._progress_key()
+            if self._has_improved(self._last_progress_key, key):
+                self._last_progress_key = key
+                self._n_stagnant = 0
+            else:
+                self._n_stagnant += 1
+                if self._n_stagnant >= self.stagnation:
+                    self.stop_reason = 'stagnation'
+        return self.stop_reason is not None
+
+    def _run_generations(self, logs=None) -> History:
+        if self.generations is None and self.max_time is None and self.max_evaluations is None \
+                and self.target_objective is None and self.stagnation is None:
+            raise ValueError('generations is None and no other stopping criterion is set')
+
+        self._start_time = time.monotonic()
+        self._start_generation = self.generation
+        self._last_progress_key = self._progress_key()
+        self._n_stagnant = 0
+        self.stop_reason = None
+
+        gen = self.generation
+        while not self._check_stopping_criteria():
+            logs = self._run_generation(gen, logs)
+            gen += 1
 
             if self.stop_running:
+                self.stop_reason = 'stop_running'
                 break
 
         self.callbacks.on_running_end(logs=logs)
 
         return self.history
 
+    def run(self, generations: int = None,
+            max_time: float = None,
+            max_evaluations: int = None,
+            target_objective: Union[float, List[float]] = None,
+            stagnation: int = None) -> History:
+        """
+            :param generations: number of generations, None keeps the engine's value,
+                an engine created with generations=None runs until another criterion is met
+            see set_stopping_criteria for the other parameters,
+            None keeps the criterion set by set_stopping_criteria
+        """
+        if generations is not None:
+            self.generations = generations
+        self._update_stopping_criteria(max_time=max_time,
+                                       max_evaluations=max_evaluations,
+                                       target_objective=target_objective,
+                                       stagnation=stagnation)
+
+        logs = None
+        self.callbacks.on_running_begin(logs=logs)
+
+        self.generation = 0
+        self.n_evaluations = 0
+        logs = self._initialize(logs)
+
+        return self._run_generations(logs)
+
+    def save_checkpoint(self, path: str):
+        """
+            save the state of the engine to a compressed npz file:
+            genes and objectives of the population as arrays, exact random state,
+            generation counter and history.
+            The file is written next to path first and renamed,
+            a crash while writing keeps the previous checkpoint.
+        """
+        individuals = self.population.individuals
+        arrays = OrderedDict()
+        arrays['genes'] = np.stack([indv.chromosome.genes for indv in individuals])
+        if self.coefficients is not None:
+            arrays['objectives'] = np.array([indv._objectives for indv in individuals], dtype=float)
+        else:
+            arrays['objectives'] = np.array([[indv._objective] for indv in individuals], dtype=float)
+        for name in self._checkpoint_attributes:
+            values = [getattr(indv, name, None) for indv in individuals]
+            if all(value is not None for value in values):
+                arrays[name] = np.array(values, dtype=float)
+
+        if isinstance(self.random_state, np.random.Generator):
+            rng_state = self.random_state.bit_generator.state
+        else:
+            rng_state = self.random_state.get_state(legacy=False)
+        if isinstance(self.random_state, BufferedRandomState):
+            arrays['rng_buffer'] = self.random_state._buffer[self.random_state._position:]
+
+        state = OrderedDict()
+        state['generation'] = self.generation
+        state['n_reproductions'] = self._n_reproductions
+        state['n_evaluations'] = self.n_evaluations
+        state['rng_state'] = rng_state
+        if self._rng is not None:
+            state['seed_sequence'] = {'entropy': self._rng.seed_sequence.entropy,
+                                      'spawn_key': list(self._rng.seed_sequence.spawn_key)}
+        state['history'] = self.history.get_state() if self.history is not None else []
+        # utf-8 bytes, a numpy unicode string would take 4 bytes per character
+        arrays['state'] = np.frombuffer(json.dumps(state, default=_to_builtin).encode('utf-8'), dtype=np.uint8)
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def _restore_population(self, individuals: List[Individual]) -> List[Individual]:
+        """
+            rebuild the structures the engine keeps on its population after a checkpoint is loaded
+        """
+        return individuals
+
+    def load_checkpoint(self, path: str):
+        """
+            restore the population, random state, generation counter and history
+            saved by save_checkpoint, objectives must be registered as for the saved run
+        """
+        with np.load(path, allow_pickle=False) as checkpoint:
+            arrays = {name: checkpoint[name] for name in checkpoint.files}
+        state = json.loads(arrays['state'].tobytes().decode('utf-8'))
+
+        individuals = []
+        for i in range(arrays['genes'].shape[0]):
+            indv = self.population.individual_temp.clone()
+            indv.update_genes(arrays['genes'][i])
+            if self.coefficients is not None:
+                indv._coefficients = list(self.coefficients)
+                indv._objectives = arrays['objectives'][i].tolist()
+            else:
+                indv._coefficient = self.coefficient
+                indv._objective = float(arrays['objectives'][i][0])
+            for name in self._checkpoint_attributes:
+                if name in arrays:
+                    value = arrays[name][i]
+                    setattr(indv, name, int(value) if name == 'nondominated_rank' else float(value))
+            indv.modified = False
+            individuals.append(indv)
+        self.population.individuals = self._restore_population(individuals)
+
+        if isinstance(self.random_state, np.random.Generator):
+            self.random_state.bit_generator.state = state['rng_state']
+        else:
+            self.random_state.set_state(state['rng_state'])
+        if isinstance(self.random_state, BufferedRandomState):
+            self.random_state._buffer = arrays.get('rng_buffer', np.empty(0))
+            self.random_state._position = 0
+        if 'seed_sequence' in state:
+            self._rng = RNGManager(np.random.SeedSequence(state['seed_sequence']['entropy'],
+                                                          spawn_key=state['seed_sequence']['spawn_key']))
+
+        self.generation = state['generation']
+        self._n_reproductions = state['n_reproductions']
+        self.n_evaluations = state['n_evaluations']
+        history = self.callbacks._history or History()
+        history.set_state(state['history'])
+        self.history = history
+
+    def resume(self, path: str, generations: int = None,
+               max_time: float = None,
+               max_evaluations: int = None,
+               target_objective: Union[float, List[float]] = None,
+               stagnation: int = None) -> History:
+        """
+            load a checkpoint saved by save_checkpoint and continue the run
+            until generations (the total number of generations, counted from the start of the saved run),
+            max_evaluations also counts the evaluations of the saved run,
+            see set_stopping_criteria for the other parameters,
+            None keeps the criterion set by set_stopping_criteria
+        """
+        if generations is not None:
+            self.generations = generations
+        self._update_stopping_criteria(max_time=max_time,
+                                       max_evaluations=max_evaluations,
+                                       target_objective=target_objective,
+                                       stagnation=stagnation)
+
+        self.load_checkpoint(path)
+        self._update_metrics()
+        logs = self._update_logs(None)
+        self.callbacks.on_running_begin(logs=logs)
+
+        return self._run_generations(logs)
+
     def get_all_solutions(self) -> List[Individual]:
         return self.population.individuals
 
@@ -0,0 +1,323 @@
+"""
+File: island_engine.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Island model, one engine per process with periodic migration
+"""
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from functools import cmp_to_key
+from typing import List, Callable
+
+from geneticpython.core import Individual, Pareto
+from geneticpython.callbacks import Callback, History
+from geneticpython.engines.geneticengine import GeneticEngine
+from geneticpython.engines.multi_objective.multi_objective_engine import is_dominated
+from geneticpython.utils.rng import RNGManager
+
+import multiprocessing
+import traceback
+import queue
+
+
+TOPOLOGIES = ['ring', 'full', 'random']
+MIGRANT_SELECTIONS = ['best', 'random']
+MIGRANT_REPLACEMENTS = ['worst', 'random']
+# seconds between two checks of the island processes while waiting for results
+POLL_INTERVAL = 0.5
+
+
+def migration_plan(topology: str, n_islands: int, n_epochs: int, random_state=None) -> List[List[List[int]]]:
+    """
+        compute the islands each island sends migrants to, at each migration epoch
+
+        :return: plan[epoch][island] is the list of destination islands
+    """
+    if topology == 'ring':
+        targets = [[(i + 1) % n_islands] for i in range(n_islands)]
+        return [targets for _ in range(n_epochs)]
+    if topology == 'full':
+        targets = [[j for j in range(n_islands) if j != i] for i in range(n_islands)]
+        return [targets for _ in range(n_epochs)]
+    if topology == 'random':
+        plan = []
+        for _ in range(n_epochs):
+            targets = []
+            for i in range(n_islands):
+                j = int(random_state.integers(0, n_islands - 1))
+                targets.append([j if j < i else j + 1])
+            plan.append(targets)
+        return plan
+    raise ValueError(f"Invalid topology {topology}, expected one of {TOPOLOGIES}")
+
+
+def _rank(engine: GeneticEngine, individuals: List[Individual]) -> List[Individual]:
+    """
+        sort individuals from best to worst with the engine's own order
+    """
+    comparator = getattr(engine, 'crowded_comparator', None)
+    if comparator is not None:
+        return sorted(individuals, key=cmp_to_key(comparator))
+    return sorted(individuals, key=lambda indv: indv._objective)
+
+
+class _Migration(Callback):
+    """
+        Exchange migrants with the other islands at the end of every
+        migration_interval generations. An island only waits for the migrants
+        of the islands sending to it, there is no global barrier.
+    """
+
+    def __init__(self, island, inboxes, plan, migration_interval, n_migrants,
+                 migrant_selection, migrant_replacement, random_state):
+        super(_Migration, self).__init__()
+        self.island = island
+        self.inboxes = inboxes
+        self.plan = plan
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.migrant_selection = migrant_selection
+        self.migrant_replacement = migrant_replacement
+        self.random_state = random_state
+        self.pending = {}
+
+    def _select_migrants(self, individuals):
+        if self.migrant_selection == 'best':
+            migrants = _rank(self.engine, individuals)[:self.n_migrants]
+        else:
+            ids = self.random_state.choice(len(individuals), self.n_migrants, replace=False)
+            migrants = [individuals[i] for i in ids]
+        return [indv.clone() for indv in migrants]
+
+    def _receive(self, epoch, n_sources):
+        while len(self.pending.get(epoch, [])) < n_sources:
+            msg_epoch, source, migrants = self.inboxes[self.island].get()
+            self.pending.setdefault(msg_epoch, []).append((source, migrants))
+        received = sorted(self.pending.pop(epoch, []), key=lambda msg: msg[0])
+        return [indv for _, migrants in received for indv in migrants]
+
+    def _integrate(self, individuals, migrants):
+        if self.migrant_replacement == 'worst':
+            survivors = _rank(self.engine, individuals)[:len(individuals) - len(migrants)]
+        else:
+            ids = set(self.random_state.choice(len(individuals), len(migrants), replace=False).tolist())
+            survivors = [indv for i, indv in enumerate(individuals) if i not in ids]
+        return survivors + migrants
+
+    def on_generation_end(self, gen, logs=None):
+        if (gen + 1) % self.migration_interval != 0:
+            return
+        epoch = (gen + 1) // self.migration_interval - 1
+        if epoch >= len(self.plan):
+            return
+
+        individuals = self.engine.population.individuals
+        for target in self.plan[epoch][self.island]:
+            self.inboxes[target].put((epoch, self.island, self._select_migrants(individuals)))
+
+        n_sources = sum(self.island in targets for targets in self.plan[epoch])
+        migrants = self._receive(epoch, n_sources)[:len(individuals)]
+        if migrants:
+            individuals = self._integrate(individuals, migrants)
+            # restore the engine's own structures (ranks, sorted order, ...)
+            self.engine.population.individuals = self.engine.do_evaluation(individuals)
+
+
+def _run_island(island, engine_factory, seed, generations, migration, results):
+    try:
+        engine = engine_factory(island, seed)
+        if engine.callbacks._progbar is not None:
+            engine.callbacks.remove(engine.callbacks._progbar)
+        migration.set_engine(engine)
+        engine.callbacks.append(migration)
+        history = engine.run(generations)
+        engine.close()
+        results.put((island, None, (history.history,
+                                    engine.population.individuals,
+                                    engine.coefficient,
+                                    engine.coefficients)))
+    except BaseException:
+        results.put((island, traceback.format_exc(), None))
+
+
+class IslandEngine():
+    """
+        Island model: n_islands engines evolve in separate processes and
+        exchange migrants every migration_interval generations.
+
+        Each island builds its own engine with engine_factory(island, random_state),
+        where random_state is an int seed derived from the IslandEngine seed,
+        so runs are reproducible. Migrants keep their objective values, they are
+        not evaluated again.
+
+        params:
+        :engine_factory: callable returning a GAEngine, NSGAIIEngine, ... for an island,
+            it is called in the island process, it must be picklable (e.g. a module-level
+            function) unless the start method is 'fork'
+        :n_islands: number of islands (processes)
+        :migration_interval: number of generations between two migrations
+        :n_migrants: number of individuals sent to each destination island
+        :topology: 'ring' (to the next island), 'full' (to all other islands)
+            or 'random' (to one random island, drawn again at every migration)
+        :migrant_selection: 'best' or 'random' individuals are sent
+        :migrant_replacement: incoming migrants replace the 'worst' or 'random' individuals
+        :mp_context: multiprocessing context or start method name,
+            by default the default context of the platform
+    """
+
+    def __init__(self, engine_factory: Callable[[int, int], GeneticEngine],
+                 n_islands: int = 4,
+                 migration_interval: int = 10,
+                 n_migrants: int = 2,
+                 topology: str = 'ring',
+                 migrant_selection: str = 'best',
+                 migrant_replacement: str = 'worst',
+                 generations: int = 100,
+                 random_state=None,
+                 mp_context=None):
+        if n_islands < 2:
+            raise ValueError('Invalid n_islands, requires n_islands >= 2')
+        if migration_interval <= 0:
+            raise ValueError('Invalid migration_interval, requires migration_interval > 0')
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Invalid topology {topology}, expected one of {TOPOLOGIES}")
+        if migrant_selection not in MIGRANT_SELECTIONS:
+            raise ValueError(f"Invalid migrant_selection {migrant_selection}, "
+                             f"expected one of {MIGRANT_SELECTIONS}")
+        if migrant_replacement not in MIGRANT_REPLACEMENTS:
+            raise ValueError(f"Invalid migrant_replacement {migrant_replacement}, "
+                             f"expected one of {MIGRANT_REPLACEMENTS}")
+
+        self.engine_factory = engine_factory
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.topology = topology
+        self.migrant_selection = migrant_selection
+        self.migrant_replacement = migrant_replacement
+        self.generations = generations
+        self.rng = RNGManager(random_state)
+        if mp_context is None or isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+
+        self.populations = None
+        self.island_histories = None
+        self.history = None
+        self.coefficient = None
+        self.coefficients = None
+
+    def run(self, generations: int = None) -> History:
+        if generations is not None:
+            self.generations = generations
+
+        n_epochs = max(self.generations - 1, 0) // self.migration_interval
+        plan = migration_plan(self.topology, self.n_islands, n_epochs,
+                              self.rng.generator('island'))
+        inboxes = [self.mp_context.Queue() for _ in range(self.n_islands)]
+        results = self.mp_context.Queue()
+
+        processes = []
+        for island in range(self.n_islands):
+            seed = int(self.rng.seed('island', island).generate_state(1)[0])
+            migration = _Migration(island, inboxes, plan, self.migration_interval, self.n_migrants,
+                                   self.migrant_selection, self.migrant_replacement,
+                                   self.rng.generator('island', island, 1))
+            process = self.mp_context.Process(target=_run_island,
+                                              args=(island, self.engine_factory, seed,
+                                                    self.generations, migration, results))
+            process.start()
+            processes.append(process)
+
+        outputs = [None] * self.n_islands
+        try:
+            self._collect(processes, results, outputs)
+        finally:
+            for process in processes:
+                if process.is_alive() and any(output is None for output in outputs):
+                    process.terminate()
+                process.join()
+
+        self.island_histories = [output[0] for output in outputs]
+        self.populations = [output[1] for output in outputs]
+        self.coefficient, self.coefficients = outputs[0][2], outputs[0][3]
+        self.history = History()
+        self.history.history = self._merge_histories(self.island_histories)
+        return self.history
+
+    def _collect(self, processes, results, outputs):
+        """
+            fill outputs with the results of the islands, raise a RuntimeError
+            if an island fails or its process dies without sending its results
+        """
+        # islands found dead at the previous poll, their results may still be in the queue
+        dead = set()
+        n_received = 0
+        while n_received < self.n_islands:
+            try:
+                island, error, output = results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                for island, process in enumerate(processes):
+                    if outputs[island] is not None or process.exitcode is None:
+                        continue
+                    if island in dead:
+                        raise RuntimeError(f"island {island} exited with code {process.exitcode} "
+                                           f"without sending its results")
+                    dead.add(island)
+                continue
+            if error is not None:
+                raise RuntimeError(f"island {island} failed:\n{error}")
+            outputs[island] = output
+            n_received += 1
+
+    def _merge_pareto_fronts(self, fronts):
+        points = [list(point) for front in fronts for point in front]
+        if len(points) == 0:
+            return []
+        coefficients = self.coefficients or [1] * len(points[0])
+        normalized = [[c * v for c, v in zip(coefficients, point)] for point in points]
+
+        def dominates(a, b):
+            return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+        merged = []
+        for i, point in enumerate(points):
+            if point in merged:
+                continue
+            if not any(dominates(other, normalized[i]) for other in normalized):
+                merged.append(point)
+        return merged
+
+    def _merge_histories(self, histories: List[List[dict]]) -> List[dict]:
+        """
+            merge the logs of all islands generation by generation,
+            the logs of each island are kept under 'islands'
+        """
+        merged = []
+        for entries in zip(*histories):
+            logs = OrderedDict()
+            if all('best_objective' in entry for entry in entries):
+                best = [entry['best_objective'] for entry in entries]
+                logs['best_objective'] = max(best) if self.coefficient == -1 else min(best)
+            if all('pareto_front' in entry for entry in entries):
+                logs['pareto_front'] = self._merge_pareto_fronts(
+                    [entry['pareto_front'] for entry in entries])
+            logs['islands'] = list(entries)
+            merged.append(logs)
+        return merged
+
+    def get_all_solutions(self) -> List[Individual]:
+        return [indv for population in self.populations for indv in population]
+
+    def get_best_indv(self) -> Individual:
+        best_indv = min(self.get_all_solutions(), key=lambda indv: indv._objective)
+        return best_indv.clone()
+
+    def get_pareto_front(self) -> Pareto:
+        solutions = self.get_all_solutions()
+        pareto_front = [indv for indv in solutions
+                        if not any(is_dominated(other, indv) for other in solutions)]
+        return Pareto(pareto_front)
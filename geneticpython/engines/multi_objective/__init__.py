@@ -10,3 +10,4 @@ from __future__ import absolute_import
 
 from .multi_objective_engine import MultiObjectiveEngine, is_dominated
 from .nsgaiiengine import NSGAIIEngine
+from .steady_state_nsgaii_engine import SteadyStateNSGAIIEngine
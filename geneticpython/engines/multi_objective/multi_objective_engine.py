@@ -14,13 +14,18 @@ from abc import ABC, abstractmethod
 
 from ..geneticengine import GeneticEngine
 from ...callbacks import Callback, CallbackList
-from ...callbacks import History
+from ...callbacks import History, LazyLogs
 from ...core.population import Population
+from ...core.pareto import Pareto
 from ...core.operators import Selection, Crossover, Mutation, Replacement
 from ...core.individual import Individual
+from ..evaluators import Evaluator
 
+import inspect
 import math
 
+import numpy as np
+
 
 def is_dominated(a: Individual, b: Individual) -> bool:
     """
@@ -52,7 +57,12 @@ class MultiObjectiveEngine(GeneticEngine):
                  replacement: Replacement = None,
                  callbacks: List[Callback] = None,
                  generations: int = 100,
-                 random_state: int = None):
+                 random_state: int = None,
+                 evaluator: Union[str, Evaluator] = None,
+                 n_jobs: int = None,
+                 cache_size: int = None,
+                 reproduction_n_jobs: int = None,
+                 rng_buffer_size: int = None):
         callback_list = CallbackList(
             callbacks, add_history=True, add_progbar=True)
         super(MultiObjectiveEngine, self).__init__(population=population,
@@ -63,41 +73,106 @@ class MultiObjectiveEngine(GeneticEngine):
                                                    replacement=replacement,
                                                    callbacks=callback_list,
                                                    generations=generations,
-                                                   random_state=random_state)
+                                                   random_state=random_state,
+                                                   evaluator=evaluator,
+                                                   n_jobs=n_jobs,
+                                                   cache_size=cache_size,
+                                                   reproduction_n_jobs=reproduction_n_jobs,
+                                                   rng_buffer_size=rng_buffer_size)
 
     @abstractmethod
     def get_pareto_front(self) -> List[Individual]:
         pass
 
+    def _reached_target(self, target) -> bool:
+        target = [c * t for c, t in zip(self.coefficients, target)]
+        return any(all(o <= t for o, t in zip(indv._objectives, target))
+                   for indv in self.population.individuals)
+
+    def _progress_key(self):
+        if not self.population.individuals:
+            return None
+        return [list(indv._objectives) for indv in self.get_pareto_front()]
+
+    def _has_improved(self, previous, current) -> bool:
+        if previous is None:
+            return True
+        # a new point counts when no point of the previous front is at least as good on all objectives
+        return any(not any(all(q <= p for q, p in zip(old, new)) for old in previous)
+                   for new in current)
+
+    def _user_objectives(self, objectives) -> List[List[float]]:
+        """
+            objectives as returned by the objective functions (without coefficients),
+            from a matrix or a list of the minimized objectives
+        """
+        if len(objectives) == 0:
+            return []
+        return (np.asarray(objectives, dtype=float) * self.coefficients).tolist()
+
+    def _pareto_front_logs(self) -> List[List[float]]:
+        pareto_front = self.get_pareto_front()
+        if isinstance(pareto_front, Pareto):
+            return self._user_objectives(pareto_front.all_objectives())
+        return self._user_objectives([indv._objectives for indv in pareto_front])
+
+    def _solutions_logs(self) -> List[List[float]]:
+        solutions = self.get_all_solutions()
+        if solutions is self.population.individuals:
+            # a view of the objectives matrix in array-backed mode
+            return self._user_objectives(self.population.all_objectives())
+        return self._user_objectives([indv._objectives for indv in solutions])
+
     def _update_logs(self, logs):
-        logs = logs or {}
-        pareto_front = [
-            indv.objectives for indv in self.get_pareto_front()]
-        logs.update({'pareto_front': pareto_front})
-        solutions = [indv.objectives for indv in self.get_all_solutions()]
-        logs.update({'solutions': solutions})
+        # pareto_front and solutions are only computed if a callback reads them
+        if not isinstance(logs, LazyLogs):
+            logs = LazyLogs(logs)
+        logs.set_lazy('pareto_front', self._pareto_front_logs)
+        logs.set_lazy('solutions', self._solutions_logs)
         return logs
 
     def compute_objectives(self, population: List[Individual]) -> List[Individual]:
-        ret = list()
+        if self.objectives is None:
+            raise ValueError(
+                f"Engine has no registered objective functions")
+        # unmodified individuals keep the objectives copied from their parent
+        pending = [indv for indv in population
+                   if indv.modified or indv._objectives is None]
         # compute objectives
-        for i in range(len(population)):
-            indv = population[i]
-            if self.objectives is None:
-                raise ValueError(
-                    f"Engine has no registered objective functions")
+        values = self.evaluate_objectives(self.objectives, pending)
+        for indv, value in zip(pending, values):
             indv._coefficients = self.coefficients
-            indv._objectives = list()
-            for objective in self.objectives:
-                indv._objectives.append(objective(indv))
-            ret.append(indv)
-        return ret
-
+            indv._objectives = list(value)
+            indv.modified = False
+        return list(population)
 
-    def minimize_objective(self, fn):
+    def minimize_objective(self, fn=None, batch: bool = False, n_objectives: int = 1):
         """
             register objective function
+
+            fn can be an `async def` function,
+            async objectives of a batch are awaited concurrently
+
+            :param batch: if True, fn receives the genes of all individuals
+                to evaluate as a 2-D ndarray (one row per individual)
+                and returns a 1-D array, or a 2-D array with n_objectives columns
+            :param n_objectives: number of objectives returned by a batched fn
         """
+        if fn is None:
+            return lambda fn: self.minimize_objective(fn, batch=batch, n_objectives=n_objectives)
+        if batch:
+            self.objectives = self.objectives or []
+            self.coefficients = self.coefficients or []
+            self.objectives.append(self._batch_objective(fn, 1, n_objectives))
+            self.coefficients.extend([1] * n_objectives)
+            return
+        if inspect.iscoroutinefunction(fn):
+            self.objectives = self.objectives or []
+            self.coefficients = self.coefficients or []
+            self.objectives.append(self._async_objective(fn, 1))
+            self.coefficients.append(1)
+            return
+
         @wraps(fn)
         def _fn_minimization_with_objective_check(indv):
             '''
@@ -125,10 +200,33 @@ class MultiObjectiveEngine(GeneticEngine):
             self.objectives.append(_fn_minimization_with_objective_check)
             self.coefficients.append(1)
 
-    def maximize_objective(self, fn):
+    def maximize_objective(self, fn=None, batch: bool = False, n_objectives: int = 1):
         """
             register maximization of objective function
+
+            fn can be an `async def` function,
+            async objectives of a batch are awaited concurrently
+
+            :param batch: if True, fn receives the genes of all individuals
+                to evaluate as a 2-D ndarray (one row per individual)
+                and returns a 1-D array, or a 2-D array with n_objectives columns
+            :param n_objectives: number of objectives returned by a batched fn
         """
+        if fn is None:
+            return lambda fn: self.maximize_objective(fn, batch=batch, n_objectives=n_objectives)
+        if batch:
+            self.objectives = self.objectives or []
+            self.coefficients = self.coefficients or []
+            self.objectives.append(self._batch_objective(fn, -1, n_objectives))
+            self.coefficients.extend([-1] * n_objectives)
+            return
+        if inspect.iscoroutinefunction(fn):
+            self.objectives = self.objectives or []
+            self.coefficients = self.coefficients or []
+            self.objectives.append(self._async_objective(fn, -1))
+            self.coefficients.append(-1)
+            return
+
         @wraps(fn)
         def _fn_maximization_with_objective_check(indv):
             '''
@@ -16,6 +16,7 @@ from geneticpython.core.operators import Replacement, RankReplacement, Tournamen
 from geneticpython.engines.geneticengine import GeneticEngine
 from geneticpython.callbacks import CallbackList, Callback, History
 from geneticpython.engines.multi_objective.multi_objective_engine import MultiObjectiveEngine, is_dominated
+from geneticpython.engines.evaluators import Evaluator
 from geneticpython.utils.validation import check_random_state
 
 import random
@@ -48,7 +49,12 @@ class NSGAIIEngine(MultiObjectiveEngine):
                  callbacks: List[Callback] = None,
                  generations: int = 100,
                  random_state: int = None,
-                 crowded_comparator: Callable[[Individual, Individual], int] = None):
+                 crowded_comparator: Callable[[Individual, Individual], int] = None,
+                 evaluator: Union[str, Evaluator] = None,
+                 n_jobs: int = None,
+                 cache_size: int = None,
+                 reproduction_n_jobs: int = None,
+                 rng_buffer_size: int = None):
 
         replacement = RankReplacement()
         selection = TournamentSelection(tournament_size)
@@ -63,7 +69,12 @@ class NSGAIIEngine(MultiObjectiveEngine):
                                            replacement=replacement,
                                            callbacks=callbacks,
                                            generations=generations,
-                                           random_state=random_state)
+                                           random_state=random_state,
+                                           evaluator=evaluator,
+                                           n_jobs=n_jobs,
+                                           cache_size=cache_size,
+                                           reproduction_n_jobs=reproduction_n_jobs,
+                                           rng_buffer_size=rng_buffer_size)
 
 
     @staticmethod
@@ -207,8 +218,16 @@ class NSGAIIEngine(MultiObjectiveEngine):
             random_state=self.random_state)
         return new_population
 
-    def run(self, generations: int = None) -> History:
-        return super(NSGAIIEngine, self).run(generations)
+    def run(self, generations: int = None,
+            max_time: float = None,
+            max_evaluations: int = None,
+            target_objective: Union[float, List[float]] = None,
+            stagnation: int = None) -> History:
+        return super(NSGAIIEngine, self).run(generations,
+                                             max_time=max_time,
+                                             max_evaluations=max_evaluations,
+                                             target_objective=target_objective,
+                                             stagnation=stagnation)
 
     def get_pareto_front(self) -> Pareto:
         pareto_front = list()
@@ -220,6 +239,12 @@ class NSGAIIEngine(MultiObjectiveEngine):
                 raise ValueError(f"Cannot get nondominated_rank from individuals\
                                  The engine has not run yet")
 
+        n = len(pareto_front)
+        if self.population.array_backed and \
+                all(indv is other for indv, other in zip(pareto_front, self.population.individuals)):
+            # the first front is a prefix of the sorted population, slice its objectives matrix,
+            # copied since the matrix is overwritten when the next population is packed
+            return Pareto(pareto_front, objectives=self.population.objectives[:n].copy())
         return Pareto(pareto_front)
 
 
@@ -0,0 +1,178 @@
+"""
+File: steady_state_nsgaii_engine.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Steady-state NSGA-II with incremental non-dominated sorting
+"""
+
+from __future__ import absolute_import
+
+from typing import List, Union, Callable
+
+from geneticpython.core import Individual, Population
+from geneticpython.core.operators import Crossover, Mutation
+from geneticpython.callbacks import Callback
+from geneticpython.engines.multi_objective.multi_objective_engine import is_dominated
+from geneticpython.engines.multi_objective.nsgaiiengine import NSGAIIEngine
+from geneticpython.engines.steady_state import SteadyStateMixin
+from geneticpython.engines.evaluators import Evaluator
+
+import itertools
+
+
+class SteadyStateNSGAIIEngine(SteadyStateMixin, NSGAIIEngine):
+    """
+        Steady-state NSGA-II: each step produces offspring_size children and
+        inserts them one by one into the non-dominated fronts (evaluation hooks).
+
+        Fronts are updated incrementally (Efficient Non-domination Level Update):
+        a child goes to the first front where no member dominates it, members of
+        that front it dominates move down one front, pushing the members they
+        dominate further down, and so on. The worst individuals, the least crowded
+        ones of the last front, are then removed one at a time (replacement hooks).
+        Crowding distances are only recomputed on the fronts that changed.
+
+        Callbacks see "virtual generations" of steps_per_generation steps:
+        on_generation_begin/end fire at their boundaries, while
+        selection, reproduction, compute_objectives, evaluation and
+        replacement hooks fire at every step.
+
+        params:
+        :offspring_size: number of children produced at each step
+        :steps_per_generation: steps in a virtual generation,
+            by default population.size // offspring_size,
+            i.e. as many children as a generational engine
+    """
+
+    def __init__(self, population: Population,
+                 objectives: List[Callable[[Individual], Union[float, int]]] = None,
+                 tournament_size: int = 2,
+                 offspring_size: int = 2,
+                 crossover: Crossover = None,
+                 mutation: Mutation = None,
+                 callbacks: List[Callback] = None,
+                 generations: int = 100,
+                 steps_per_generation: int = None,
+                 random_state: int = None,
+                 crowded_comparator: Callable[[Individual, Individual], int] = None,
+                 evaluator: Union[str, Evaluator] = None,
+                 n_jobs: int = None,
+                 cache_size: int = None,
+                 reproduction_n_jobs: int = None,
+                 rng_buffer_size: int = None):
+
+        self._init_steady_state(population, offspring_size, steps_per_generation)
+        self.fronts = []
+        self._touched = set()
+
+        super(SteadyStateNSGAIIEngine, self).__init__(population=population,
+                                                      objectives=objectives,
+                                                      tournament_size=tournament_size,
+                                                      selection_size=offspring_size,
+                                                      crossover=crossover,
+                                                      mutation=mutation,
+                                                      callbacks=callbacks,
+                                                      generations=generations,
+                                                      random_state=random_state,
+                                                      crowded_comparator=crowded_comparator,
+                                                      evaluator=evaluator,
+                                                      n_jobs=n_jobs,
+                                                      cache_size=cache_size,
+                                                      reproduction_n_jobs=reproduction_n_jobs,
+                                                      rng_buffer_size=rng_buffer_size)
+
+    def do_evaluation(self, population: List[Individual]) -> List[Individual]:
+        """
+            full non-dominated sorting, only once after initialization
+        """
+        population = NSGAIIEngine.sort(population, self.random_state)
+        self.fronts = []
+        for indv in population:
+            if indv.nondominated_rank == len(self.fronts):
+                self.fronts.append([])
+            self.fronts[indv.nondominated_rank].append(indv)
+        return population
+
+    def _restore_population(self, individuals: List[Individual]) -> List[Individual]:
+        """
+            rebuild the fronts from the saved ranks, without sorting again
+        """
+        self.fronts = [[] for _ in range(max(indv.nondominated_rank for indv in individuals) + 1)]
+        for indv in individuals:
+            self.fronts[indv.nondominated_rank].append(indv)
+        return individuals
+
+    def _update_crowding_distance(self, rank: int):
+        front = self.fronts[rank]
+        crowding_distance = NSGAIIEngine.calc_crowding_distance(list(front))
+        for indv in front:
+            indv.nondominated_rank = rank
+            indv.crowding_distance = crowding_distance[indv]
+
+    def insert(self, indv: Individual) -> List[int]:
+        """
+            insert indv into the fronts
+
+            :return: ranks of the fronts that changed
+        """
+        rank = 0
+        while rank < len(self.fronts) and \
+                any(is_dominated(other, indv) for other in self.fronts[rank]):
+            rank += 1
+
+        touched = []
+        moved = [indv]
+        while moved:
+            if rank == len(self.fronts):
+                self.fronts.append(moved)
+                touched.append(rank)
+                break
+            front = self.fronts[rank]
+            dominated = [other for other in front
+                         if any(is_dominated(m, other) for m in moved)]
+            if dominated:
+                dominated_ids = set(id(other) for other in dominated)
+                front = [other for other in front if id(other) not in dominated_ids]
+            self.fronts[rank] = front + moved
+            touched.append(rank)
+            moved = dominated
+            rank += 1
+        return touched
+
+    def remove_worst(self) -> Individual:
+        """
+            remove the least crowded individual of the last front
+        """
+        last = len(self.fronts) - 1
+        self._update_crowding_distance(last)
+        front = self.fronts[last]
+        self.random_state.shuffle(front)
+        worst = min(front, key=lambda indv: indv.crowding_distance)
+        front.remove(worst)
+        if len(front) == 0:
+            self.fronts.pop()
+        return worst
+
+    def update_ranking(self, offspring: List[Individual]) -> List[Individual]:
+        """
+            insert each offspring into the fronts
+        """
+        for indv in offspring:
+            self._touched.update(self.insert(indv))
+        return list(itertools.chain.from_iterable(self.fronts))
+
+    def do_replacement(self, new_population: List[Individual]) -> List[Individual]:
+        """
+            remove the worst individuals until the population has its size,
+            then update the crowding distances of the fronts that changed
+        """
+        touched = self._touched
+        for _ in range(len(new_population) - self.population.size):
+            self.remove_worst()
+            touched.add(len(self.fronts) - 1)
+        for rank in touched:
+            if rank < len(self.fronts):
+                self._update_crowding_distance(rank)
+        self._touched = set()
+        return list(itertools.chain.from_iterable(self.fronts))
@@ -0,0 +1,121 @@
+"""
+File: reproduction.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Parallel reproduction stage with one random stream per mating pair
+"""
+
+from __future__ import absolute_import
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from geneticpython.core.individual import Individual
+from geneticpython.core.operators import Crossover, Mutation
+from geneticpython.engines.evaluators.process_pool_evaluator import effective_n_jobs
+
+import multiprocessing
+import math
+import numpy as np
+
+
+# operators of the current worker process, set by the pool initializer
+_worker_operators = None
+
+
+def _init_worker(crossover, mutation):
+    global _worker_operators
+    _worker_operators = (crossover, mutation)
+
+
+def reproduce_pair(crossover: Crossover, mutation: Mutation,
+                   father: Individual, mother: Individual,
+                   seed: np.random.SeedSequence) -> List[Individual]:
+    """
+        cross a mating pair and mutate the children using a random stream
+        created from seed only, so the children do not depend on which
+        process reproduces the pair
+    """
+    random_state = np.random.Generator(np.random.PCG64(seed))
+    children = crossover.cross(father=father, mother=mother, random_state=random_state)
+    return [mutation.mutate(child, random_state=random_state) for child in children]
+
+
+def _reproduce_pair(task):
+    father, mother, seed = task
+    crossover, mutation = _worker_operators
+    return reproduce_pair(crossover, mutation, father, mother, seed)
+
+
+class ParallelReproducer():
+    """
+        Split mating pairs across a persistent pool of worker processes.
+        Each pair gets its own random stream derived from the engine seed (see RNGManager),
+        so offspring are the same whatever the number of workers.
+
+        Like ProcessPoolEvaluator, the operators are handed to the workers
+        once when the pool starts and the pool is reused across generations,
+        they must be picklable unless the start method is 'fork'.
+
+        params:
+        :n_jobs: number of worker processes, -1 uses all cpus,
+            1 reproduces in the current process with the same random streams
+        :chunksize: number of pairs sent to a worker at once,
+            by default the pairs are split in about 4 chunks per worker
+        :mp_context: multiprocessing context or start method name,
+            by default the default context of the platform
+    """
+
+    def __init__(self, n_jobs: int = -1, chunksize: int = None, mp_context=None):
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.chunksize = chunksize
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+        self._executor = None
+        self._operators = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_operators'] = None
+        return state
+
+    def _get_executor(self, crossover, mutation):
+        if self._executor is None or self._operators != (crossover, mutation):
+            self.close()
+            self._executor = ProcessPoolExecutor(max_workers=self.n_jobs,
+                                                 mp_context=self.mp_context,
+                                                 initializer=_init_worker,
+                                                 initargs=(crossover, mutation))
+            self._operators = (crossover, mutation)
+        return self._executor
+
+    def reproduce(self, crossover: Crossover, mutation: Mutation,
+                  mating_population: List[Individual],
+                  seeds: List[np.random.SeedSequence]) -> List[Individual]:
+        """
+            :param mating_population: consecutive individuals are mated
+            :param seeds: one seed per mating pair
+        """
+        tasks = [(mating_population[i], mating_population[i+1], seeds[i // 2])
+                 for i in range(0, len(mating_population), 2)]
+
+        childs = []
+        if self.n_jobs == 1 or len(tasks) <= 1:
+            for father, mother, seed in tasks:
+                childs.extend(reproduce_pair(crossover, mutation, father, mother, seed))
+            return childs
+
+        executor = self._get_executor(crossover, mutation)
+        chunksize = self.chunksize or max(int(math.ceil(len(tasks) / (self.n_jobs * 4))), 1)
+        for children in executor.map(_reproduce_pair, tasks, chunksize=chunksize):
+            childs.extend(children)
+        return childs
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._operators = None
@@ -10,3 +10,4 @@ from __future__ import absolute_import
 
 from .gaengine import GAEngine
 from .single_objective_engine import SingleObjectiveEngine
+from .steady_state_engine import SteadyStateEngine
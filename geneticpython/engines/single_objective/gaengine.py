@@ -39,8 +39,16 @@ class GAEngine(SingleObjectiveEngine):
     def do_replacement(self, new_population: List[Individual]) -> List[Individual]:
         return super(GAEngine, self).do_replacement(new_population)
 
-    def run(self, generations: int = None) -> History:
-        return super(GAEngine, self).run(generations)
+    def run(self, generations: int = None,
+            max_time: float = None,
+            max_evaluations: int = None,
+            target_objective: Union[float, List[float]] = None,
+            stagnation: int = None) -> History:
+        return super(GAEngine, self).run(generations,
+                                         max_time=max_time,
+                                         max_evaluations=max_evaluations,
+                                         target_objective=target_objective,
+                                         stagnation=stagnation)
 
 
 if __name__ == "__main__":
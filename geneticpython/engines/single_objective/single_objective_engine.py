@@ -18,6 +18,8 @@ from ...core.operators import Selection, Crossover, Mutation, Replacement
 from ...core.individual import Individual
 from ...callbacks import Callback, CallbackList
 from ...callbacks import History
+from ..evaluators import Evaluator
+import inspect
 import math
 
 
@@ -31,7 +33,12 @@ class SingleObjectiveEngine(GeneticEngine):
                  replacement: Replacement = None,
                  callbacks: List[Callback] = None,
                  generations: int = 100,
-                 random_state: int = None):
+                 random_state: int = None,
+                 evaluator: Union[str, Evaluator] = None,
+                 n_jobs: int = None,
+                 cache_size: int = None,
+                 reproduction_n_jobs: int = None,
+                 rng_buffer_size: int = None):
 
         callback_list = CallbackList(
             callbacks, add_history=True, add_progbar=True)
@@ -44,7 +51,12 @@ class SingleObjectiveEngine(GeneticEngine):
                                                     replacement=replacement,
                                                     callbacks=callback_list,
                                                     generations=generations,
-                                                    random_state=random_state)
+                                                    random_state=random_state,
+                                                    evaluator=evaluator,
+                                                    n_jobs=n_jobs,
+                                                    cache_size=cache_size,
+                                                    reproduction_n_jobs=reproduction_n_jobs,
+                                                    rng_buffer_size=rng_buffer_size)
 
     def get_best_indv(self) -> Individual:
         best_indv = min(self.population.individuals,
@@ -52,29 +64,62 @@ class SingleObjectiveEngine(GeneticEngine):
         return best_indv.clone()
 
     def _update_metrics(self):
-        self.metrics = self.metrics or OrderedDict()
+        super(SingleObjectiveEngine, self)._update_metrics()
         self.metrics['best_objective'] = self.get_best_indv().objective
 
+    def _reached_target(self, target) -> bool:
+        best = min(indv._objective for indv in self.population.individuals)
+        return best <= self.coefficient * target
+
+    def _progress_key(self):
+        if not self.population.individuals:
+            return None
+        return min(indv._objective for indv in self.population.individuals)
+
+    def _has_improved(self, previous, current) -> bool:
+        return previous is None or current < previous
+
     def _update_logs(self, logs):
         logs = logs or {}
         logs.update(self.metrics or OrderedDict())
         return logs
 
     def compute_objectives(self, population: List[Individual]) -> List[Individual]:
-        ret = list()
+        if self.objective is None:
+            raise ValueError(f"Engine has no registered objective functions")
+        # unmodified individuals keep the objective copied from their parent
+        pending = [indv for indv in population
+                   if indv.modified or indv._objective is None]
         # compute objectives
-        for indv in population:
-            if self.objective is None:
-                raise ValueError(f"Engine has no registered objective functions")
+        values = self.evaluate_objectives([self.objective], pending)
+        for indv, value in zip(pending, values):
             indv._coefficient = self.coefficient
-            indv._objective = self.objective(indv)
-            ret.append(indv)
-        return ret
+            indv._objective = value[0]
+            indv.modified = False
+        return list(population)
 
-    def minimize_objective(self, fn):
+    def minimize_objective(self, fn=None, batch: bool = False):
         """
             register objective function
+
+            fn can be an `async def` function,
+            async objectives of a batch are awaited concurrently
+
+            :param batch: if True, fn receives the genes of all individuals
+                to evaluate as a 2-D ndarray (one row per individual)
+                and returns a 1-D array of objective values
         """
+        if fn is None:
+            return lambda fn: self.minimize_objective(fn, batch=batch)
+        if batch:
+            self.objective = self._batch_objective(fn, 1)
+            self.coefficient = 1
+            return
+        if inspect.iscoroutinefunction(fn):
+            self.objective = self._async_objective(fn, 1)
+            self.coefficient = 1
+            return
+
         @wraps(fn)
         def _fn_minimization_with_objective_check(indv):
             '''
@@ -97,10 +142,28 @@ class SingleObjectiveEngine(GeneticEngine):
         self.objective = _fn_minimization_with_objective_check
         self.coefficient = 1
 
-    def maximize_objective(self, fn):
+    def maximize_objective(self, fn=None, batch: bool = False):
         """
             register maximization of objective function
+
+            fn can be an `async def` function,
+            async objectives of a batch are awaited concurrently
+
+            :param batch: if True, fn receives the genes of all individuals
+                to evaluate as a 2-D ndarray (one row per individual)
+                and returns a 1-D array of objective values
         """
+        if fn is None:
+            return lambda fn: self.maximize_objective(fn, batch=batch)
+        if batch:
+            self.objective = self._batch_objective(fn, -1)
+            self.coefficient = -1
+            return
+        if inspect.iscoroutinefunction(fn):
+            self.objective = self._async_objective(fn, -1)
+            self.coefficient = -1
+            return
+
         @wraps(fn)
         def _fn_maximization_with_objective_check(indv):
             '''
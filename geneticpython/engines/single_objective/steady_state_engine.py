@@ -0,0 +1,116 @@
+"""
+File: steady_state_engine.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Steady-state genetic algorithm with incremental replacement
+"""
+
+from __future__ import absolute_import
+
+from typing import List, Union, Callable
+from bisect import bisect_right
+
+from .single_objective_engine import SingleObjectiveEngine
+from ..steady_state import SteadyStateMixin
+from ...core.population import Population
+from ...core.operators import Selection, Crossover, Mutation, TournamentSelection
+from ...core.individual import Individual
+from ...callbacks import Callback
+from ..evaluators import Evaluator
+
+
+class SteadyStateEngine(SteadyStateMixin, SingleObjectiveEngine):
+    """
+        Steady-state genetic algorithm: each step selects a few parents,
+        produces offspring_size children and inserts them into the population,
+        which is kept sorted by objective (evaluation hooks), then the worst
+        individuals are dropped (replacement hooks). The population is never
+        re-sorted as a whole: a child's rank is found by binary search,
+        O(log N) comparisons, but inserting it into the lists is O(N),
+        a memmove of N pointers. With an array-backed population, every step
+        also repacks the (N, L) genes matrix when the population is assigned.
+
+        Callbacks see "virtual generations" of steps_per_generation steps:
+        on_generation_begin/end fire at their boundaries, while
+        selection, reproduction, compute_objectives, evaluation and
+        replacement hooks fire at every step.
+
+        params:
+        :offspring_size: number of children produced at each step
+        :steps_per_generation: steps in a virtual generation,
+            by default population.size // offspring_size,
+            i.e. as many children as a generational engine
+    """
+
+    def __init__(self, population: Population,
+                 objective: Callable[[Individual], Union[float, int]] = None,
+                 selection: Selection = None,
+                 offspring_size: int = 2,
+                 crossover: Crossover = None,
+                 mutation: Mutation = None,
+                 callbacks: List[Callback] = None,
+                 generations: int = 100,
+                 steps_per_generation: int = None,
+                 random_state: int = None,
+                 evaluator: Union[str, Evaluator] = None,
+                 n_jobs: int = None,
+                 cache_size: int = None,
+                 reproduction_n_jobs: int = None,
+                 rng_buffer_size: int = None):
+
+        self._init_steady_state(population, offspring_size, steps_per_generation)
+        selection = selection or TournamentSelection(2)
+        self._keys = []
+
+        super(SteadyStateEngine, self).__init__(population=population,
+                                                objective=objective,
+                                                selection=selection,
+                                                selection_size=offspring_size,
+                                                crossover=crossover,
+                                                mutation=mutation,
+                                                replacement=None,
+                                                callbacks=callbacks,
+                                                generations=generations,
+                                                random_state=random_state,
+                                                evaluator=evaluator,
+                                                n_jobs=n_jobs,
+                                                cache_size=cache_size,
+                                                reproduction_n_jobs=reproduction_n_jobs,
+                                                rng_buffer_size=rng_buffer_size)
+
+    def get_best_indv(self) -> Individual:
+        # the population is sorted, the best individual is the first one
+        return self.population.individuals[0].clone()
+
+    def do_evaluation(self, population: List[Individual]) -> List[Individual]:
+        """
+            sort the whole population once, after initialization
+        """
+        population = sorted(population, key=lambda indv: indv._objective)
+        self._keys = [indv._objective for indv in population]
+        return population
+
+    def _restore_population(self, individuals: List[Individual]) -> List[Individual]:
+        return self.do_evaluation(individuals)
+
+    def update_ranking(self, offspring: List[Individual]) -> List[Individual]:
+        """
+            insert each offspring at its rank,
+            offspring that are not better than the worst individual are discarded
+        """
+        individuals = list(self.population.individuals)
+        for indv in offspring:
+            pos = bisect_right(self._keys, indv._objective)
+            if pos >= self.population.size:
+                continue
+            self._keys.insert(pos, indv._objective)
+            individuals.insert(pos, indv)
+        return individuals
+
+    def do_replacement(self, new_population: List[Individual]) -> List[Individual]:
+        """
+            drop the worst individuals of the ranked new_population
+        """
+        del self._keys[self.population.size:]
+        return new_population[:self.population.size]
@@ -0,0 +1,76 @@
+"""
+File: steady_state.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Step loop shared by the steady-state engines
+"""
+
+from __future__ import absolute_import
+
+from typing import List
+
+from geneticpython.core.individual import Individual
+
+
+class SteadyStateMixin():
+    """
+        Run loop of the steady-state engines: a virtual generation is made of
+        steps_per_generation steps, each one selects offspring_size parents,
+        reproduces them, computes the objectives of the children, inserts them
+        into the ranking of the population (update_ranking, between the
+        evaluation hooks) and drops the worst individuals (do_replacement,
+        between the replacement hooks).
+
+        on_generation_begin/end fire at the boundaries of virtual generations,
+        the other hooks at every step.
+    """
+
+    def _init_steady_state(self, population, offspring_size: int, steps_per_generation: int):
+        if offspring_size <= 0 or offspring_size % 2 != 0:
+            raise ValueError('Invalid offspring_size, requires a positive even number')
+        self.offspring_size = offspring_size
+        self.steps_per_generation = steps_per_generation or max(population.size // offspring_size, 1)
+
+    def update_ranking(self, offspring: List[Individual]) -> List[Individual]:
+        """
+            insert offspring into the ranking of the population
+
+            :return: the ranked population and offspring, best first
+        """
+        raise NotImplementedError
+
+    def _run_generation(self, gen: int, logs=None):
+        self.callbacks.on_generation_begin(gen, logs=logs)
+
+        for _ in range(self.steps_per_generation):
+            self.callbacks.on_selection_begin(gen, logs=logs)
+            mating_population = self.do_selection()
+            self.callbacks.on_selection_end(gen, logs=logs)
+
+            self.callbacks.on_reproduction_begin(gen, logs=logs)
+            offspring_population = self.do_reproduction(mating_population)
+            self.callbacks.on_reproduction_end(gen, logs=logs)
+
+            self.callbacks.on_compute_objectives_begin(gen, logs=logs)
+            offspring_population = self.compute_objectives(
+                offspring_population)
+            self.callbacks.on_compute_objectives_end(gen, logs=logs)
+
+            self.callbacks.on_evaluation_begin(gen, logs=logs)
+            new_population = self.update_ranking(offspring_population)
+            self.callbacks.on_evaluation_end(gen, logs=logs)
+
+            self.callbacks.on_replacement_begin(gen, logs=logs)
+            self.population.individuals = self.do_replacement(new_population)
+            self.callbacks.on_replacement_end(gen, logs=logs)
+
+            if self.stop_running:
+                break
+
+        self.generation = gen + 1
+        self._update_metrics()
+        logs = self._update_logs(logs)
+
+        self.callbacks.on_generation_end(gen, logs=logs)
+        return logs
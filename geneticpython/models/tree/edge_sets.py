@@ -11,7 +11,6 @@ from geneticpython.core.individual import Individual, IntChromosome
 from geneticpython.models.tree.tree import Tree, KruskalTree, EdgeList, RootedTree
 from geneticpython.utils.validation import check_random_state
 from typing import Set, Tuple, List
-from copy import deepcopy
 
 import numpy as np
 
@@ -33,13 +32,6 @@ class EdgeSets(Individual):
         if init_method is not None:
             self.solution.set_initialization_method(init_method)
 
-    def clone(self):
-        number_of_vertices = self.number_of_vertices
-        solution = self.solution.clone()
-        chromosome = deepcopy(self.chromosome)
-
-        return EdgeSets(number_of_vertices, chromosome=chromosome, solution=solution)
-
     def decode(self) -> Tree:
         """decode.
 
@@ -46,6 +46,12 @@ class NetworkRandomKeys(Individual):
 
         super(NetworkRandomKeys, self).__init__(chromosome)
 
+    def _clone_attributes(self) -> dict:
+        attributes = dict(self.__dict__)
+        # potential_edges and edge_dict are shared by all clones, only the network is copied
+        attributes['network'] = self.network.clone()
+        return attributes
+
     def decode(self) -> KruskalTree:
         genes = np.copy(self.chromosome.genes)
         order = np.argsort(-genes)
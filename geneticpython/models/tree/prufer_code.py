@@ -11,7 +11,6 @@ from geneticpython.core.individual.chromosome import IntChromosome
 from geneticpython.core.individual import Individual
 from geneticpython.models.tree.tree import Tree
 from geneticpython.models.int_individual import IntIndividual
-from copy import deepcopy
 
 class PruferCode(Individual):
     """PruferCode.
@@ -29,13 +28,6 @@ class PruferCode(Individual):
             raise ValueError('number_of_vertices is conflict in argument and solution')
 
 
-    def clone(self):
-        number_of_vertices = self.number_of_vertices
-        solution = self.solution.clone()
-        chromosome = deepcopy(self.chromosome)
-
-        return PruferCode(number_of_vertices, chromosome=chromosome, solution=solution)
-
     def decode(self):
         """decode.
             Decode prufer code to Tree in linear time O(n)
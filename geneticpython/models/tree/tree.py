@@ -9,6 +9,7 @@ from __future__ import absolute_import
 
 from geneticpython.core.individual import Solution
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 from geneticpython.utils import rset
 from typing import Callable
 from copy import deepcopy
@@ -63,7 +64,10 @@ class Tree(Solution):
         self.edges = list()
 
     def clone(self):
-        return deepcopy(self)
+        # potential edges are never modified in place, the clone shares them
+        memo = {id(self.potential_edges): self.potential_edges,
+                id(self.potential_adj): self.potential_adj}
+        return deepcopy(self, memo)
 
     def get_adjacency(self, edges=None):
         __edges = edges or self.edges
@@ -102,7 +106,7 @@ class Tree(Solution):
         if self.root is not None:
             root = self.root
         else:
-            random_state.randint(0, self.number_of_vertices)
+            rng_integers(random_state, 0, self.number_of_vertices)
 
         self.initialize()
         if len(self.edges) != 0:
@@ -138,7 +142,7 @@ class Tree(Solution):
         if self.root is not None:
             root = self.root
         else:
-            random_state.randint(0, self.number_of_vertices)
+            rng_integers(random_state, 0, self.number_of_vertices)
 
         self.initialize()
         if len(self.edges) != 0:
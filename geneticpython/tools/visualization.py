@@ -9,7 +9,7 @@ Description:
 from __future__ import absolute_import
 
 from typing import List, Union, Dict, Tuple
-from geneticpython.callbacks import History
+from geneticpython.callbacks import History, HistoryReader
 from geneticpython.core.pareto import Pareto
 from geneticpython.utils.typing import SimplePareto
 
@@ -201,18 +201,21 @@ def plot_single_objective_history(history_dict: Dict[str, Union[History, List[Un
                                   show=True,
                                   **kwargs):
     history_dict.update(kwargs)
+    generations = {}
     for name, history in history_dict.items():
         if isinstance(history, History):
             if not all('best_objective' in data for data in history.history):
                 raise ValueError('plot_single_objective_history only supports single objective history.\
                                  The best_objective logs is required')
+            # a retention policy may not keep every generation
+            generations[name] = history.generations
             history_dict[name] = [logs['best_objective']
                                   for logs in history.history]
     plt.figure()
     legends = []
     for name, history in history_dict.items():
         legends.append(name)
-        gen = [i for i in range(len(history))]
+        gen = generations.get(name, [i for i in range(len(history))])
         plt.plot(gen, history)
 
     plt.xlabel('generation')
@@ -228,13 +231,22 @@ def plot_single_objective_history(history_dict: Dict[str, Union[History, List[Un
     plt.close('all')
 
 
-def save_history_as_gif(history: History,
+def save_history_as_gif(history: Union[History, HistoryReader, str],
                         title='solutions',
                         referenced_points=None,
                         objective_name: List[str] = ['obj1', 'obj2'],
                         gen_filter=lambda x: True,
                         out_dir='./'):
-    for data in history.history:
+    """
+        history can be a History, a StreamingHistory, or the logs of a history
+        (history.history, a HistoryReader or the path of the file written by a StreamingHistory),
+        the logs of a StreamingHistory are read one generation at a time
+    """
+    if isinstance(history, str):
+        history = HistoryReader(history)
+    entries = history.history if isinstance(history, History) else history
+
+    for data in entries:
         if 'pareto_front' not in data or 'solutions' not in data:
             raise ValueError('save_history_as_gif only supports multiobjective history.\
                              it requires pareto_front and solutions logs in each generation')
@@ -246,7 +258,7 @@ def save_history_as_gif(history: History,
     xmax = -float('inf')
     ymin = float('inf')
     ymax = -float('inf')
-    for gen, data in enumerate(history.history):
+    for gen, data in enumerate(entries):
         xmin = min( [xmin] + 
             [solution[0] for solution in (data['pareto_front'] + data['solutions']) if solution[0] != -float('inf')])
         xmax = max( [xmax] +
@@ -282,7 +294,7 @@ def save_history_as_gif(history: History,
     xlim = [xmin, xmax] if abs(xmin) != float('inf') and abs(xmax) != float('inf') else None
     ylim = [ymin, ymax] if abs(ymin) != float('inf') and abs(ymax) != float('inf') else None
     
-    for gen, data in enumerate(history.history):
+    for gen, data in enumerate(entries):
         if gen_filter(gen):
             gen_str = (3 - len(str(gen))) * '0' + str(gen)
             gen_title = title + ' ' + str(gen)
@@ -0,0 +1,170 @@
+"""
+File: rng.py
+Author: ngocjr7
+Email: ngocjr7@gmail.com
+Github: https://github.com/ngocjr7
+Description: Independent random streams spawned from one seed
+"""
+
+from __future__ import absolute_import
+
+from typing import List
+
+from geneticpython.utils.validation import check_seed_sequence
+
+import numpy as np
+
+
+def rng_integers(random_state, low, high=None, size=None):
+    """
+        Draw integers in [low, high) from a RandomState or a Generator,
+        Generator has `integers` where RandomState has `randint`
+    """
+    if isinstance(random_state, np.random.Generator):
+        return random_state.integers(low, high, size=size)
+    return random_state.randint(low, high, size=size)
+
+
+class RNGManager():
+    """
+        Hand out independent np.random.Generator (PCG64) streams derived from
+        one np.random.SeedSequence.
+
+        A stream is identified by a key of non-negative ints (or names of the domains below),
+        the same seed and key always give the same stream whatever the order in which
+        streams are requested, so work can be split across any number of workers,
+        islands or individual slots and stay reproducible.
+
+        params:
+        :seed: None, int, RandomState, Generator or SeedSequence, see check_seed_sequence
+    """
+
+    DOMAINS = {'reproduction': 0, 'worker': 1, 'island': 2, 'slot': 3}
+
+    def __init__(self, seed=None):
+        self.seed_sequence = check_seed_sequence(seed)
+
+    def _key(self, key):
+        return tuple(self.DOMAINS[k] if isinstance(k, str) else int(k) for k in key)
+
+    def seed(self, *key) -> np.random.SeedSequence:
+        """
+            the SeedSequence of the stream identified by key
+        """
+        return np.random.SeedSequence(self.seed_sequence.entropy,
+                                      spawn_key=self.seed_sequence.spawn_key + self._key(key),
+                                      pool_size=self.seed_sequence.pool_size)
+
+    def generator(self, *key) -> np.random.Generator:
+        """
+            a new Generator for the stream identified by key
+        """
+        return np.random.Generator(np.random.PCG64(self.seed(*key)))
+
+    def spawn_seeds(self, n: int, *key) -> List[np.random.SeedSequence]:
+        """
+            the seeds of n streams keyed key + (i,)
+        """
+        return [self.seed(*key, i) for i in range(n)]
+
+    def spawn(self, n: int, *key) -> List[np.random.Generator]:
+        """
+            n independent Generators keyed key + (i,)
+        """
+        return [np.random.Generator(np.random.PCG64(seed)) for seed in self.spawn_seeds(n, *key)]
+
+    def worker_streams(self, n_workers: int, *key) -> List[np.random.Generator]:
+        return self.spawn(n_workers, 'worker', *key)
+
+    def island_streams(self, n_islands: int, *key) -> List[np.random.Generator]:
+        return self.spawn(n_islands, 'island', *key)
+
+    def slot_streams(self, n_slots: int, *key) -> List[np.random.Generator]:
+        return self.spawn(n_slots, 'slot', *key)
+
+
+class BufferedRandomState(np.random.RandomState):
+    """
+        A RandomState that pre-draws uniforms in large blocks and serves
+        random, uniform, randint and rand from the buffer, so operators that
+        draw one number at a time in Python loops do not cross into numpy
+        for every draw. The other methods (choice, shuffle, permutation, ...)
+        draw from the underlying bit generator as usual.
+
+        Integers are made by scaling buffered uniforms, the bias is at most
+        (high - low) / 2**53.
+
+        params:
+        :seed: None, int, RandomState or Generator, an existing RandomState or Generator
+            shares its bit generator with the buffered instance
+        :buffer_size: number of uniforms drawn at once
+    """
+
+    def __init__(self, seed=None, buffer_size: int = 4096):
+        if buffer_size <= 0:
+            raise ValueError('Invalid buffer_size, requires buffer_size > 0')
+        if isinstance(seed, np.random.RandomState):
+            seed = seed._bit_generator
+        elif isinstance(seed, np.random.Generator):
+            seed = seed.bit_generator
+        super(BufferedRandomState, self).__init__(seed)
+        self.buffer_size = buffer_size
+        self._buffer = np.empty(0)
+        self._position = 0
+
+    def __reduce__(self):
+        return (BufferedRandomState, (self._bit_generator, self.buffer_size),
+                (self._buffer, self._position))
+
+    def __setstate__(self, state):
+        self._buffer, self._position = state
+
+    def refill(self, n: int = None):
+        """
+            pre-draw a new block of at least n uniforms,
+            the uniforms left in the current block are kept first
+        """
+        n = max(n or 0, self.buffer_size)
+        left = self._buffer[self._position:]
+        self._buffer = np.concatenate([left, self.random_sample(n)])
+        self._position = 0
+
+    def _take(self, size):
+        if size is None:
+            if self._position >= len(self._buffer):
+                self.refill()
+            value = self._buffer[self._position]
+            self._position += 1
+            return float(value)
+
+        n = int(np.prod(size))
+        if self._position + n > len(self._buffer):
+            self.refill(n)
+        values = self._buffer[self._position:self._position + n]
+        self._position += n
+        return values.reshape(size)
+
+    def random(self, size=None):
+        return self._take(size)
+
+    def rand(self, *args):
+        return self._take(args or None)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        if np.ndim(low) or np.ndim(high):
+            low, high = np.asarray(low, dtype=float), np.asarray(high, dtype=float)
+            size = np.broadcast(low, high).shape if size is None else size
+        return low + (high - low) * self._take(size)
+
+    def randint(self, low, high=None, size=None, dtype=int):
+        if high is None:
+            low, high = 0, low
+        if np.ndim(low) or np.ndim(high):
+            low, high = np.asarray(low), np.asarray(high)
+            size = np.broadcast(low, high).shape if size is None else size
+        if np.any(high <= low):
+            raise ValueError('low >= high')
+        values = np.floor(self._take(size) * (high - low)) + low
+        if np.ndim(values) == 0:
+            return int(values)
+        return values.astype(dtype)
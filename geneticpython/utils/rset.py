@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 from geneticpython.utils.validation import check_random_state
+from geneticpython.utils.rng import rng_integers
 
 from typing import Iterable
 from copy import deepcopy
@@ -76,7 +77,7 @@ class rset():
 
     def pop(self, random_state=None):
         random_state = check_random_state(random_state)
-        index = random_state.randint(0, len(self.__arr))
+        index = rng_integers(random_state, 0, len(self.__arr))
         self.remove(self.__arr[index])
         
     def clear(self):
@@ -89,7 +90,7 @@ class rset():
 
     def random_choice(self, random_state=None):
         random_state = check_random_state(random_state)
-        index = random_state.randint(0, len(self.__arr))
+        index = rng_integers(random_state, 0, len(self.__arr))
         return self.__arr[index]
 
     def copy(self):
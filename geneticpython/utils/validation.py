@@ -7,25 +7,62 @@ import numpy as np
 import random
 
 
+# RandomState used when no seed is given, created on first use
+_random_state = None
+
+
 def check_random_state(seed):
-    """Turn seed into a np.random.RandomState instance
+    """Turn seed into a np.random.RandomState or np.random.Generator instance
     Parameters
     ----------
-    seed : None, int or instance of RandomState
-        If seed is None, return the RandomState singleton used by np.random.
+    seed : None, int, instance of RandomState or instance of Generator
+        If seed is None, return the RandomState singleton of geneticpython,
+        seeded from the os (not the global one used by np.random).
         If seed is an int, return a new RandomState instance seeded with seed.
-        If seed is already a RandomState instance, return it.
+        If seed is already a RandomState or a Generator instance, return it.
         Otherwise raise ValueError.
     """
+    global _random_state
     if seed is None or seed is np.random:
-        return np.random.RandomState()
-    if isinstance(seed, int):
+        if _random_state is None:
+            _random_state = np.random.RandomState()
+        return _random_state
+    if isinstance(seed, (int, np.integer)):
         return np.random.RandomState(seed)
-    if isinstance(seed, np.random.RandomState):
+    if isinstance(seed, (np.random.RandomState, np.random.Generator)):
         return seed
     raise ValueError('%r cannot be used to seed a numpy.random.RandomState'
                      ' instance' % seed)
 
+def check_seed_sequence(seed):
+    """Turn seed into a np.random.SeedSequence instance
+    Parameters
+    ----------
+    seed : None, int, instance of RandomState, Generator or SeedSequence
+        If seed is None, return a SeedSequence with fresh entropy from the os.
+        If seed is an int, return a SeedSequence with seed as entropy.
+        If seed is a Generator, return the SeedSequence of its bit generator
+        when it has one, otherwise draw the entropy from seed.
+        If seed is a RandomState, draw the entropy from seed.
+        If seed is already a SeedSequence instance, return it.
+        Otherwise raise ValueError.
+    """
+    if seed is None or seed is np.random:
+        return np.random.SeedSequence()
+    if isinstance(seed, (int, np.integer)):
+        return np.random.SeedSequence(int(seed))
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        seed_seq = getattr(seed.bit_generator, 'seed_seq', None)
+        if isinstance(seed_seq, np.random.SeedSequence):
+            return seed_seq
+        return np.random.SeedSequence(seed.integers(0, 2**32, size=4).tolist())
+    if isinstance(seed, np.random.RandomState):
+        return np.random.SeedSequence(seed.randint(0, 2**32, size=4, dtype=np.uint64).tolist())
+    raise ValueError('%r cannot be used to seed a numpy.random.SeedSequence'
+                     ' instance' % seed)
+
 def check_simple_pareto(*args):
     """check_simple_pareto.
         Turn simple pareto into ndarry instance
@@ -0,0 +1,67 @@
+from geneticpython.callbacks import Callback, CallbackList, History, CheckpointCallback
+import unittest
+from factories import sphere_engine
+
+
+class GenerationEnd(Callback):
+    def __init__(self):
+        super(GenerationEnd, self).__init__()
+        self.gens = []
+
+    def on_generation_end(self, gen, logs=None):
+        self.gens.append(gen)
+
+
+class LastGeneration(Callback):
+    def on_generation_end(self, gen, logs=None):
+        logs['last_generation'] = gen
+
+
+class TestCallbackList(unittest.TestCase):
+    def test_only_overridden_hooks_are_dispatched(self):
+        callback = GenerationEnd()
+        callback_list = CallbackList([Callback(), callback])
+        self.assertEqual(callback_list._hooks['on_generation_end'], [callback.on_generation_end])
+        self.assertEqual(callback_list._hooks['on_generation_begin'], [])
+
+        callback_list.on_generation_begin(0)
+        callback_list.on_generation_end(0)
+        self.assertEqual(callback.gens, [0])
+
+    def test_append_remove_and_instance_hooks(self):
+        history = History()
+        callback_list = CallbackList([history], add_history=True)
+        self.assertIs(callback_list._history, history)
+        self.assertEqual(callback_list._hooks['on_generation_end'], [history.on_generation_end])
+        callback_list.remove(history)
+
+        callback = GenerationEnd()
+        callback_list.append(callback)
+        callback_list.on_generation_end(1, logs={})
+        self.assertEqual(callback.gens, [1])
+        callback_list.remove(callback)
+        callback_list.on_generation_end(2, logs={})
+        self.assertEqual(callback.gens, [1])
+
+        other = Callback()
+        calls = []
+        other.on_selection_begin = lambda gen, logs=None: calls.append(gen)
+        callback_list.callbacks.append(other)
+        callback_list.update_hooks()
+        callback_list.on_selection_begin(3)
+        self.assertEqual(calls, [3])
+
+    def test_history_records_logs_of_the_generation(self):
+        history = sphere_engine(callbacks=[LastGeneration()]).run(3)
+        self.assertEqual([logs.get('last_generation') for logs in history.history], [None, 0, 1, 2])
+
+    def test_checkpoint_is_dispatched_after_history(self):
+        checkpoint = CheckpointCallback('unused.npz')
+        callback_list = CallbackList([checkpoint], add_history=True)
+        self.assertIs(callback_list.callbacks[-1], callback_list._history)
+        self.assertEqual(callback_list._hooks['on_generation_end'],
+                         [callback_list._history.on_generation_end, checkpoint.on_generation_end])
+
+
+if __name__ == '__main__':
+    unittest.main()
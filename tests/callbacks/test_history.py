@@ -0,0 +1,65 @@
+from geneticpython.callbacks import StreamingHistory, HistoryReader, CheckpointCallback
+from geneticpython.tools.visualization import save_history_as_gif
+import unittest
+import tempfile
+import shutil
+import pickle
+import os
+from factories import zdt1_engine
+
+
+class TestStreamingHistory(unittest.TestCase):
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.path = os.path.join(self.dirpath, 'history.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def test_matches_in_memory_history(self):
+        expected = zdt1_engine().run(4).history
+        history = zdt1_engine(callbacks=[StreamingHistory(self.path)]).run(4)
+        self.assertIsInstance(history, StreamingHistory)
+        self.assertIsInstance(history.history, HistoryReader)
+        self.assertEqual(len(history.history), 5)
+        self.assertEqual(list(history.history), expected)
+        self.assertEqual(history.history[-1], expected[-1])
+        self.assertEqual(history.history[1:3], expected[1:3])
+        with self.assertRaises(IndexError):
+            history.history[5]
+
+        other = pickle.loads(pickle.dumps(history.history))
+        self.assertEqual(list(other), expected)
+
+    def test_reader_indexes_new_lines(self):
+        with open(self.path, 'w') as f:
+            f.write('{"a": 1}\n')
+        reader = HistoryReader(self.path)
+        self.assertEqual(list(reader), [{'a': 1}])
+        with open(self.path, 'a') as f:
+            f.write('{"a": 2}\n{"a": 3')
+        self.assertEqual(list(reader), [{'a': 1}, {'a': 2}])
+        self.assertEqual(len(HistoryReader(self.path, size=3)), 0)
+        self.assertEqual(len(HistoryReader(os.path.join(self.dirpath, 'missing.jsonl'))), 0)
+
+    def test_resume_truncates_to_checkpoint(self):
+        checkpoint = os.path.join(self.dirpath, 'checkpoint.npz')
+        full = zdt1_engine().run(6).history
+
+        engine = zdt1_engine(callbacks=[StreamingHistory(self.path),
+                                        CheckpointCallback(checkpoint, every_n_generations=3)])
+        engine.run(5)
+        self.assertEqual(len(engine.history.history), 6)
+
+        resumed = zdt1_engine(callbacks=[StreamingHistory(self.path, resume=True)])
+        history = resumed.resume(checkpoint, generations=6)
+        self.assertEqual(list(history.history), full)
+
+    def test_save_history_as_gif(self):
+        zdt1_engine(callbacks=[StreamingHistory(self.path)]).run(2)
+        save_history_as_gif(self.path, out_dir=self.dirpath)
+        self.assertTrue(os.path.exists(os.path.join(self.dirpath, 'solutions.gif')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+from geneticpython.callbacks import Callback, History, LazyLogs, ParetoDelta
+import unittest
+import copy
+import pickle
+from factories import nsgaii_engine, zdt1_f1, zdt1_f2
+
+
+class ComputedKeys(Callback):
+    def __init__(self):
+        super(ComputedKeys, self).__init__()
+        self.computed = []
+
+    def on_generation_end(self, gen, logs=None):
+        self.computed.append([key for key in ['pareto_front', 'solutions'] if logs.is_computed(key)])
+
+
+def mixed_zdt1_engine(**kwargs):
+    """
+        ZDT1 with f2 maximized as -f2
+    """
+    engine = nsgaii_engine(**kwargs)
+    engine.minimize_objective(zdt1_f1, batch=True)
+    engine.maximize_objective(lambda genes: -zdt1_f2(genes), batch=True)
+    return engine
+
+
+class TestLazyLogs(unittest.TestCase):
+    def test_mapping(self):
+        calls = []
+        logs = LazyLogs({'best_objective': 1.0})
+        logs.set_lazy('front', lambda: calls.append(1) or [[1.0, 2.0]])
+        self.assertEqual(list(logs), ['best_objective', 'front'])
+        self.assertFalse(logs.is_computed('front'))
+        self.assertIn('<lazy>', repr(logs))
+        self.assertEqual(logs['front'], [[1.0, 2.0]])
+        self.assertEqual(logs['front'], [[1.0, 2.0]])
+        self.assertEqual(calls, [1])
+
+        logs.set_lazy('front', lambda: [[3.0, 4.0]])
+        snapshot = copy.deepcopy(logs)
+        self.assertIs(type(snapshot), dict)
+        self.assertEqual(snapshot, {'best_objective': 1.0, 'front': [[3.0, 4.0]]})
+        self.assertEqual(pickle.loads(pickle.dumps(logs)), snapshot)
+        del logs['front']
+        self.assertEqual(len(logs), 1)
+
+    def test_engine_logs_are_computed_on_access(self):
+        computed = ComputedKeys()
+        engine = mixed_zdt1_engine(callbacks=[computed])
+        engine.callbacks.remove(engine.callbacks._history)
+        engine.run(3)
+        self.assertEqual(computed.computed, [[], [], []])
+
+        computed = ComputedKeys()
+        engine = mixed_zdt1_engine(callbacks=[History(ParetoDelta()), computed])
+        engine.run(3)
+        self.assertEqual(computed.computed, [['pareto_front']] * 3)
+
+    def test_logs_match_individual_objectives(self):
+        for array_backed in [False, True]:
+            engine = mixed_zdt1_engine(array_backed=array_backed)
+            history = engine.run(3)
+            logs = history.history[-1]
+            self.assertEqual(logs['solutions'], [indv.objectives for indv in engine.population.individuals])
+            self.assertEqual(logs['pareto_front'], [indv.objectives for indv in engine.get_pareto_front()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.models.tree import PruferCode
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation, TournamentSelection, \
+    RouletteWheelReplacement, UniformCrossover, TreeMutation
+from geneticpython.core.individual import Individual
+from geneticpython.callbacks import OperatorProfiler
+from geneticpython import Population, GAEngine
+import unittest
+import tempfile
+import shutil
+import tracemalloc
+import json
+import os
+import numpy as np
+
+
+class TestOperatorProfiler(unittest.TestCase):
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def test_counts_operator_and_individual_calls(self):
+        profiler = OperatorProfiler()
+        population = Population(FloatIndividual(5, [-1, 1]), 16)
+        engine = GAEngine(population,
+                          selection=TournamentSelection(2),
+                          crossover=SBXCrossover(pc=0.9),
+                          mutation=PolynomialMutation(pm=0.2),
+                          replacement=RouletteWheelReplacement(),
+                          callbacks=[profiler],
+                          random_state=3)
+        engine.minimize_objective(lambda indv: float(np.sum(indv.chromosome.genes ** 2)))
+        engine.run(3)
+
+        self.assertIs(engine.operator_profiler, profiler)
+        calls = profiler.stats()['calls']
+        self.assertEqual(calls['TournamentSelection.select']['calls'], 3)
+        self.assertEqual(calls['SBXCrossover.cross']['calls'], 3 * 8)
+        self.assertEqual(calls['PolynomialMutation.mutate']['calls'], 3 * 16)
+        self.assertEqual(calls['RouletteWheelReplacement.replace']['calls'], 3)
+        # initialization clones the template, reproduction the parents
+        self.assertGreater(calls['FloatIndividual.clone']['calls'], 16 + 3 * 16)
+        self.assertNotIn('FloatIndividual.decode', calls)
+        self.assertEqual(profiler.stats()['allocations'], {})
+
+        # methods are restored after the run
+        self.assertNotIn('clone', FloatIndividual.__dict__)
+        self.assertFalse(hasattr(SBXCrossover.cross, '__wrapped__'))
+
+    def test_tree_decode_and_allocations(self):
+        profiler = OperatorProfiler(track_allocations=True)
+        n = 8
+        edges = [(i, j) for i in range(n) for j in range(i)]
+        population = Population(PruferCode(n), 8)
+        engine = GAEngine(population,
+                          selection=TournamentSelection(2),
+                          crossover=UniformCrossover(0.9),
+                          mutation=TreeMutation(0.3, edges),
+                          replacement=RouletteWheelReplacement(),
+                          callbacks=[profiler],
+                          random_state=3)
+
+        @engine.minimize_objective
+        def cost(indv):
+            return float(sum(u + v for u, v in indv.decode().edges))
+
+        engine.run(2)
+        stats = profiler.stats()
+        self.assertGreater(stats['calls']['PruferCode.decode']['calls'], 0)
+        self.assertIn('TreeMutation.mutate', stats['calls'])
+        for phase in ['selection', 'reproduction', 'objectives', 'replacement']:
+            self.assertEqual(stats['allocations'][phase]['calls'], 2)
+        self.assertGreater(stats['allocations']['reproduction']['allocated'], 0)
+        self.assertFalse(hasattr(PruferCode.decode, '__wrapped__'))
+
+        path = os.path.join(self.dirpath, 'profile.json')
+        profiler.dump(path)
+        with open(path) as f:
+            dumped = json.load(f)
+        self.assertEqual(dumped['calls']['PruferCode.decode']['calls'],
+                         stats['calls']['PruferCode.decode']['calls'])
+
+    def test_allocations_without_reset_peak(self):
+        # tracemalloc.reset_peak needs python 3.9
+        reset_peak = tracemalloc.__dict__.pop('reset_peak', None)
+        try:
+            profiler = OperatorProfiler(track_allocations=True)
+            population = Population(FloatIndividual(5, [-1, 1]), 16)
+            engine = GAEngine(population,
+                              selection=TournamentSelection(2),
+                              crossover=SBXCrossover(pc=0.9),
+                              mutation=PolynomialMutation(pm=0.2),
+                              replacement=RouletteWheelReplacement(),
+                              callbacks=[profiler],
+                              random_state=3)
+            engine.minimize_objective(lambda indv: float(np.sum(indv.chromosome.genes ** 2)))
+            engine.run(2)
+        finally:
+            if reset_peak is not None:
+                tracemalloc.reset_peak = reset_peak
+
+        for stats in profiler.stats()['allocations'].values():
+            self.assertEqual(stats['calls'], 2)
+            self.assertEqual(stats['allocated'], stats['retained'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation
+from geneticpython.callbacks import Callback, ProfilerCallback
+from geneticpython import Population, SteadyStateNSGAIIEngine
+import unittest
+import io
+from factories import sphere_engine, zdt1_engine
+
+
+PHASES = ['selection', 'reproduction', 'objectives', 'evaluation', 'replacement', 'other']
+
+
+class Recorder(Callback):
+    def __init__(self):
+        super(Recorder, self).__init__()
+        self.events = []
+
+    def on_reproduction_end(self, gen, logs=None):
+        self.events.append('reproduction_end')
+
+    def on_compute_objectives_begin(self, gen, logs=None):
+        self.events.append('compute_objectives_begin')
+
+    def on_compute_objectives_end(self, gen, logs=None):
+        self.events.append('compute_objectives_end')
+
+    def on_evaluation_begin(self, gen, logs=None):
+        self.events.append('evaluation_begin')
+
+
+class TestProfilerCallback(unittest.TestCase):
+    def test_compute_objectives_is_bracketed(self):
+        recorder = Recorder()
+        sphere_engine(callbacks=[recorder], delay=0.001).run(1)
+        self.assertEqual(recorder.events, ['reproduction_end', 'compute_objectives_begin',
+                                           'compute_objectives_end', 'evaluation_begin'])
+
+    def test_records_and_metrics(self):
+        out = io.StringIO()
+        profiler = ProfilerCallback(file=out)
+        engine = sphere_engine(callbacks=[profiler], delay=0.001)
+        history = engine.run(3)
+
+        self.assertEqual(len(profiler.records), 3)
+        for record in profiler.records:
+            self.assertEqual(list(record['phases']), PHASES)
+            # unchanged children keep their objectives and are not evaluated
+            self.assertLessEqual(record['n_evaluations'], 16)
+            self.assertGreaterEqual(record['wall'], sum(t['wall'] for t in record['phases'].values()) - 1e-9)
+        # the objective sleeps, objectives dominate the generation
+        self.assertGreater(profiler.records[-1]['phases']['objectives']['wall'],
+                           0.001 * profiler.records[-1]['n_evaluations'])
+
+        metrics = engine.metrics
+        self.assertAlmostEqual(sum(metrics['phase_share'].values()), 1.0, places=6)
+        self.assertGreater(metrics['phase_share']['objectives'], 0.5)
+        self.assertAlmostEqual(metrics['evaluations_per_second'],
+                               profiler.records[-1]['n_evaluations'] / metrics['generation_time'])
+        n_evaluations = sum(record['n_evaluations'] for record in profiler.records)
+        self.assertEqual(engine.n_evaluations, 16 + n_evaluations)
+
+        summary = out.getvalue()
+        for phase in PHASES:
+            self.assertIn(phase, summary)
+        self.assertIn(f'3 generations, {n_evaluations} evaluations', summary)
+
+    def test_history_records_metrics_of_its_generation(self):
+        profiler = ProfilerCallback(verbose=False)
+        history = sphere_engine(callbacks=[profiler]).run(3)
+        self.assertNotIn('generation_time', history.history[0])
+        for g in range(1, 4):
+            self.assertEqual(history.history[g]['generation_time'], profiler.records[g - 1]['wall'])
+
+        profiler = ProfilerCallback(verbose=False)
+        history = zdt1_engine(callbacks=[profiler]).run(3)
+        for g in range(1, 4):
+            self.assertEqual(history.history[g]['generation_time'], profiler.records[g - 1]['wall'])
+
+    def test_steady_state_phases_are_summed(self):
+        profiler = ProfilerCallback(verbose=False)
+        population = Population(FloatIndividual(4, [0, 1]), 8)
+        engine = SteadyStateNSGAIIEngine(population,
+                                         crossover=SBXCrossover(pc=0.9),
+                                         mutation=PolynomialMutation(pm=0.2),
+                                         callbacks=[profiler],
+                                         random_state=1)
+        engine.minimize_objective(lambda indv: float(indv.chromosome.genes[0]))
+        engine.minimize_objective(lambda indv: float(1 - indv.chromosome.genes[0] + indv.chromosome.genes[1]))
+        engine.run(2)
+        n_evaluations = [record['n_evaluations'] for record in profiler.records]
+        self.assertTrue(all(0 < n <= 8 for n in n_evaluations))
+        self.assertEqual(engine.n_evaluations, 8 + sum(n_evaluations))
+        self.assertGreater(profiler.records[0]['phases']['evaluation']['wall'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+from geneticpython.callbacks import History, KeepLast, KeepEvery, ParetoDelta
+from geneticpython.tools.visualization import plot_single_objective_history
+import unittest
+import tempfile
+import shutil
+import os
+from functools import partial
+import factories
+from factories import zdt1_engine
+
+
+sphere_engine = partial(factories.sphere_engine, maximize=True)
+
+
+class TestRetention(unittest.TestCase):
+    def test_keep_last(self):
+        full = sphere_engine().run(10).history
+        history = sphere_engine(callbacks=[History(KeepLast(3))]).run(10)
+        self.assertEqual(history.generations, [8, 9, 10])
+        self.assertEqual(list(history.history), full[-3:])
+        self.assertEqual(history.history[-1], full[-1])
+        with self.assertRaises(ValueError):
+            KeepLast(0)
+
+    def test_keep_every_thins_logarithmically(self):
+        retention = KeepEvery(1, max_size=8)
+        for generation in range(1000):
+            retention.append(generation, {'best_objective': generation})
+            self.assertLessEqual(len(retention), 8)
+        self.assertEqual(retention.generations[0], 0)
+        self.assertEqual(retention.generations[-1], 999)
+        self.assertEqual(retention.step, 256)
+        self.assertTrue(all(gen % 256 == 0 for gen in retention.generations[:-1]))
+        self.assertEqual([logs['best_objective'] for logs in retention], retention.generations)
+
+        retention = KeepEvery(3)
+        for generation in range(8):
+            retention.append(generation, {})
+        self.assertEqual(retention.generations, [0, 3, 6, 7])
+
+    def test_pareto_delta(self):
+        full = zdt1_engine().run(12).history
+        history = zdt1_engine(callbacks=[History(ParetoDelta(keyframe_every=5))]).run(12)
+        self.assertEqual(len(history.history), 13)
+        expected = [{key: value for key, value in logs.items() if key != 'solutions'} for logs in full]
+        self.assertEqual(list(history.history), expected)
+        self.assertEqual([history.history[i] for i in range(13)], expected)
+        kinds = [delta[0] for _, _, delta in history.retention._entries]
+        self.assertEqual(kinds.count('front'), 3)
+        self.assertGreater(kinds.count('same') + kinds.count('delta'), 0)
+
+        retention = ParetoDelta(keep_solutions=True)
+        retention.append(0, full[0])
+        self.assertEqual(retention[0], full[0])
+
+    def test_state_and_plot(self):
+        engine = sphere_engine(callbacks=[History(KeepEvery(2))])
+        history = engine.run(5)
+        restored = History(KeepEvery(2))
+        restored.set_state(history.get_state())
+        self.assertEqual(restored.generations, [0, 2, 4, 5])
+        self.assertEqual(restored.history, history.history)
+
+        dirpath = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(dirpath, 'history.png')
+            plot_single_objective_history({'every 2': history}, filepath=filepath, save=True, show=False)
+            self.assertTrue(os.path.exists(filepath))
+        finally:
+            shutil.rmtree(dirpath)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# test modules import the shared engine factories: from factories import ...
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
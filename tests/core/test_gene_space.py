@@ -0,0 +1,57 @@
+from geneticpython.core.individual import GeneSpace, FloatChromosome
+from geneticpython.models import FloatIndividual
+from geneticpython import Population
+import unittest
+import pickle
+import copy
+import numpy as np
+
+
+class TestGeneSpace(unittest.TestCase):
+    def test_domains(self):
+        gene_space = GeneSpace(3, [0, 2])
+        self.assertEqual(gene_space.lower_bound.tolist(), [0, 0, 0])
+        self.assertEqual(gene_space.upper_bound.tolist(), [2, 2, 2])
+
+        gene_space = GeneSpace(2, [(0, 1), (-1.5, 3)])
+        self.assertEqual(gene_space.lower_bound.tolist(), [0, -1.5])
+        self.assertEqual(gene_space.width.tolist(), [1, 4.5])
+
+        for domains in [[0, 1, 2], [(0, 1)], [(1, 0), (0, 1)], 'ab', [(0, 1), (0, 'a')]]:
+            with self.assertRaises(ValueError):
+                GeneSpace(2, domains)
+
+    def test_read_only_and_shared(self):
+        gene_space = GeneSpace(3, [0, 1])
+        with self.assertRaises(ValueError):
+            gene_space.lower_bound[0] = 1
+        self.assertIs(copy.deepcopy(gene_space), gene_space)
+        self.assertIs(copy.copy(gene_space), gene_space)
+
+        population = Population(FloatIndividual(3, [0, 1]), 4)
+        individuals = population.init_population_randomly(random_state=1)
+        spaces = set(id(indv.chromosome.gene_space) for indv in individuals)
+        self.assertEqual(spaces, {id(population.individual_temp.chromosome.gene_space)})
+
+        chromosome = FloatChromosome(3, gene_space)
+        self.assertIs(chromosome.gene_space, gene_space)
+        self.assertIs(chromosome.lower_bound, gene_space.lower_bound)
+        with self.assertRaises(ValueError):
+            FloatChromosome(4, gene_space)
+
+    def test_clip_and_contains(self):
+        gene_space = GeneSpace(2, [(0, 1), (0, 2)])
+        genes = np.array([[-1.0, 3.0], [0.5, 1.0]])
+        self.assertFalse(gene_space.contains(genes))
+        self.assertTrue(gene_space.contains(genes[1]))
+        self.assertEqual(gene_space.clip(genes).tolist(), [[0.0, 2.0], [0.5, 1.0]])
+
+    def test_pickle(self):
+        gene_space = GeneSpace(2, [(0, 1), (0, 2)])
+        other = pickle.loads(pickle.dumps(gene_space))
+        self.assertEqual(other.upper_bound.tolist(), [1, 2])
+        self.assertFalse(other.upper_bound.flags.writeable)
+
+
+if __name__ == '__main__':
+    unittest.main()
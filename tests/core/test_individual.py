@@ -0,0 +1,101 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.models.tree import PruferCode, NetworkRandomKeys
+import unittest
+import pickle
+import numpy as np
+
+
+class TestClone(unittest.TestCase):
+    def test_clone_copies_genes_and_objectives(self):
+        indv = FloatIndividual(5, [0, 1])
+        indv.random_init(random_state=1)
+        indv._objective, indv._coefficient = 2.0, -1
+        indv.modified = False
+        indv.nondominated_rank, indv.crowding_distance = 0, 1.5
+
+        clone = indv.clone()
+        self.assertIsInstance(clone, FloatIndividual)
+        self.assertEqual(clone.chromosome.genes.tolist(), indv.chromosome.genes.tolist())
+        self.assertIs(clone.chromosome.lower_bound, indv.chromosome.lower_bound)
+        self.assertEqual((clone._objective, clone._coefficient, clone.modified), (2.0, -1, False))
+        self.assertEqual((clone.nondominated_rank, clone.crowding_distance), (0, 1.5))
+
+        clone.chromosome[0] = 5.0
+        self.assertNotEqual(indv.chromosome[0], 5.0)
+        self.assertTrue(clone.modified)
+        self.assertFalse(indv.modified)
+
+    def test_clone_copies_random_state(self):
+        indv = FloatIndividual(5, [0, 1])
+        indv.set_random_state(np.random.RandomState(1))
+        clone = indv.clone()
+        self.assertIsNot(clone.random_state, indv.random_state)
+        self.assertEqual(clone.random_state.random_sample(), indv.random_state.random_sample())
+        self.assertIsNone(FloatIndividual(5, [0, 1]).clone().random_state)
+
+    def test_clone_is_copy_on_write(self):
+        indv = FloatIndividual(5, [0, 1])
+        indv.random_init(random_state=1)
+        genes = indv.chromosome.genes.tolist()
+        clones = [indv.clone(), indv.clone()]
+        self.assertTrue(all(clone.chromosome.genes is indv.chromosome.genes for clone in clones))
+        self.assertFalse(indv.chromosome.genes.flags.writeable)
+
+        clones[0].chromosome[1] = 0.5
+        writable = clones[1].chromosome.writable_genes()
+        writable[2] = 0.25
+        indv.chromosome[3] = 0.75
+        self.assertEqual(clones[0].chromosome.genes.tolist(), genes[:1] + [0.5] + genes[2:])
+        self.assertEqual(clones[1].chromosome.genes.tolist(), genes[:2] + [0.25] + genes[3:])
+        self.assertEqual(indv.chromosome.genes.tolist(), genes[:3] + [0.75] + genes[4:])
+        self.assertTrue(clones[1].modified)
+
+    def test_clone_of_a_population_row_is_copied(self):
+        matrix = np.zeros((2, 5))
+        indv = FloatIndividual(5, [0, 1])
+        indv.chromosome.genes = matrix[0]
+        clone = indv.clone()
+        matrix[0] = 1.0
+        self.assertEqual(clone.chromosome.genes.tolist(), [0.0] * 5)
+
+    def test_slots(self):
+        indv = FloatIndividual(5, [0, 1])
+        self.assertFalse(hasattr(indv.chromosome, '__dict__'))
+        self.assertNotIn('chromosome', indv.__dict__)
+        with self.assertRaises(AttributeError):
+            indv.chromosome.other = 1
+
+    def test_pickle(self):
+        indv = FloatIndividual(5, [0, 1])
+        indv.random_init(random_state=1)
+        indv._objectives, indv._coefficients = [1.0, 2.0], [1, 1]
+        indv.nondominated_rank = 3
+        other = pickle.loads(pickle.dumps(indv))
+        self.assertEqual(other.chromosome.genes.tolist(), indv.chromosome.genes.tolist())
+        self.assertEqual((other._objectives, other.nondominated_rank), ([1.0, 2.0], 3))
+
+    def test_tree_clone_shares_potential_edges(self):
+        indv = PruferCode(10)
+        indv.random_init(random_state=1)
+        indv.decode()
+        clone = indv.clone()
+        self.assertIs(clone.solution.potential_edges, indv.solution.potential_edges)
+        self.assertEqual(clone.solution.edges, indv.solution.edges)
+        clone.solution.initialize()
+        self.assertEqual(len(indv.solution.edges), 9)
+        self.assertEqual(clone.number_of_vertices, 10)
+
+    def test_network_random_keys_clone(self):
+        edges = [(i, j) for i in range(6) for j in range(i)]
+        indv = NetworkRandomKeys(6, edges, use_encode=True)
+        indv.random_init(random_state=1)
+        network = indv.decode()
+        clone = indv.clone()
+        self.assertIs(clone.potential_edges, indv.potential_edges)
+        self.assertIs(clone.edge_dict, indv.edge_dict)
+        self.assertIsNot(clone.network, network)
+        self.assertEqual(clone.decode().edges, network.edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.callbacks import Callback
+from geneticpython import Population
+import unittest
+import numpy as np
+from functools import partial
+import factories
+from factories import zdt1_engine
+
+
+sphere_engine = partial(factories.sphere_engine, maximize=True)
+
+
+class FrontRecorder(Callback):
+    def __init__(self):
+        super(FrontRecorder, self).__init__()
+        self.fronts = []
+
+    def on_generation_end(self, gen, logs=None):
+        pareto = self.engine.get_pareto_front()
+        self.fronts.append((pareto, pareto.all_objectives().tolist()))
+
+
+def state(engine):
+    return [(indv.chromosome.genes.tolist(), indv._objective, indv._objectives)
+            for indv in engine.population.individuals]
+
+
+class TestArrayBackedPopulation(unittest.TestCase):
+    def _individuals(self, n, value):
+        individuals = []
+        for i in range(n):
+            indv = FloatIndividual(4, [0, 10])
+            indv.update_genes(np.full(4, value + i, dtype=float))
+            indv._objective = float(value + i)
+            individuals.append(indv)
+        return individuals
+
+    def test_genes_are_row_views(self):
+        population = Population(FloatIndividual(4, [0, 10]), 5, array_backed=True)
+        population.individuals = self._individuals(5, 0)
+        self.assertEqual(population.genes.shape, (5, 4))
+        self.assertEqual(population.objectives.shape, (5, 1))
+        for i, indv in enumerate(population.individuals):
+            self.assertTrue(np.shares_memory(indv.chromosome.genes, population.genes))
+            self.assertTrue(np.all(population.genes[i] == i))
+
+        indv = population.individuals[2]
+        indv.chromosome[0] = 9.0
+        self.assertEqual(population.genes[2, 0], 9.0)
+        self.assertTrue(np.shares_memory(population.all_objectives(), population.objectives))
+        np.testing.assert_array_equal(population.all_objective(), np.arange(5))
+
+    def test_dropped_individuals_keep_their_genes(self):
+        population = Population(FloatIndividual(4, [0, 10]), 3, array_backed=True)
+        first = self._individuals(3, 0)
+        population.individuals = first
+        population.individuals = self._individuals(3, 3)
+        population.individuals = first[:1] + self._individuals(2, 6)
+        # the buffer first used to live in has been reused, its members got their own copy
+        self.assertEqual(first[1].chromosome.genes.tolist(), [1.0] * 4)
+        self.assertEqual(first[2].chromosome.genes.tolist(), [2.0] * 4)
+        self.assertFalse(np.shares_memory(first[1].chromosome.genes, population.genes))
+        self.assertEqual(population.genes[:, 0].tolist(), [0.0, 6.0, 7.0])
+        self.assertTrue(np.shares_memory(first[0].chromosome.genes, population.genes))
+
+    def test_variable_length_genes_are_rejected(self):
+        population = Population(FloatIndividual(4, [0, 10]), 2, array_backed=True)
+        with self.assertRaises(ValueError):
+            population.individuals = [FloatIndividual(4, [0, 10]), FloatIndividual(3, [0, 10])]
+
+    def test_ga_run_matches_list_population(self):
+        engines = [sphere_engine(array_backed=array_backed) for array_backed in [False, True]]
+        for engine in engines:
+            engine.run(5)
+        self.assertEqual(state(engines[0]), state(engines[1]))
+        np.testing.assert_array_equal(engines[1].population.objectives[:, 0],
+                                      engines[0].population.all_objective())
+
+    def test_nsgaii_pareto_front_objectives(self):
+        engines = [zdt1_engine(array_backed=array_backed) for array_backed in [False, True]]
+        for engine in engines:
+            engine.run(5)
+        self.assertEqual(state(engines[0]), state(engines[1]))
+
+        pareto = engines[1].get_pareto_front()
+        objectives = pareto.all_objectives()
+        self.assertIsInstance(objectives, np.ndarray)
+        self.assertEqual(objectives.tolist(), engines[0].get_pareto_front().all_objectives())
+
+    def test_nsgaii_pareto_front_outlives_generation(self):
+        recorder = FrontRecorder()
+        zdt1_engine(array_backed=True, callbacks=[recorder]).run(6)
+        # the objectives matrix is overwritten by the next generations, the fronts keep their values
+        for pareto, expected in recorder.fronts:
+            self.assertEqual(pareto.all_objectives().tolist(), expected)
+
+
+class TestRecycledPopulation(unittest.TestCase):
+    def test_runs_match_population_without_pool(self):
+        for make_engine in [sphere_engine, zdt1_engine]:
+            engines = [make_engine(), make_engine(recycle=True), make_engine(array_backed=True, recycle=True)]
+            for engine in engines:
+                engine.run(6)
+            self.assertEqual(state(engines[0]), state(engines[1]))
+            self.assertEqual(state(engines[0]), state(engines[2]))
+            self.assertIsNone(engines[0].population.pool)
+            self.assertGreater(engines[1].population.pool.n_reused, 0)
+            self.assertLessEqual(len(engines[1].population.pool), 2 * engines[1].population.size)
+
+    def test_release_only_drops_non_members(self):
+        population = Population(FloatIndividual(3, [0, 1]), 2, recycle=True)
+        individuals = population.init_population_randomly(random_state=1)
+        population.individuals = individuals[:1]
+        population.release(individuals + individuals[1:])
+        self.assertEqual(len(population.pool), 1)
+
+        recycled_genes = individuals[1].chromosome.genes
+        with population.pool.activate():
+            clone = individuals[0].clone()
+            self.assertIs(clone, individuals[1])
+            self.assertIs(clone.chromosome.genes, individuals[0].chromosome.genes)
+            self.assertEqual(len(population.pool), 0)
+
+            # the genes array of the reused individual is recycled by the next copy-on-write copy
+            clone.chromosome[0] = 0.5
+        self.assertIs(clone.chromosome.genes, recycled_genes)
+        self.assertEqual(clone.chromosome.genes[1:].tolist(), individuals[0].chromosome.genes[1:].tolist())
+        self.assertEqual(population.pool.n_reused, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
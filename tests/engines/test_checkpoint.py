@@ -0,0 +1,86 @@
+from geneticpython.callbacks import CheckpointCallback
+from geneticpython import SteadyStateNSGAIIEngine
+from geneticpython.utils import check_random_state
+import unittest
+import tempfile
+import shutil
+import os
+import json
+import numpy as np
+from functools import partial
+import factories
+from factories import zdt1_engine
+
+
+sphere_engine = partial(factories.sphere_engine, maximize=True)
+
+
+def state(engine):
+    return [(indv.chromosome.genes.tolist(), indv._objective, indv._objectives)
+            for indv in engine.population.individuals]
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.path = os.path.join(self.dirpath, 'checkpoint.npz')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def assert_resume_matches(self, make_engine):
+        full = make_engine()
+        full.run(6)
+
+        first = make_engine()
+        first.run(3)
+        first.save_checkpoint(self.path)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+        resumed = make_engine()
+        history = resumed.resume(self.path, generations=6)
+        self.assertEqual(resumed.generation, 6)
+        self.assertEqual(state(resumed), state(full))
+        self.assertEqual(history.history, full.history.history)
+
+    def test_resume_single_objective(self):
+        self.assert_resume_matches(sphere_engine)
+
+    def test_resume_multi_objective(self):
+        self.assert_resume_matches(zdt1_engine)
+
+    def test_resume_steady_state(self):
+        self.assert_resume_matches(lambda: zdt1_engine(engine_class=SteadyStateNSGAIIEngine))
+
+    def test_resume_parallel_reproduction_and_buffered_rng(self):
+        self.assert_resume_matches(lambda: zdt1_engine(reproduction_n_jobs=1, rng_buffer_size=64))
+
+    def test_checkpoint_callback(self):
+        engine = zdt1_engine(callbacks=[CheckpointCallback(self.path, every_n_generations=2)])
+        engine.run(5)
+        resumed = zdt1_engine()
+        resumed.load_checkpoint(self.path)
+        self.assertEqual(resumed.generation, 4)
+        self.assertEqual(len(resumed.history.history), 5)
+        self.assertEqual(resumed.history.history, engine.history.history[:5])
+
+    def test_state_is_stored_as_utf8_bytes(self):
+        engine = zdt1_engine()
+        engine.run(3)
+        engine.save_checkpoint(self.path)
+        with np.load(self.path, allow_pickle=False) as checkpoint:
+            state = checkpoint['state']
+        self.assertEqual(state.dtype, np.uint8)
+        self.assertEqual(json.loads(state.tobytes().decode('utf-8'))['generation'], 3)
+
+    def test_unseeded_engine_loads_into_its_own_random_state(self):
+        engine = zdt1_engine()
+        engine.run(2)
+        engine.save_checkpoint(self.path)
+
+        resumed = zdt1_engine(random_state=None)
+        self.assertIsNot(resumed.random_state, check_random_state(None))
+        shared = check_random_state(None).get_state()[1].copy()
+        resumed.load_checkpoint(self.path)
+        np.testing.assert_array_equal(check_random_state(None).get_state()[1], shared)
+        np.testing.assert_array_equal(resumed.random_state.get_state()[1], engine.random_state.get_state()[1])
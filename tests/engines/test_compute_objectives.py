@@ -0,0 +1,225 @@
+from geneticpython.models import BinaryIndividual, FloatIndividual
+from geneticpython.core.operators import TournamentSelection, RouletteWheelReplacement, UniformCrossover, FlipBitMutation, \
+    SBXCrossover, PolynomialMutation
+from geneticpython import Population, GAEngine, NSGAIIEngine
+import unittest
+import numpy as np
+from functools import partial
+import factories
+
+
+def zdt1(genes):
+    g = 1.0 + 9.0 * np.sum(genes[..., 1:], axis=-1) / (genes.shape[-1] - 1)
+    return g * (1.0 - np.sqrt(genes[..., 0] / g))
+
+
+nsgaii_engine = partial(factories.nsgaii_engine, n_genes=10, size=20, pm=0.1, random_state=7)
+
+
+def onemax_engine():
+    population = Population(BinaryIndividual(30), 20)
+    return GAEngine(population,
+                    selection=TournamentSelection(2),
+                    crossover=UniformCrossover(pc=0.8),
+                    mutation=FlipBitMutation(pm=0.2, pe=0.1),
+                    replacement=RouletteWheelReplacement(),
+                    random_state=5)
+
+
+class TestBatchObjectives(unittest.TestCase):
+    def test_batch_matches_per_individual(self):
+        engine = nsgaii_engine()
+
+        @engine.minimize_objective
+        def f1(indv):
+            return indv.chromosome[0]
+
+        @engine.minimize_objective
+        def f2(indv):
+            return zdt1(indv.chromosome.genes)
+
+        engine.run(5)
+
+        batch_engine = nsgaii_engine()
+
+        @batch_engine.minimize_objective(batch=True, n_objectives=2)
+        def f(genes):
+            return np.column_stack([genes[:, 0], zdt1(genes)])
+
+        batch_engine.run(5)
+        np.testing.assert_allclose(engine.population.all_objectives(),
+                                   batch_engine.population.all_objectives())
+
+    def test_batch_mixed_with_per_individual(self):
+        engine = nsgaii_engine()
+
+        @engine.minimize_objective
+        def f1(indv):
+            return indv.chromosome[0]
+
+        @engine.maximize_objective(batch=True)
+        def f2(genes):
+            return -zdt1(genes)
+
+        engine.run(2)
+        for indv in engine.population.individuals:
+            self.assertEqual(len(indv._objectives), 2)
+            self.assertAlmostEqual(indv._objectives[1], zdt1(indv.chromosome.genes))
+            self.assertAlmostEqual(indv.objectives[1], -zdt1(indv.chromosome.genes))
+
+    def test_batch_single_objective(self):
+        engine = onemax_engine()
+
+        @engine.maximize_objective(batch=True)
+        def onemax(genes):
+            return genes.sum(axis=1)
+
+        engine.run(3)
+        best = engine.get_best_indv()
+        self.assertEqual(best.objective, best.chromosome.genes.sum())
+
+    def test_batch_invalid_shape(self):
+        engine = onemax_engine()
+
+        @engine.maximize_objective(batch=True)
+        def onemax(genes):
+            return genes.sum()
+
+        with self.assertRaises(ValueError):
+            engine.run(1)
+
+
+class TestFitnessCache(unittest.TestCase):
+    def run_counted(self, **kwargs):
+        population = Population(BinaryIndividual(30), 20)
+        engine = GAEngine(population,
+                          selection=TournamentSelection(2),
+                          crossover=UniformCrossover(pc=0.5),
+                          mutation=FlipBitMutation(pm=0.2, pe=0.1),
+                          replacement=RouletteWheelReplacement(),
+                          random_state=5, **kwargs)
+        calls = []
+
+        @engine.maximize_objective
+        def onemax(indv):
+            calls.append(1)
+            return np.sum(indv.chromosome.genes)
+
+        engine.run(10)
+        return engine, len(calls)
+
+    def test_cache_skips_clones(self):
+        engine, n_calls = self.run_counted()
+        cached_engine, n_cached_calls = self.run_counted(cache_size=1000)
+        self.assertEqual(engine.population.all_objective(),
+                         cached_engine.population.all_objective())
+        self.assertLess(n_cached_calls, n_calls)
+        self.assertEqual(cached_engine.metrics['cache_misses'], n_cached_calls)
+        self.assertEqual(cached_engine.metrics['cache_hits'] + n_cached_calls, n_calls)
+
+    def test_set_evaluator_keeps_cache(self):
+        engine, _ = self.run_counted(cache_size=1000)
+        cache = engine.cache
+        engine.set_evaluator('serial')
+        self.assertIs(engine.cache, cache)
+        hits = cache.hits
+        engine.run(2)
+        self.assertGreater(cache.hits, hits)
+
+    def test_lru_eviction(self):
+        from geneticpython.engines.evaluators import FitnessCache
+        cache = FitnessCache(max_size=2)
+        cache.put(b'a', [1.0])
+        cache.put(b'b', [2.0])
+        cache.get(b'a')
+        cache.put(b'c', [3.0])
+        self.assertIn(b'a', cache)
+        self.assertNotIn(b'b', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+
+class TestModifiedFlag(unittest.TestCase):
+    def test_flag(self):
+        indv = BinaryIndividual(10)
+        self.assertTrue(indv.modified)
+        indv.random_init(random_state=1)
+        indv._objective, indv.modified = 1.0, False
+        clone = indv.clone()
+        self.assertFalse(clone.modified)
+        self.assertEqual(clone._objective, 1.0)
+        clone.chromosome[0] = 1 - clone.chromosome[0]
+        self.assertTrue(clone.modified)
+        self.assertFalse(indv.modified)
+        clone = indv.clone()
+        clone.update_genes(np.zeros(10, dtype=int))
+        self.assertTrue(clone.modified)
+
+    def test_unmodified_offspring_are_not_evaluated(self):
+        population = Population(BinaryIndividual(30), 20)
+        engine = GAEngine(population,
+                          selection=TournamentSelection(2),
+                          crossover=UniformCrossover(pc=0.0),
+                          mutation=FlipBitMutation(pm=0.0, pe=0.1),
+                          replacement=RouletteWheelReplacement(),
+                          random_state=5)
+        calls = []
+
+        @engine.maximize_objective
+        def onemax(indv):
+            calls.append(1)
+            return np.sum(indv.chromosome.genes)
+
+        engine.run(5)
+        self.assertEqual(len(calls), 20)
+
+    def test_unchanged_float_offspring_are_not_evaluated(self):
+        indv = FloatIndividual(5, [0, 1])
+        indv.random_init(random_state=1)
+        indv._objectives, indv.modified = [1.0, 2.0], False
+        mutated = PolynomialMutation(pm=0.0).mutate(indv, random_state=1)
+        self.assertFalse(mutated.modified)
+        self.assertEqual(mutated._objectives, [1.0, 2.0])
+        # identical parents, no gene is crossed
+        children = SBXCrossover(pc=1.0).cross(indv, indv.clone(), random_state=1)
+        self.assertEqual([child.modified for child in children], [False, False])
+        children = UniformCrossover(pc=1.0, pe=1e-12).cross(indv, indv.clone(), random_state=1)
+        self.assertEqual([child.modified for child in children], [False, False])
+
+        population = Population(FloatIndividual(6, [0, 1]), 16)
+        engine = NSGAIIEngine(population,
+                              crossover=SBXCrossover(pc=0.0),
+                              mutation=PolynomialMutation(pm=0.0),
+                              random_state=5)
+        calls = []
+
+        @engine.minimize_objective
+        def f1(indv):
+            calls.append(1)
+            return indv.chromosome[0]
+
+        @engine.minimize_objective
+        def f2(indv):
+            return zdt1(indv.chromosome.genes)
+
+        engine.run(5)
+        self.assertEqual(len(calls), 16)
+
+    def test_objectives_stay_consistent(self):
+        engine = nsgaii_engine()
+
+        @engine.minimize_objective
+        def f1(indv):
+            return indv.chromosome[0]
+
+        @engine.minimize_objective
+        def f2(indv):
+            return zdt1(indv.chromosome.genes)
+
+        engine.run(10)
+        for indv in engine.population.individuals:
+            self.assertEqual(indv._objectives, [f(indv) for f in engine.objectives])
+
+
+if __name__ == '__main__':
+    unittest.main()
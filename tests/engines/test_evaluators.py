@@ -0,0 +1,151 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.engines.evaluators import SerialEvaluator, ProcessPoolEvaluator, ThreadPoolEvaluator, SharedMemoryEvaluator, \
+    AsyncEvaluator, check_evaluator
+import unittest
+import asyncio
+import numpy as np
+from functools import partial
+import factories
+from factories import sphere_engine
+
+
+nsgaii_engine = partial(factories.nsgaii_engine, n_genes=10, size=20, pm=0.1, random_state=7)
+zdt1_engine = partial(factories.zdt1_engine, batch=False, n_genes=10, size=20, pm=0.1, random_state=7)
+
+
+class TestEvaluators(unittest.TestCase):
+    def test_check_evaluator(self):
+        self.assertIsInstance(check_evaluator(), SerialEvaluator)
+        self.assertIsInstance(check_evaluator(n_jobs=1), SerialEvaluator)
+        self.assertIsInstance(check_evaluator(n_jobs=2), ProcessPoolEvaluator)
+        self.assertIsInstance(check_evaluator('process', n_jobs=2), ProcessPoolEvaluator)
+        self.assertIsInstance(check_evaluator('thread', n_jobs=2), ThreadPoolEvaluator)
+        self.assertIsInstance(check_evaluator('shared_memory', n_jobs=2), SharedMemoryEvaluator)
+        with self.assertRaises(ValueError):
+            check_evaluator('unknown')
+
+    def test_process_pool_matches_serial_multi_objective(self):
+        serial = zdt1_engine()
+        serial.run(5)
+        parallel = zdt1_engine(n_jobs=2)
+        parallel.run(5)
+        parallel.close()
+        self.assertEqual(serial.population.all_objectives(),
+                         parallel.population.all_objectives())
+
+    def test_process_pool_matches_serial_single_objective(self):
+        serial = sphere_engine()
+        serial.run(5)
+        parallel = sphere_engine(evaluator=ProcessPoolEvaluator(n_jobs=2))
+        parallel.run(5)
+        parallel.close()
+        self.assertEqual(serial.population.all_objective(),
+                         parallel.population.all_objective())
+
+    def test_thread_pool_matches_serial(self):
+        serial = zdt1_engine()
+        serial.run(5)
+        threaded = zdt1_engine(evaluator='thread', n_jobs=3)
+        threaded.run(5)
+        threaded.close()
+        self.assertEqual(serial.population.all_objectives(),
+                         threaded.population.all_objectives())
+
+    def test_shared_memory_matches_serial(self):
+        serial = zdt1_engine()
+        serial.run(5)
+        shared = zdt1_engine(evaluator='shared_memory', n_jobs=2)
+        shared.run(5)
+        block = shared.evaluator._blocks['genes']
+        shared.run(2)
+        self.assertIs(block, shared.evaluator._blocks['genes'])
+        shared.close()
+        self.assertIsNone(shared.evaluator._blocks['genes'])
+        serial.run(2)
+        self.assertEqual(serial.population.all_objectives(),
+                         shared.population.all_objectives())
+
+    def test_shared_memory_worker_releases_blocks(self):
+        from multiprocessing import shared_memory
+        from geneticpython.engines.evaluators import shared_memory_evaluator as worker
+
+        template = FloatIndividual(3, [0, 1])
+        template.random_init(random_state=1)
+        own_genes = template.chromosome.genes
+        worker._init_worker([lambda indv: float(indv.chromosome.genes.sum())], template)
+        genes_block = shared_memory.SharedMemory(create=True, size=2 * 3 * 8)
+        values_block = shared_memory.SharedMemory(create=True, size=2 * 8)
+        try:
+            genes = np.ndarray((2, 3), dtype=np.float64, buffer=genes_block.buf)
+            genes[:] = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+            header = (genes_block.name, values_block.name, (2, 3), genes.dtype.str, 1)
+            self.assertEqual(worker._evaluate_rows(header, 0, 2), 2)
+            self.assertIs(template.chromosome.genes, own_genes)
+            # the worker closes blocks replaced by the parent, no view of them may remain
+            worker._release_blocks(())
+            self.assertEqual(worker._worker_blocks, {})
+            values = np.ndarray((2, 1), dtype=np.float64, buffer=values_block.buf)
+            np.testing.assert_allclose(values[:, 0], [0.6, 1.5])
+            del genes, values
+        finally:
+            for block in [genes_block, values_block]:
+                block.close()
+                block.unlink()
+
+    def test_process_pool_is_reused(self):
+        engine = sphere_engine(n_jobs=2)
+        engine.run(2)
+        executor = engine.evaluator._executor
+        engine.run(2)
+        self.assertIs(executor, engine.evaluator._executor)
+        engine.close()
+        self.assertIsNone(engine.evaluator._executor)
+
+
+class TestAsyncEvaluator(unittest.TestCase):
+    def async_engine(self, max_concurrency=None):
+        evaluator = AsyncEvaluator(max_concurrency) if max_concurrency else None
+        engine = nsgaii_engine(evaluator=evaluator)
+        state = {'running': 0, 'peak': 0}
+
+        @engine.minimize_objective
+        async def f1(indv):
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+            await asyncio.sleep(0.001)
+            state['running'] -= 1
+            return indv.chromosome[0]
+
+        @engine.minimize_objective
+        def f2(indv):
+            genes = indv.chromosome.genes
+            g = 1.0 + 9.0 * np.sum(genes[1:]) / (len(genes) - 1)
+            return g * (1.0 - np.sqrt(genes[0] / g))
+
+        return engine, state
+
+    def test_async_matches_serial(self):
+        serial = zdt1_engine()
+        serial.run(3)
+        engine, state = self.async_engine()
+        engine.run(3)
+        engine.close()
+        self.assertEqual(serial.population.all_objectives(),
+                         engine.population.all_objectives())
+        self.assertGreater(state['peak'], 1)
+
+    def test_max_concurrency(self):
+        engine, state = self.async_engine(max_concurrency=3)
+        engine.run(2)
+        engine.close()
+        self.assertEqual(state['peak'], 3)
+
+    def test_async_objective_rejected_by_process_pool(self):
+        engine, _ = self.async_engine()
+        engine.set_evaluator('process', n_jobs=2)
+        with self.assertRaises(ValueError):
+            engine.run(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
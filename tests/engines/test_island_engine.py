@@ -0,0 +1,105 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation, TournamentSelection, RouletteWheelReplacement
+from geneticpython.engines.island_engine import migration_plan
+from geneticpython import Population, GAEngine, NSGAIIEngine, IslandEngine
+import unittest
+import numpy as np
+import os
+
+
+def sphere_factory(island, random_state):
+    population = Population(FloatIndividual(5, [-1, 1]), 12)
+    engine = GAEngine(population,
+                      selection=TournamentSelection(2),
+                      crossover=SBXCrossover(pc=0.9),
+                      mutation=PolynomialMutation(pm=0.2),
+                      replacement=RouletteWheelReplacement(),
+                      random_state=random_state)
+
+    @engine.minimize_objective
+    def sphere(indv):
+        return float(np.sum(indv.chromosome.genes ** 2))
+
+    return engine
+
+
+def zdt1_factory(island, random_state):
+    population = Population(FloatIndividual(6, [0, 1]), 12)
+    engine = NSGAIIEngine(population,
+                          crossover=SBXCrossover(pc=0.9, distribution_index=5),
+                          mutation=PolynomialMutation(pm=0.2, distribution_index=20),
+                          random_state=random_state)
+
+    @engine.minimize_objective(batch=True)
+    def f1(genes):
+        return genes[:, 0]
+
+    @engine.minimize_objective(batch=True)
+    def f2(genes):
+        g = 1.0 + 9.0 * np.sum(genes[:, 1:], axis=1) / (genes.shape[1] - 1)
+        return g * (1.0 - np.sqrt(genes[:, 0] / g))
+
+    return engine
+
+
+def failing_factory(island, random_state):
+    raise ValueError('broken island')
+
+
+def exiting_factory(island, random_state):
+    if island == 1:
+        os._exit(3)
+    return sphere_factory(island, random_state)
+
+
+class TestIslandEngine(unittest.TestCase):
+    def test_migration_plan(self):
+        self.assertEqual(migration_plan('ring', 3, 1), [[[1], [2], [0]]])
+        self.assertEqual(migration_plan('full', 3, 1), [[[1, 2], [0, 2], [0, 1]]])
+        plan = migration_plan('random', 4, 5, np.random.default_rng(0))
+        for targets in plan:
+            self.assertTrue(all(targets[i][0] != i for i in range(4)))
+        with self.assertRaises(ValueError):
+            migration_plan('star', 3, 1)
+
+    def test_single_objective_islands(self):
+        engine = IslandEngine(sphere_factory, n_islands=3, migration_interval=2,
+                              topology='ring', generations=5, random_state=1)
+        history = engine.run()
+        self.assertEqual(len(history.history), 6)
+        for entry in history.history:
+            self.assertEqual(len(entry['islands']), 3)
+            self.assertEqual(entry['best_objective'],
+                             min(island['best_objective'] for island in entry['islands']))
+        self.assertEqual(len(engine.get_all_solutions()), 36)
+        self.assertEqual(engine.get_best_indv()._objective, history.history[-1]['best_objective'])
+
+    def test_runs_are_reproducible(self):
+        runs = []
+        for _ in range(2):
+            engine = IslandEngine(zdt1_factory, n_islands=3, migration_interval=2,
+                                  topology='random', migrant_selection='random',
+                                  migrant_replacement='random', generations=5, random_state=4)
+            engine.run()
+            runs.append([[indv._objectives for indv in population] for population in engine.populations])
+        self.assertEqual(runs[0], runs[1])
+
+    def test_merged_pareto_front(self):
+        engine = IslandEngine(zdt1_factory, n_islands=2, migration_interval=2,
+                              topology='full', generations=4, random_state=2)
+        history = engine.run()
+        merged = history.history[-1]['pareto_front']
+        pareto_front = engine.get_pareto_front()
+        self.assertEqual(sorted(map(tuple, merged)),
+                         sorted(set(tuple(indv.objectives) for indv in pareto_front.individuals)))
+
+    def test_failing_island(self):
+        engine = IslandEngine(failing_factory, n_islands=2, generations=2)
+        with self.assertRaises(RuntimeError):
+            engine.run()
+
+    def test_dead_island(self):
+        # island 0 waits for the migrants of island 1, which dies without any result
+        engine = IslandEngine(exiting_factory, n_islands=2, migration_interval=2, generations=5)
+        with self.assertRaisesRegex(RuntimeError, 'island 1 exited with code 3'):
+            engine.run()
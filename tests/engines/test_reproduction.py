@@ -0,0 +1,50 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation
+from geneticpython import Population
+from geneticpython.engines.reproduction import ParallelReproducer
+import unittest
+import numpy as np
+from functools import partial
+import factories
+
+
+zdt1_engine = partial(factories.zdt1_engine, n_genes=10, size=20, pm=0.1, random_state=11)
+
+
+def all_genes(engine):
+    return [indv.chromosome.genes.tolist() for indv in engine.population.individuals]
+
+
+class TestParallelReproduction(unittest.TestCase):
+    def test_results_do_not_depend_on_worker_count(self):
+        runs = []
+        for n_jobs in [1, 2, 3]:
+            engine = zdt1_engine(reproduction_n_jobs=n_jobs)
+            engine.run(5)
+            engine.close()
+            runs.append(all_genes(engine))
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(runs[0], runs[2])
+
+    def test_reproducer_is_reused(self):
+        engine = zdt1_engine(reproduction_n_jobs=2)
+        engine.run(2)
+        executor = engine.reproducer._executor
+        self.assertIsNotNone(executor)
+        engine.run(2)
+        self.assertIs(engine.reproducer._executor, executor)
+        engine.close()
+        self.assertIsNone(engine.reproducer._executor)
+
+    def test_serial_reproducer(self):
+        population = Population(FloatIndividual(4, [0, 1]), 4)
+        individuals = population.init_population(random_state=np.random.RandomState(0))
+        seeds = np.random.SeedSequence(3).spawn(2)
+        reproducer = ParallelReproducer(n_jobs=1)
+        childs = reproducer.reproduce(SBXCrossover(pc=1.0), PolynomialMutation(pm=0.5),
+                                      individuals, seeds)
+        self.assertEqual(len(childs), 4)
+        again = reproducer.reproduce(SBXCrossover(pc=1.0), PolynomialMutation(pm=0.5),
+                                     individuals, seeds)
+        self.assertEqual([c.chromosome.genes.tolist() for c in childs],
+                         [c.chromosome.genes.tolist() for c in again])
@@ -0,0 +1,75 @@
+from geneticpython.callbacks import Callback
+from geneticpython import SteadyStateEngine, SteadyStateNSGAIIEngine, NSGAIIEngine
+import unittest
+from functools import partial
+import factories
+
+
+class CountingCallback(Callback):
+    def __init__(self):
+        super(CountingCallback, self).__init__()
+        self.generations = []
+        self.replacements = 0
+        self.evaluations = 0
+
+    def on_generation_end(self, gen, logs=None):
+        self.generations.append(gen)
+
+    def on_evaluation_end(self, gen, logs=None):
+        self.evaluations += 1
+
+    def on_replacement_end(self, gen, logs=None):
+        self.replacements += 1
+
+
+sphere_engine = partial(factories.sphere_engine, SteadyStateEngine, size=20)
+zdt1_engine = partial(factories.zdt1_engine, engine_class=SteadyStateNSGAIIEngine, size=20)
+
+
+class TestSteadyStateEngine(unittest.TestCase):
+    def test_population_stays_sorted(self):
+        engine = sphere_engine()
+        engine.run(3)
+        objectives = engine.population.all_objective()
+        self.assertEqual(len(objectives), 20)
+        self.assertEqual(objectives, sorted(objectives))
+        self.assertEqual(engine._keys, objectives)
+        best = [entry['best_objective'] for entry in engine.history.history]
+        self.assertEqual(best, sorted(best, reverse=True))
+
+    def test_virtual_generations(self):
+        callback = CountingCallback()
+        engine = sphere_engine(callbacks=[callback], steps_per_generation=4)
+        engine.run(3)
+        self.assertEqual(callback.generations, [0, 1, 2])
+        self.assertEqual(callback.replacements, 12)
+        self.assertEqual(callback.evaluations, 12)
+        self.assertEqual(len(engine.history.history), 4)
+
+    def test_invalid_offspring_size(self):
+        with self.assertRaises(ValueError):
+            sphere_engine(offspring_size=3)
+
+
+class TestSteadyStateNSGAIIEngine(unittest.TestCase):
+    def test_incremental_fronts_match_full_sort(self):
+        engine = zdt1_engine()
+        engine.run(4)
+        individuals = engine.population.individuals
+        self.assertEqual(len(individuals), 20)
+        fronts = NSGAIIEngine.nondominated_sort(list(individuals))
+        self.assertEqual([set(map(id, front)) for front in fronts],
+                         [set(map(id, front)) for front in engine.fronts])
+        for rank, front in enumerate(engine.fronts):
+            for indv in front:
+                self.assertEqual(indv.nondominated_rank, rank)
+
+    def test_crowding_distance_is_up_to_date(self):
+        engine = zdt1_engine(steps_per_generation=3)
+        engine.run(2)
+        for front in engine.fronts:
+            distances = NSGAIIEngine.calc_crowding_distance(list(front))
+            for indv in front:
+                self.assertEqual(indv.crowding_distance, distances[indv])
+        self.assertTrue(all(indv.nondominated_rank == 0
+                            for indv in engine.get_pareto_front()))
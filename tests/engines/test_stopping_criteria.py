@@ -0,0 +1,100 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation
+from geneticpython import Population, NSGAIIEngine
+import unittest
+import time
+import numpy as np
+from functools import partial
+import factories
+
+
+sphere_engine = partial(factories.sphere_engine, size=10)
+zdt1_engine = partial(factories.zdt1_engine, size=10)
+
+
+class TestStoppingCriteria(unittest.TestCase):
+    def test_generations(self):
+        engine = sphere_engine()
+        history = engine.run(4)
+        self.assertEqual(engine.generation, 4)
+        self.assertEqual(engine.stop_reason, 'generations')
+        self.assertEqual(len(history.history), 5)
+
+    def test_evaluation_counter(self):
+        engine = sphere_engine()
+        history = engine.run(3)
+        self.assertEqual(history.history[0]['n_evaluations'], 10)
+        counts = [entry['n_evaluations'] for entry in history.history]
+        self.assertEqual(counts, sorted(counts))
+        self.assertEqual(engine.metrics['n_evaluations'], engine.n_evaluations)
+        self.assertLessEqual(engine.n_evaluations, 10 + 3 * 10)
+
+    def test_max_evaluations(self):
+        engine = sphere_engine(generations=None)
+        engine.run(max_evaluations=35)
+        self.assertEqual(engine.stop_reason, 'max_evaluations')
+        self.assertGreaterEqual(engine.n_evaluations, 35)
+        self.assertLess(engine.n_evaluations, 35 + 10)
+
+    def test_run_keeps_criteria_set_before(self):
+        engine = sphere_engine(generations=None)
+        engine.set_stopping_criteria(max_evaluations=35)
+        engine.run()
+        self.assertEqual(engine.stop_reason, 'max_evaluations')
+        self.assertLess(engine.n_evaluations, 35 + 10)
+
+        engine.run(stagnation=2)
+        self.assertEqual(engine.max_evaluations, 35)
+        self.assertEqual(engine.stagnation, 2)
+
+    def test_max_time(self):
+        engine = sphere_engine(generations=None)
+
+        @engine.minimize_objective
+        def slow_sphere(indv):
+            time.sleep(0.001)
+            return float(np.sum(indv.chromosome.genes ** 2))
+
+        engine.run(max_time=0.1)
+        self.assertEqual(engine.stop_reason, 'max_time')
+
+    def test_target_objective(self):
+        engine = sphere_engine(generations=1000)
+        engine.run(target_objective=0.5)
+        self.assertEqual(engine.stop_reason, 'target_objective')
+        self.assertLessEqual(engine.get_best_indv().objective, 0.5)
+
+        engine = zdt1_engine(generations=1000)
+        engine.run(target_objective=[0.5, 2.0])
+        self.assertEqual(engine.stop_reason, 'target_objective')
+        self.assertTrue(any(indv.objectives[0] <= 0.5 and indv.objectives[1] <= 2.0
+                            for indv in engine.population.individuals))
+
+    def test_stagnation(self):
+        engine = sphere_engine(generations=1000)
+        engine.run(stagnation=3)
+        self.assertEqual(engine.stop_reason, 'stagnation')
+        best = [entry['best_objective'] for entry in engine.history.history]
+        self.assertEqual(len(set(best[-4:])), 1)
+        self.assertNotEqual(best[-5], best[-4])
+
+        population = Population(FloatIndividual(2, [0, 1]), 10)
+        engine = NSGAIIEngine(population,
+                              crossover=SBXCrossover(pc=0.9),
+                              mutation=PolynomialMutation(pm=0.5),
+                              generations=1000,
+                              random_state=1)
+
+        # coarse objectives, the pareto front converges after a few generations
+        @engine.minimize_objective(batch=True, n_objectives=2)
+        def f(genes):
+            return np.round(np.stack([genes[:, 0], 1 - genes[:, 0] + genes[:, 1]], axis=1), 1)
+
+        engine.run(stagnation=5)
+        self.assertEqual(engine.stop_reason, 'stagnation')
+        self.assertLess(engine.generation, 1000)
+
+    def test_requires_a_criterion(self):
+        engine = sphere_engine(generations=None)
+        with self.assertRaises(ValueError):
+            engine.run()
@@ -0,0 +1,74 @@
+from geneticpython.models import FloatIndividual
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation, TournamentSelection, RouletteWheelReplacement
+from geneticpython import Population, GAEngine, NSGAIIEngine
+import time
+import numpy as np
+
+
+def sphere(indv):
+    return float(np.sum(indv.chromosome.genes ** 2))
+
+
+def zdt1_f1(genes):
+    return genes[..., 0]
+
+
+def zdt1_f2(genes):
+    g = 1.0 + 9.0 * np.sum(genes[..., 1:], axis=-1) / (genes.shape[-1] - 1)
+    return g * (1.0 - np.sqrt(genes[..., 0] / g))
+
+
+def sphere_engine(engine_class=GAEngine, size=16, maximize=False, delay=0,
+                  array_backed=False, recycle=False, random_state=3, **kwargs):
+    """
+        engine_class on the sphere function over 5 genes in [-1, 1],
+        GAEngine gets a tournament selection and a roulette wheel replacement,
+        each evaluation sleeps delay seconds
+    """
+    population = Population(FloatIndividual(5, [-1, 1]), size, array_backed=array_backed, recycle=recycle)
+    if engine_class is GAEngine:
+        kwargs.setdefault('selection', TournamentSelection(2))
+        kwargs.setdefault('replacement', RouletteWheelReplacement())
+    engine = engine_class(population,
+                          crossover=SBXCrossover(pc=0.9),
+                          mutation=PolynomialMutation(pm=0.2),
+                          random_state=random_state,
+                          **kwargs)
+
+    def objective(indv):
+        if delay:
+            time.sleep(delay)
+        return sphere(indv)
+
+    if maximize:
+        engine.maximize_objective(objective)
+    else:
+        engine.minimize_objective(objective)
+    return engine
+
+
+def nsgaii_engine(engine_class=NSGAIIEngine, n_genes=6, size=16, pm=0.2,
+                  array_backed=False, recycle=False, random_state=5, **kwargs):
+    """
+        engine_class over n_genes genes in [0, 1], without objectives
+    """
+    population = Population(FloatIndividual(n_genes, [0, 1]), size, array_backed=array_backed, recycle=recycle)
+    return engine_class(population,
+                        crossover=SBXCrossover(pc=0.9, distribution_index=5),
+                        mutation=PolynomialMutation(pm=pm, distribution_index=20),
+                        random_state=random_state,
+                        **kwargs)
+
+
+def zdt1_engine(batch=True, **kwargs):
+    """
+        nsgaii_engine on ZDT1, with batch objectives unless batch is False
+    """
+    engine = nsgaii_engine(**kwargs)
+    if batch:
+        engine.minimize_objective(zdt1_f1, batch=True)
+        engine.minimize_objective(zdt1_f2, batch=True)
+    else:
+        engine.minimize_objective(lambda indv: float(zdt1_f1(indv.chromosome.genes)))
+        engine.minimize_objective(lambda indv: float(zdt1_f2(indv.chromosome.genes)))
+    return engine
@@ -0,0 +1,92 @@
+from geneticpython.utils import BufferedRandomState, check_random_state
+from geneticpython.models import BinaryIndividual, FloatIndividual
+from geneticpython.core.operators import UniformCrossover, FlipBitMutation, SBXCrossover, PolynomialMutation
+from geneticpython import Population, NSGAIIEngine
+import unittest
+import pickle
+import numpy as np
+
+
+class TestBufferedRandomState(unittest.TestCase):
+    def test_serves_the_underlying_stream(self):
+        buffered = BufferedRandomState(5, buffer_size=16)
+        values = [buffered.random() for _ in range(20)] + buffered.random(30).tolist()
+        self.assertEqual(values, np.random.RandomState(5).random_sample(50).tolist())
+
+    def test_ranges(self):
+        buffered = BufferedRandomState(0, buffer_size=64)
+        integers = buffered.randint(3, 7, size=1000)
+        self.assertTrue(((integers >= 3) & (integers < 7)).all())
+        self.assertEqual(set(integers.tolist()), {3, 4, 5, 6})
+        self.assertIsInstance(buffered.randint(4), int)
+        uniforms = buffered.uniform([0, 10], [1, 20])
+        self.assertTrue(0 <= uniforms[0] < 1 and 10 <= uniforms[1] < 20)
+        with self.assertRaises(ValueError):
+            buffered.randint(3, 3)
+
+    def test_shares_bit_generator(self):
+        random_state = np.random.RandomState(1)
+        buffered = BufferedRandomState(random_state, buffer_size=8)
+        buffered.random()
+        self.assertEqual(random_state.random_sample(), np.random.RandomState(1).random_sample(9)[-1])
+
+    def test_pickle(self):
+        buffered = BufferedRandomState(2, buffer_size=8)
+        buffered.random(3)
+        clone = pickle.loads(pickle.dumps(buffered))
+        self.assertIsInstance(clone, BufferedRandomState)
+        self.assertEqual(clone.random(10).tolist(), buffered.random(10).tolist())
+
+    def test_check_random_state_none_is_not_global(self):
+        random_state = check_random_state(None)
+        self.assertIsNot(random_state, np.random.mtrand._rand)
+        self.assertIs(random_state, check_random_state(None))
+
+        state = np.random.get_state()
+        random_state.set_state(np.random.RandomState(1).get_state())
+        np.testing.assert_array_equal(np.random.get_state()[1], state[1])
+
+
+class TestVectorizedOperators(unittest.TestCase):
+    def test_uniform_crossover_draws_one_number_per_gene(self):
+        population = Population(BinaryIndividual(20), 2)
+        father, mother = population.init_population(random_state=np.random.RandomState(0))
+        child1, child2 = UniformCrossover(pc=1.0, pe=0.5).cross(father, mother, random_state=np.random.RandomState(1))
+
+        draws = np.random.RandomState(1).random_sample(21)
+        exchange = draws[1:] <= 0.5
+        self.assertEqual(child1.chromosome.genes.tolist(),
+                         np.where(exchange, mother.chromosome.genes, father.chromosome.genes).tolist())
+        self.assertEqual(child2.chromosome.genes.tolist(),
+                         np.where(exchange, father.chromosome.genes, mother.chromosome.genes).tolist())
+
+    def test_flip_bit_mutation(self):
+        population = Population(BinaryIndividual(20), 1)
+        indv = population.init_population(random_state=np.random.RandomState(0))[0]
+        indv.modified = False
+        mutant = FlipBitMutation(pm=1.0, pe=0.3).mutate(indv, random_state=np.random.RandomState(2))
+
+        flips = np.random.RandomState(2).random_sample(21)[1:] <= 0.3
+        self.assertEqual(mutant.chromosome.genes.tolist(),
+                         (indv.chromosome.genes ^ flips).tolist())
+        self.assertTrue(mutant.modified)
+
+    def test_engine_with_buffered_rng(self):
+        population = Population(FloatIndividual(6, [0, 1]), 12)
+        engine = NSGAIIEngine(population,
+                              crossover=SBXCrossover(pc=0.9),
+                              mutation=PolynomialMutation(pm=0.2),
+                              random_state=4,
+                              rng_buffer_size=256)
+        self.assertIsInstance(engine.random_state, BufferedRandomState)
+
+        @engine.minimize_objective(batch=True)
+        def f1(genes):
+            return genes[:, 0]
+
+        @engine.minimize_objective(batch=True)
+        def f2(genes):
+            return 1 - genes[:, 0] + genes[:, 1:].sum(axis=1)
+
+        engine.run(3)
+        self.assertEqual(len(engine.population.individuals), 12)
@@ -0,0 +1,78 @@
+from geneticpython.utils import RNGManager, check_random_state, check_seed_sequence, rng_integers
+from geneticpython.models import FloatIndividual, IntIndividual
+from geneticpython.models.tree import NetworkRandomKeys
+from geneticpython.core.operators import SBXCrossover, PolynomialMutation, TournamentSelection, \
+    RouletteWheelSelection, KruskalCrossover, TreeMutation
+from geneticpython import Population
+import unittest
+import numpy as np
+
+
+class TestRNGManager(unittest.TestCase):
+    def test_check_random_state(self):
+        generator = np.random.default_rng(1)
+        self.assertIs(check_random_state(generator), generator)
+        self.assertIsInstance(check_random_state(1), np.random.RandomState)
+        with self.assertRaises(ValueError):
+            check_random_state('seed')
+
+    def test_check_seed_sequence(self):
+        self.assertEqual(check_seed_sequence(5).entropy, 5)
+        self.assertEqual(check_seed_sequence(np.random.default_rng(5)).entropy, 5)
+        self.assertEqual(check_seed_sequence(np.random.RandomState(1)).entropy,
+                         check_seed_sequence(np.random.RandomState(1)).entropy)
+        with self.assertRaises(ValueError):
+            check_seed_sequence('seed')
+
+    def test_streams_do_not_depend_on_request_order(self):
+        a, b = RNGManager(42), RNGManager(42)
+        first = a.island_streams(3)[2].random()
+        b.worker_streams(8)
+        self.assertEqual(b.island_streams(3)[2].random(), first)
+        self.assertEqual(a.generator('island', 2).random(), first)
+
+    def test_streams_are_independent(self):
+        rng = RNGManager(42)
+        draws = [stream.random() for stream in rng.slot_streams(4)]
+        draws.extend(stream.random() for stream in rng.worker_streams(4))
+        self.assertEqual(len(set(draws)), len(draws))
+        self.assertNotEqual(RNGManager(1).generator(0).random(),
+                            RNGManager(2).generator(0).random())
+
+    def test_rng_integers(self):
+        for random_state in [np.random.RandomState(0), np.random.default_rng(0)]:
+            values = rng_integers(random_state, 0, 3, size=100)
+            self.assertTrue(((values >= 0) & (values < 3)).all())
+
+
+class TestGeneratorStreams(unittest.TestCase):
+    def test_init_population_with_slot_streams(self):
+        population = Population(IntIndividual(6, [0, 9]), 5)
+        first = population.init_population(random_state=RNGManager(3).slot_streams(5))
+        second = population.init_population(random_state=RNGManager(3).slot_streams(5))
+        self.assertEqual([indv.chromosome.genes.tolist() for indv in first],
+                         [indv.chromosome.genes.tolist() for indv in second])
+        with self.assertRaises(ValueError):
+            population.init_population(random_state=RNGManager(3).slot_streams(4))
+
+    def test_float_operators_accept_generator(self):
+        rng = np.random.default_rng(0)
+        population = Population(FloatIndividual(5, [0, 1]), 8)
+        population.individuals = population.init_population(random_state=rng)
+        for indv in population.individuals:
+            indv._objective = float(np.sum(indv.chromosome.genes))
+        mating = TournamentSelection(2).select(8, population.individuals, random_state=rng)
+        mating = RouletteWheelSelection().select(8, mating, random_state=rng)
+        childs = SBXCrossover(pc=1.0).cross(mating[0], mating[1], random_state=rng)
+        childs = [PolynomialMutation(pm=0.5).mutate(child, random_state=rng) for child in childs]
+        self.assertEqual(len(childs), 2)
+
+    def test_tree_operators_accept_generator(self):
+        rng = np.random.default_rng(0)
+        n = 8
+        edges = [(i, j) for i in range(n) for j in range(i)]
+        population = Population(NetworkRandomKeys(n, edges, use_encode=True), 4)
+        individuals = population.init_population(random_state=rng)
+        childs = KruskalCrossover(pc=1.0).cross(individuals[0], individuals[1], random_state=rng)
+        childs = [TreeMutation(1.0, edges).mutate(child, random_state=rng) for child in childs]
+        self.assertEqual(len(childs[0].decode().edges), n - 1)